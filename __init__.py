@@ -3,13 +3,17 @@ from coh.base import (
     Category,
     Metric,
     MetricsSet,
-    ResultSet
+    ResultSet,
+    ResultTable
 )
+from coh.cache import ResultCache
+from coh.instrument import instrumented
+from coh.conll import read_conll, read_conll_sentences
 
 from coh.metrics import *
 from coh.tools import *
 
-all_metrics = MetricsSet([BasicCounts()])
+all_metrics = MetricsSet([BasicCounts(), Connectives(), LogicOperators()])
 
 __all__ = sorted([m for m in locals().keys()
                   if not m.startswith('_')])
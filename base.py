@@ -15,10 +15,19 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from itertools import chain
+from collections import namedtuple
+from coh import instrument
+from coh.table import TokenTable, SentenceSpans, SentenceStringsView,\
+    SentencesView, WordsView, TaggedSentencesView, TaggedWordsView
 from coh.tools import senter, word_tokenize,\
     pos_tagger
 import codecs
+import functools
+import hashlib
+import mmap
+import multiprocessing
+import os
+import traceback
 
 
 class Text(object):
@@ -27,14 +36,17 @@ class Text(object):
     A text has several (optional) attributes: title, author,
     source, publication data and genre.
     """
-    def __init__(self, filepath, encoding='utf-8', title='', author='',
-                 source='', publication_date='', genre=''):
+    def __init__(self, filepath=None, encoding='utf-8', title='', author='',
+                 source='', publication_date='', genre='', paragraphs=None):
         """Form a text.
 
         Required arguments:
-        filepath -- a path to the file containing the text. The text is
+        filepath -- a path to the file containing the text, or a file-like
+            object opened for reading (in text or binary mode). The text is
             supposed to be formatted as one paragraph per line, with
-            multiple sentences per paragraph. Blank lines are ignored.
+            multiple sentences per paragraph. Blank lines are ignored. The
+            input is read line by line. It is not needed if 'paragraphs'
+            is given.
 
         Keyword arguments:
         encoding -- The encoding of the input file (default "utf-8")
@@ -43,6 +55,12 @@ class Text(object):
         source -- Where the text came from, usually a URL (default "").
         publication_date -- When the text was released (default "").
         genre -- The textual genre that better fits the text (default "").
+        paragraphs -- an iterable of strings, each one a paragraph of the
+            text. If given, it is used instead of 'filepath'. Blank
+            paragraphs are ignored. (default None)
+
+        See also the alternative constructors from_string, from_paragraphs,
+        from_file and from_mmap.
         """
         self.title = title
         self.author = author
@@ -50,66 +68,445 @@ class Text(object):
         self.publication_date = publication_date
         self.genre = genre
 
-        with codecs.open(filepath, mode='r', encoding=encoding)\
-                as input_file:
-            content = input_file.readlines()
+        self.features = FeatureStore()
+
+        if paragraphs is not None:
+            self.paragraphs = _paragraphs_from_lines(paragraphs)
+        elif hasattr(filepath, 'read'):
+            self.paragraphs = _paragraphs_from_lines(
+                _decoded_lines(filepath, encoding))
+        else:
+            with codecs.open(filepath, mode='r', encoding=encoding)\
+                    as input_file:
+                self.paragraphs = _paragraphs_from_lines(input_file)
+
+    @classmethod
+    def from_string(cls, string, **kwargs):
+        """Form a text from a string, formatted as one paragraph per line.
+
+        Required arguments:
+        string -- the content of the text.
+
+        Keyword arguments: the metadata accepted by Text.__init__.
+        """
+        return cls(paragraphs=string.splitlines(), **kwargs)
+
+    @classmethod
+    def from_paragraphs(cls, paragraphs, **kwargs):
+        """Form a text from an iterable of paragraphs.
+
+        Required arguments:
+        paragraphs -- an iterable of strings, each one a paragraph.
+
+        Keyword arguments: the metadata accepted by Text.__init__.
+        """
+        return cls(paragraphs=paragraphs, **kwargs)
+
+    @classmethod
+    def from_file(cls, input_file, encoding='utf-8', **kwargs):
+        """Form a text from a file-like object, read line by line.
+
+        Required arguments:
+        input_file -- a file-like object in text or binary mode, formatted
+            as one paragraph per line.
+
+        Keyword arguments:
+        encoding -- the encoding used to decode binary input
+            (default "utf-8").
+        Also, the metadata accepted by Text.__init__.
+        """
+        return cls(paragraphs=_decoded_lines(input_file, encoding),
+                   **kwargs)
+
+    @classmethod
+    def from_mmap(cls, filepath, encoding='utf-8', **kwargs):
+        """Form a text from a memory-mapped file, formatted as one paragraph
+            per line.
+
+        The file is mapped into memory and decoded one line at a time, so
+        its content is never held twice in memory. Lines are split on
+        b'\\n', so the encoding must be ASCII compatible (e.g., UTF-8 or
+        Latin-1).
+
+        Required arguments:
+        filepath -- a path to the file containing the text.
+
+        Keyword arguments:
+        encoding -- the encoding of the file (default "utf-8").
+        Also, the metadata accepted by Text.__init__.
+        """
+        with open(filepath, mode='rb') as input_file:
+            if os.fstat(input_file.fileno()).st_size == 0:
+                # Empty files cannot be mapped.
+                return cls(paragraphs=[], **kwargs)
+
+            with mmap.mmap(input_file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped_file:
+                return cls(paragraphs=_decoded_lines(
+                    iter(mapped_file.readline, b''), encoding), **kwargs)
+
+    @classmethod
+    def from_tagged_paragraphs(cls, tagged_paragraphs, **kwargs):
+        """Form a text that is already split in sentences, tokenized and
+            tagged (e.g., from an annotated corpus). The sentence splitter,
+            word tokenizer and tagger are never run on it.
 
-            self.paragraphs = [line.strip() for line in content
-                               if not line.isspace()]
+        The content of each paragraph is its words separated by spaces.
+        Empty sentences and paragraphs are ignored.
+
+        Required arguments:
+        tagged_paragraphs -- an iterable of paragraphs, each one an iterable
+            of sentences, each one a list of pairs (word, tag).
+
+        Keyword arguments: the metadata accepted by Text.__init__.
+        """
+        tagged_sentences = []
+        paragraphs = []
+        spans = []
+        for paragraph in tagged_paragraphs:
+            paragraph = [list(sentence) for sentence in paragraph]
+            paragraph = [sentence for sentence in paragraph if sentence]
+            if not paragraph:
+                continue
+
+            paragraph_sentences = [' '.join(word for word, _ in sentence)
+                                   for sentence in paragraph]
+            paragraph_spans = []
+            start = 0
+            for sentence in paragraph_sentences:
+                paragraph_spans.append((start, start + len(sentence)))
+                start += len(sentence) + 1
+
+            paragraphs.append(' '.join(paragraph_sentences))
+            spans.append(paragraph_spans)
+            tagged_sentences.extend(paragraph)
+
+        text = cls(paragraphs=[], **kwargs)
+        text.paragraphs = paragraphs
+        text._sentence_spans = SentenceSpans(paragraphs, spans)
+        text._table = TokenTable(
+            ([word for word, _ in sentence] for sentence in tagged_sentences),
+            text._sentence_spans.paragraph_offsets)
+        text._table.set_tags(tagged_sentences)
+        # The given annotation, and not only the content, determines the
+        # values of the metrics.
+        text._content_hash = _content_hash(paragraphs, tagged_sentences)
+        return text
 
     def __str__(self):
         return '<Text: "%s...">' % (self.paragraphs[0][:70])
 
+    @property
+    def content_hash(self):
+        """Return a hexadecimal digest of the content of the text, that
+            identifies its metric values in a ResultCache.
+        """
+        if not hasattr(self, '_content_hash'):
+            self._content_hash = _content_hash(self.paragraphs)
+
+        return self._content_hash
+
     @property
     def sentences(self):
         """Return a list of strings, each one being a sentence of the text.
+
+        The result is a read-only view of the text's sentence spans, that
+        behaves like a list. Each sentence is sliced from its paragraph
+        when accessed.
+        """
+        return SentenceStringsView(self.sentence_spans)
+
+    @property
+    @instrument.stage('sentences',
+                      lambda text: hasattr(text, '_sentence_spans'))
+    def sentence_spans(self):
+        """Return the positions of the sentences of the text, as a
+            SentenceSpans: a sequence of triples (paragraph, start, end),
+            such that the content of a sentence is
+            self.paragraphs[paragraph][start:end].
         """
-        if not hasattr(self, '_sentences'):
-            _sentences = chain.from_iterable(
-                map(senter.tokenize, self.paragraphs))
-            self._sentences = list(_sentences)
+        if not hasattr(self, '_sentence_spans'):
+            self._sentence_spans = SentenceSpans(
+                self.paragraphs, map(senter.span_tokenize, self.paragraphs))
 
-        return self._sentences
+        return self._sentence_spans
+
+    @property
+    @instrument.stage('words', lambda text: hasattr(text, '_table'))
+    def table(self):
+        """Return the TokenTable that stores the words (and, once the text
+            is tagged, the tags) of the text.
+        """
+        if not hasattr(self, '_table'):
+            spans = self.sentence_spans
+            self._table = TokenTable(map(word_tokenize,
+                                         spans.iter_sentences()),
+                                     spans.paragraph_offsets)
+
+        return self._table
 
     @property
     def words(self):
         """Return a list of lists of strings, where each list of strings
             corresponds to a sentence, and each string in the list is a word.
-        """
-        if not hasattr(self, '_words'):
-            self._words = list(map(word_tokenize, self.sentences))
 
-        return self._words
+        The result is a read-only view of the text's TokenTable, that
+        behaves like a list.
+        """
+        return SentencesView(self.table)
 
     @property
     def all_words(self):
         """Return all words of the text in a single list.
+
+        The result is a read-only view of the text's TokenTable, that
+        behaves like a list.
         """
-        if not hasattr(self, '_all_words'):
-            self._all_words = list(chain.from_iterable(self.words))
+        return WordsView(self.table)
 
-        return self._all_words
+    @instrument.stage('tagged_sentences',
+                      lambda text: hasattr(text, '_table')
+                      and text._table.is_tagged)
+    def _tagged_table(self):
+        table = self.table
+        if not table.is_tagged:
+            table.set_tags(pos_tagger.batch_tag(self.words))
+        return table
 
     @property
     def tagged_sentences(self):
         """Return a list of lists of pairs (string, string), representing
             the sentences with tagged words.
-        """
-        if not hasattr(self, '_tagged_sentences'):
-            self._tagged_sentences = pos_tagger.batch_tag(self.words)
 
-        return self._tagged_sentences
+        The result is a read-only view of the text's TokenTable, that
+        behaves like a list.
+        """
+        return TaggedSentencesView(self._tagged_table())
 
     @property
     def tagged_words(self):
         """Return a list of pair (string, string), representing the tokens
             not separated in sentences.
+
+        The result is a read-only view of the text's TokenTable, that
+        behaves like a list.
+        """
+        return TaggedWordsView(self._tagged_table())
+
+    @property
+    def tag_histogram(self):
+        """Return a Counter mapping each PoS tag to the number of tokens
+            of the text that have it.
+
+        The histogram is built in a single pass over the tag ids of the
+        text's TokenTable, and lets metrics count tokens of any tag class
+        without rescanning the text (see TagSet.count_tags).
+        """
+        if not hasattr(self, '_tag_histogram'):
+            self._tag_histogram = self._tagged_table().tag_histogram()
+
+        return self._tag_histogram
+
+    @property
+    def tagged_word_histogram(self):
+        """Return a Counter mapping each pair (word, tag) to the number of
+            tokens of the text that are that word with that tag. See the
+            tagged_word_histogram function of this module.
+        """
+        return tagged_word_histogram(self)
+
+    def replace_paragraph(self, i, paragraph):
+        """Replace the content of a paragraph.
+
+        Only the new paragraph is split in sentences, tokenized and tagged
+        (if the text had already been); the rest of the text is kept. The
+        values of the metrics are discarded, and calculated again when
+        requested.
+
+        Required arguments:
+        i -- the index of the paragraph.
+        paragraph -- the new content of the paragraph (a non-blank string).
+        """
+        i = self._paragraph_index(i)
+        self._replace_paragraphs(i, i + 1, [paragraph])
+
+    def insert_paragraph(self, i, paragraph):
+        """Insert a paragraph before the i-th paragraph (or at the end, if
+            i is the number of paragraphs). See replace_paragraph.
+        """
+        i = self._paragraph_index(i, allow_end=True)
+        self._replace_paragraphs(i, i, [paragraph])
+
+    def delete_paragraph(self, i):
+        """Remove a paragraph. See replace_paragraph.
         """
-        if not hasattr(self, '_tagged_words'):
-            self._tagged_words = list(
-                chain.from_iterable(self.tagged_sentences))
+        i = self._paragraph_index(i)
+        self._replace_paragraphs(i, i + 1, [])
+
+    def _paragraph_index(self, i, allow_end=False):
+        size = len(self.paragraphs)
+        if i < 0:
+            i += size
+        if not 0 <= i < size + allow_end:
+            raise IndexError('paragraph index out of range')
+        return i
+
+    def _replace_paragraphs(self, start, stop, paragraphs):
+        paragraphs = [paragraph.strip() for paragraph in paragraphs]
+        if not all(paragraphs):
+            raise ValueError('blank paragraph')
+
+        if hasattr(self, '_sentence_spans'):
+            new_spans = [list(senter.span_tokenize(p)) for p in paragraphs]
+
+            if hasattr(self, '_table'):
+                table = self._table
+                words = [[word_tokenize(p[begin:end]) for begin, end in spans]
+                         for p, spans in zip(paragraphs, new_spans)]
+                tagged_sentences = None
+                if table.is_tagged:
+                    tagged_sentences = pos_tagger.batch_tag(
+                        [sentence for paragraph in words
+                         for sentence in paragraph])
+
+                histogram = getattr(self, '_tag_histogram', None)
+                word_histogram = None
+                if tagged_word_histogram.key in self.features:
+                    word_histogram = self.features[tagged_word_histogram.key]
+                old_span = table.paragraph_span(start, stop)
+                if histogram is not None:
+                    histogram -= table.tag_histogram(*old_span)
+                if word_histogram is not None:
+                    word_histogram -= table.tagged_word_histogram(*old_span)
+
+                table.replace_paragraphs(start, stop, words, tagged_sentences)
+
+                new_span = table.paragraph_span(start, start + len(words))
+                if histogram is not None:
+                    histogram += table.tag_histogram(*new_span)
+                if word_histogram is not None:
+                    word_histogram += table.tagged_word_histogram(*new_span)
+
+            self._sentence_spans.replace_paragraphs(start, stop, new_spans)
+
+        self.paragraphs[start:stop] = paragraphs
+        word_histogram = None
+        if tagged_word_histogram.key in self.features:
+            word_histogram = self.features[tagged_word_histogram.key]
+        self.features.clear()
+        if word_histogram is not None:
+            # It was updated above, and is still valid.
+            self.features.put(tagged_word_histogram.key, word_histogram)
+        if hasattr(self, '_content_hash'):
+            del self._content_hash
+
+
+def _content_hash(paragraphs, tagged_sentences=None):
+    digest = hashlib.sha256()
+    for paragraph in paragraphs:
+        digest.update(paragraph.encode('utf-8'))
+        digest.update(b'\n')
+    if tagged_sentences is not None:
+        for sentence in tagged_sentences:
+            digest.update(b'\n')
+            for word, tag in sentence:
+                digest.update(('%s\t%s\n' % (word, tag)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _decoded_lines(lines, encoding):
+    """Iterate over lines, decoding the ones that are bytes.
+    """
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode(encoding)
+        yield line
+
+
+def _paragraphs_from_lines(lines):
+    """Return the non-blank lines, stripped, as a list of paragraphs.
+    """
+    return [line.strip() for line in lines if line and not line.isspace()]
+
+
+class FeatureStore(object):
+    """A memo of the quantities derived from a text (metric values,
+        intermediate counts, etc.), so that each one is calculated at most
+        once, no matter how many metrics or categories ask for it.
+
+    Metrics that are different views of the same work (e.g., a search of
+    the distinct words of the text in a lexicon, or a scan of its tagged
+    words that yields several counts) share it through this store: the
+    work is done by a function decorated with text_feature, and each
+    metric reads the part of its result it needs.
+    """
+    def __init__(self):
+        self._store = {}
+
+    def get(self, key, compute):
+        """Return the value stored under a key, calculating it first if
+            necessary.
+
+        Required arguments:
+        key -- a hashable that identifies the quantity (e.g., Metric.key).
+        compute -- a function with no arguments that calculates the value.
+            It is only called if the key is not in the store yet.
+
+        Returns: the value associated with the key.
+        """
+        try:
+            return self._store[key]
+        except KeyError:
+            value = self._store[key] = compute()
+            return value
+
+    def put(self, key, value):
+        """Store a value that was calculated elsewhere (e.g., loaded from
+            a ResultCache).
+        """
+        self._store[key] = value
+
+    def clear(self):
+        """Discard all stored values.
+        """
+        self._store.clear()
+
+    def __getitem__(self, key):
+        return self._store[key]
+
+    def __contains__(self, key):
+        return key in self._store
+
+    def __len__(self):
+        return len(self._store)
+
 
-        return self._tagged_words
+def text_feature(function):
+    """Decorate a function of a text, so that its result is kept in the
+        text's feature store, under the key (module, name) of the function.
+        The key is also the attribute key of the decorated function.
+    """
+    key = (function.__module__, function.__name__)
+
+    @functools.wraps(function)
+    def wrapper(t):
+        return t.features.get(key, lambda: function(t))
+    wrapper.key = key
+    return wrapper
+
+
+@text_feature
+def tagged_word_histogram(t):
+    """Return a Counter mapping each pair (word, tag) to the number of
+        tokens of a text that are that word with that tag.
+
+    Like Text.tag_histogram, it is built in a single pass over the text's
+    TokenTable. Metrics that classify or look up tokens (by their form and
+    tag) do it once for each distinct pair, and weight the result by its
+    count, so their cost depends on the vocabulary of the text, and not on
+    its length. Paragraph edits update it, instead of discarding it.
+    """
+    return t._tagged_table().tagged_word_histogram()
 
 
 class Category(object):
@@ -168,16 +565,35 @@ class Category(object):
         """
         #metrics_values = ResultSet([m.value_for_text(text).items()[0]
         #                            for m in self.metrics])
-        metrics_values = ResultSet([(m, m.value_for_text(text))
-                                    for m in self.metrics])
+        stats = instrument.active()
+        if stats is None:
+            metrics_values = ResultSet([(m, m.cached_value_for_text(text))
+                                        for m in self.metrics])
+        else:
+            metrics_values = ResultSet([
+                (m, stats.call('%s.%s' % (self.table_name, m.column_name),
+                               m.key in text.features,
+                               m.cached_value_for_text, text))
+                for m in self.metrics])
         #return ResultSet([(self, metrics_values)])
         return metrics_values
 
+    def values_for_corpus(self, texts, workers=None, chunksize=1,
+                          ordered=True):
+        """Calculate the metrics of this category in several texts, using
+            a pool of processes. See MetricsSet.values_for_corpus.
+        """
+        return _values_for_corpus(self, texts, workers, chunksize, ordered)
+
     def __str__(self):
         return '<Category: %s: %s>' % \
             (self.name, str([m.name for m in self.metrics]))
 
     def __getattr__(self, attr):
+        # Special attributes (looked up, e.g., when unpickling) and
+        # self.metrics itself are never metrics.
+        if attr.startswith('__') or attr == 'metrics':
+            raise AttributeError(attr)
         # A metric's column name can be used as an attribute to access its
         # object in self.metrics.
         for m in self.metrics:
@@ -198,6 +614,10 @@ class Metric(object):
     """A metric is a textual characteristic.
     """
 
+    # Increase it whenever a change in the metric changes its values, so
+    # that the values stored in a ResultCache are calculated again.
+    version = 1
+
     def __init__(self, name="", column_name="", desc=""):
         """Form a metric.
 
@@ -235,13 +655,47 @@ class Metric(object):
         #TODO: replace by an exception raising.
         return randrange(1, 100)
 
+    @property
+    def key(self):
+        """A hashable that identifies the value calculated by this metric
+            in a text's feature store.
+
+        By default, metrics of the same class share the same key. Subclasses
+        whose value depends on constructor parameters must override this
+        property to include those parameters.
+        """
+        return (self.__class__.__module__, self.__class__.__name__)
+
+    def cached_value_for_text(self, text):
+        """Return the value of the metric in the text, calculating it only
+            if it is not yet in the text's feature store.
+
+        Required arguments:
+        text -- The text to be analyzed.
+
+        Returns: the value of the metric, as returned by value_for_text.
+        """
+        return text.features.get(self.key,
+                                 lambda: self.value_for_text(text))
+
     def __str__(self):
         return '<Metric: %s> ' % (self.name)
 
 
 class MetricsSet(object):
-    def __init__(self, categories):
+    def __init__(self, categories, cache=None):
+        """Form a set of metrics.
+
+        Required arguments:
+        categories -- a list of Category objects.
+
+        Keyword arguments:
+        cache -- a ResultCache. If given, values_for_text only calculates
+            the metrics whose values are not stored in it yet, and stores
+            them. (default None)
+        """
         self.categories = categories
+        self.cache = cache
 
     def _set_categories_from_module(self, module):
         """Set self.categories as the list of Category subclasses
@@ -259,32 +713,150 @@ class MetricsSet(object):
                            and issubclass(obj, Category)]
 
     def values_for_text(self, t):
-        return ResultSet([(c, c.values_for_text(t)) for c in self.categories])
+        if self.cache is None:
+            return ResultSet([(c, c.values_for_text(t))
+                              for c in self.categories])
+
+        metrics = [m for c in self.categories for m in c.metrics]
+        self.cache.load(t, metrics)
+        missing = [m for m in metrics if m.key not in t.features]
+        values = ResultSet([(c, c.values_for_text(t))
+                            for c in self.categories])
+        if missing:
+            self.cache.store(t, missing)
+        return values
+
+    def values_for_corpus(self, texts, workers=None, chunksize=1,
+                          ordered=True):
+        """Calculate the metrics of several texts, using a pool of
+            processes.
+
+        Each worker process receives a copy of this object once, when it
+        starts, so the models are loaded once per worker and not once per
+        text. An exception raised while analyzing a text is reported in its
+        result, and does not interrupt the analysis of the other texts.
+
+        Required arguments:
+        texts -- an iterable of Text objects.
+
+        Keyword arguments:
+        workers -- the number of worker processes. If None, the number of
+            CPUs is used; if 1, the texts are analyzed in this process.
+            (default None)
+        chunksize -- the number of texts sent to a worker at a time. Larger
+            chunks reduce the communication overhead for short texts.
+            (default 1)
+        ordered -- if true, results are yielded in the order of the input
+            texts; otherwise, they are yielded as soon as they are ready.
+            (default True)
+
+        Returns: an iterator of CorpusResult tuples (index, values, error),
+            where index is the position of the text in the input, values is
+            the ResultSet returned by values_for_text (None if the analysis
+            failed) and error is a string describing the failure (None if
+            the analysis succeeded).
+        """
+        return _values_for_corpus(self, texts, workers, chunksize, ordered)
+
+
+CorpusResult = namedtuple('CorpusResult', ['index', 'values', 'error'])
+
+# The object (MetricsSet or Category) used by a worker process of
+# values_for_corpus. It is set once per process by _init_corpus_worker.
+_corpus_analyzer = None
+
+
+def _init_corpus_worker(analyzer):
+    global _corpus_analyzer
+    _corpus_analyzer = analyzer
+
+
+def _values_for_indexed_text(item):
+    index, text = item
+    try:
+        return CorpusResult(index, _corpus_analyzer.values_for_text(text),
+                            None)
+    except Exception:
+        return CorpusResult(index, None, traceback.format_exc())
+
+
+def _values_for_corpus(analyzer, texts, workers, chunksize, ordered):
+    if workers == 1:
+        _init_corpus_worker(analyzer)
+        for item in enumerate(texts):
+            yield _values_for_indexed_text(item)
+        return
+
+    with multiprocessing.Pool(workers, initializer=_init_corpus_worker,
+                              initargs=(analyzer,)) as pool:
+        if ordered:
+            results = pool.imap(_values_for_indexed_text, enumerate(texts),
+                                chunksize)
+        else:
+            results = pool.imap_unordered(_values_for_indexed_text,
+                                          enumerate(texts), chunksize)
+        for result in results:
+            yield result
 
 import collections
+import csv
+import json
+from array import array
+
+
+NAN = float('nan')
 
 
 class ResultSet():
     """A dictionary-like structure that represents the values of
         a set of metrics extracted from a text.
+
+    Values can be accessed by key (a Category or a Metric), by position,
+    or by the table name of a category or the column name of a metric,
+    used as an attribute. The last two are resolved through indices that
+    are kept up to date as items are added, so all accesses take constant
+    time.
     """
     def __init__(self, *args, **kwargs):
-        #TODO: To improve performance, replace OrderedDict by namedtuple.
         self.store = collections.OrderedDict(*args, **kwargs)
+        self._reindex()
+
+    def _reindex(self):
+        self._keys = None
+        self._names = {}
+        for key in self.store:
+            self._index_name(key)
+
+    def _index_name(self, key):
+        if isinstance(key, Category):
+            name = key.table_name
+        elif isinstance(key, Metric):
+            name = key.column_name
+        else:
+            return
+        # As in a linear search, the first key with a given name wins.
+        self._names.setdefault(name, key)
 
     def items(self):
         return self.store.items()
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            key = list(self.store.items())[key][0]
+            if self._keys is None:
+                self._keys = list(self.store)
+            key = self._keys[key]
         return self.store[self.__keytransform__(key)]
 
     def __setitem__(self, key, value):
-        self.store[self.__keytransform__(key)] = value
+        key = self.__keytransform__(key)
+        if key not in self.store:
+            self._keys = None
+            self._index_name(key)
+        self.store[key] = value
 
     def __delitem__(self, key):
         del self.store[self.__keytransform__(key)]
+        self._reindex()
 
     def __iter__(self):
         return iter(self.store)
@@ -296,16 +868,156 @@ class ResultSet():
         return key
 
     def __getattr__(self, attr):
-        for key in self.store.keys():
-            if (isinstance(key, Category) and key.table_name == attr) or \
-               (isinstance(key, Metric) and key.column_name == attr):
-                return self.store[key]
+        if attr.startswith('_') or attr == 'store':
+            raise AttributeError(attr)
+        key = self._names.get(attr)
+        if key is not None:
+            return self.store[key]
+
+    def flatten(self):
+        """Return the values of the metrics as a list of pairs (name,
+            value).
+
+        The name of a metric is its column name, prefixed by the table name
+        of its category and a dot when the result set is organized by
+        category (as the ones returned by MetricsSet.values_for_text).
+        """
+        pairs = []
+        for key, value in self.store.items():
+            if isinstance(key, Category):
+                pairs.extend(('%s.%s' % (key.table_name, name), v)
+                             for name, v in value.flatten())
+            elif isinstance(key, Metric):
+                pairs.append((key.column_name, value))
+        return pairs
 
     def __str__(self):
         string = ''
         for key, value in self.store.items():
             if isinstance(key, Category):
-                string = string + '%s:\n%s' % (key.name, value)
+                string = string + '%s:\n%s\n' % (key.name, value)
             elif isinstance(key, Metric):
                 string = string + '    %s: %s\n' % (key.name, value)
         return string.rstrip()
+
+
+class ResultTable(object):
+    """The values of a set of metrics extracted from several texts, stored
+        as columns.
+
+    Each metric is a column, and each text is a row. Columns are arrays of
+    floats, and a missing value (e.g., of a text whose analysis failed) is
+    NaN. Columns can be exported at once to NumPy, CSV or JSON lines.
+    """
+    def __init__(self, names=()):
+        """Form an empty table.
+
+        Keyword arguments:
+        names -- the names of the columns (see ResultSet.flatten). Columns
+            are also added as the values of new metrics are appended, but
+            the ones given here exist even if no text is added, or the
+            analysis of every text fails. (default ())
+        """
+        self.labels = []
+        self.columns = collections.OrderedDict(
+            (name, array('d')) for name in names)
+
+    @classmethod
+    def from_corpus_results(cls, results, names=()):
+        """Form a table from the results of values_for_corpus, using the
+            index of each text as its label.
+
+        Required arguments:
+        results -- an iterable of CorpusResult tuples.
+
+        Keyword arguments:
+        names -- see ResultTable.__init__ (default ()).
+        """
+        table = cls(names)
+        for result in results:
+            table.append(result.values, result.index)
+        return table
+
+    def append(self, values, label=None):
+        """Add the results of a text as a new row.
+
+        Required arguments:
+        values -- a ResultSet (as returned by values_for_text). If None,
+            a row of missing values is added.
+
+        Keyword arguments:
+        label -- an identifier of the text (e.g., its title or its index
+            in the corpus). (default None)
+        """
+        nrows = len(self.labels)
+        pairs = values.flatten() if values is not None else []
+        for name, value in pairs:
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = array('d', [NAN]) * nrows
+            column.append(value)
+
+        self.labels.append(label)
+        for column in self.columns.values():
+            if len(column) == nrows:
+                column.append(NAN)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def column(self, name):
+        """Return the values of a metric, as an array of floats.
+
+        Required arguments:
+        name -- the name of the column (see ResultSet.flatten).
+        """
+        return self.columns[name]
+
+    def row(self, i):
+        """Return the values of a text, as an ordered dictionary mapping
+            column names to values.
+        """
+        return collections.OrderedDict(
+            (name, column[i]) for name, column in self.columns.items())
+
+    def to_numpy(self):
+        """Return the table as a NumPy array, with one row per text and one
+            column per metric (in the order of self.columns). NumPy must be
+            installed.
+        """
+        import numpy
+        if not self.columns:
+            return numpy.empty((len(self.labels), 0))
+        return numpy.column_stack([numpy.frombuffer(column, dtype='d')
+                                   for column in self.columns.values()])
+
+    def to_csv(self, output_file, label_header='text'):
+        """Write the table in CSV format, with a header line.
+
+        Required arguments:
+        output_file -- a file-like object opened for writing in text mode.
+
+        Keyword arguments:
+        label_header -- the header of the first column, that contains the
+            labels of the texts (default "text").
+        """
+        writer = csv.writer(output_file)
+        writer.writerow([label_header] + list(self.columns))
+        writer.writerows(zip(self.labels, *self.columns.values()))
+
+    def to_jsonl(self, output_file, label_key='text'):
+        """Write the table in JSON lines format: one JSON object per text.
+            Missing values are written as null.
+
+        Required arguments:
+        output_file -- a file-like object opened for writing in text mode.
+
+        Keyword arguments:
+        label_key -- the key of the text's label in each object
+            (default "text").
+        """
+        names = [label_key] + list(self.columns)
+        for row in zip(self.labels, *self.columns.values()):
+            # NaN is not valid JSON.
+            row = [None if value != value else value for value in row]
+            output_file.write(json.dumps(dict(zip(names, row))) + '\n')
@@ -0,0 +1,143 @@
+#-*- coding: utf-8 -*-
+# cache.py - Persistent storage of the metric values of texts.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from coh.tools.registry import registry
+import json
+import sqlite3
+
+
+class ResultCache(object):
+    """Stores the metric values of texts in a SQLite database, so that
+    texts that have not changed are not analyzed again.
+
+    Values are addressed by the content of the text (Text.content_hash),
+    the models registered when they were calculated (see
+    ModelRegistry.fingerprint), the identity of the metric (Metric.key) and
+    its version (Metric.version). When the version of a metric is
+    increased, its stored values are ignored, and replaced as the texts are
+    analyzed again; the values of the other metrics are still used. When a
+    model is replaced (e.g., the tagger, with registry.register), or the
+    file it is read from is rebuilt, the values of all metrics are
+    calculated again, since the registry does not know which metrics use
+    which models.
+
+    A MetricsSet uses a cache when it is given one:
+
+        all_metrics.cache = ResultCache('results.db')
+        all_metrics.values_for_text(text)
+    """
+    def __init__(self, path=':memory:'):
+        """Form a cache.
+
+        Keyword arguments:
+        path -- the path to the database file. It is created if it does not
+            exist. The default keeps the values in memory, only while the
+            cache is in use. (default ":memory:")
+        """
+        self.path = path
+        self._connection = None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, timeout=60)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS metric_values ('
+                'text_hash TEXT NOT NULL, '
+                'metric TEXT NOT NULL, '
+                'version INTEGER NOT NULL, '
+                'value TEXT NOT NULL, '
+                'PRIMARY KEY (text_hash, metric))')
+            self._connection.commit()
+        return self._connection
+
+    @staticmethod
+    def _text_key(text):
+        return '%s:%s' % (text.content_hash, registry.fingerprint())
+
+    @staticmethod
+    def _metric_name(metric):
+        return '.'.join(map(str, metric.key))
+
+    def load(self, text, metrics):
+        """Put the stored values of some metrics in the feature store of a
+            text, so they are not calculated again.
+
+        Required arguments:
+        text -- a Text.
+        metrics -- an iterable of Metric objects.
+
+        Returns: the number of values loaded.
+        """
+        wanted = dict((self._metric_name(m), m) for m in metrics
+                      if m.key not in text.features)
+        if not wanted:
+            return 0
+
+        rows = self.connection.execute(
+            'SELECT metric, version, value FROM metric_values '
+            'WHERE text_hash = ?', (self._text_key(text),))
+
+        loaded = 0
+        for name, version, value in rows:
+            metric = wanted.get(name)
+            if metric is not None and version == metric.version:
+                text.features.put(metric.key, json.loads(value))
+                loaded += 1
+        return loaded
+
+    def store(self, text, metrics):
+        """Store the values of some metrics that are in the feature store of
+            a text.
+
+        Required arguments:
+        text -- a Text.
+        metrics -- an iterable of Metric objects. Metrics that were not
+            calculated for the text are ignored.
+        """
+        text_hash = self._text_key(text)
+        rows = [(text_hash, self._metric_name(m), m.version,
+                 json.dumps(text.features[m.key]))
+                for m in metrics if m.key in text.features]
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO metric_values '
+                '(text_hash, metric, version, value) VALUES (?, ?, ?, ?)',
+                rows)
+
+    def clear(self):
+        """Discard all stored values.
+        """
+        with self.connection:
+            self.connection.execute('DELETE FROM metric_values')
+
+    def close(self):
+        """Close the database. It is opened again if the cache is used.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __len__(self):
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM metric_values').fetchone()[0]
+
+    def __getstate__(self):
+        # Connections cannot be pickled; each process of values_for_corpus
+        # opens its own.
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        return state
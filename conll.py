@@ -0,0 +1,138 @@
+#-*- coding: utf-8 -*-
+# conll.py - Reading annotated texts from corpora in CoNLL format.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Read texts that are already tokenized and tagged from CoNLL files
+(e.g., corpora/macmorpho/PBrConst_test.conll), so that their metrics can
+be calculated without running the sentence splitter, word tokenizer and
+tagger again.
+
+The files have one token per line, with tab-separated fields (number,
+word, lemma, PoS tag, ...), and a blank line after each sentence.
+"""
+
+from coh.base import Text
+
+
+# Maps the PoS tags of the Floresta Sintá(c)tica corpora, used in the
+# CoNLL files, to the tags of MacMorphoTagSet. Tags that are not in this
+# dictionary are kept unchanged.
+floresta_to_macmorpho = {
+    'N': 'N',
+    'PROP': 'NPROP',
+    'N-ADJ': 'N',
+    'ADJ': 'ADJ',
+    'ADV': 'ADV',
+    'ART': 'ART',
+    'NUM': 'NUM',
+    'PRP': 'PREP',
+    'V-FIN': 'V',
+    'V-INF': 'V',
+    'V-GER': 'V',
+    'V-PCP': 'PCP',
+    'PRON-PERS': 'PROPESS',
+    'PRON-DET': 'PROADJ',
+    'PRON-INDP': 'PROSUB',
+    'CONJ-C': 'KC',
+    'CONJ-S': 'KS',
+    'IN': 'IN',
+    'PU': 'PU',
+}
+
+
+def read_conll_sentences(filepath, encoding='utf-8',
+                         tag_map=floresta_to_macmorpho):
+    """Iterate over the tagged sentences of a CoNLL file. The file is read
+        line by line.
+
+    Required arguments:
+    filepath -- a path to the CoNLL file.
+
+    Keyword arguments:
+    encoding -- the encoding of the file (default "utf-8").
+    tag_map -- a dictionary used to translate the tags of the file. Tags
+        that are not in it are kept unchanged. If None, no tag is
+        translated. (default floresta_to_macmorpho)
+
+    Returns: an iterator of lists of pairs (word, tag).
+    """
+    if tag_map is None:
+        tag_map = {}
+
+    sentence = []
+    with open(filepath, encoding=encoding) as input_file:
+        for line in input_file:
+            fields = line.split('\t')
+            if len(fields) < 4:
+                # A blank line ends the sentence.
+                if sentence:
+                    yield sentence
+                    sentence = []
+                continue
+
+            tag = fields[3].strip()
+            sentence.append((fields[1].strip(), tag_map.get(tag, tag)))
+
+    if sentence:
+        yield sentence
+
+
+def read_conll(filepath, encoding='utf-8', sentences_per_text=None,
+               sentences_per_paragraph=1, tag_map=floresta_to_macmorpho,
+               **kwargs):
+    """Iterate over the texts of a CoNLL file, already split in sentences,
+        tokenized and tagged.
+
+    CoNLL files do not mark the boundaries of texts and paragraphs, so the
+    sentences are grouped in texts and paragraphs of fixed sizes. The file
+    is read line by line, and each text is yielded as soon as its last
+    sentence is read.
+
+    Required arguments:
+    filepath -- a path to the CoNLL file.
+
+    Keyword arguments:
+    encoding -- the encoding of the file (default "utf-8").
+    sentences_per_text -- the number of sentences of each text (the last
+        text may have fewer). If None, the whole file is a single text.
+        (default None)
+    sentences_per_paragraph -- the number of sentences of each paragraph
+        (default 1).
+    tag_map -- see read_conll_sentences (default floresta_to_macmorpho).
+    Also, the metadata accepted by Text.__init__, set on every text.
+
+    Returns: an iterator of Text objects.
+    """
+    paragraphs = []
+    paragraph = []
+    nsentences = 0
+    for sentence in read_conll_sentences(filepath, encoding, tag_map):
+        paragraph.append(sentence)
+        nsentences += 1
+        if len(paragraph) == sentences_per_paragraph:
+            paragraphs.append(paragraph)
+            paragraph = []
+        if nsentences == sentences_per_text:
+            if paragraph:
+                paragraphs.append(paragraph)
+            yield Text.from_tagged_paragraphs(paragraphs, **kwargs)
+            paragraphs = []
+            paragraph = []
+            nsentences = 0
+
+    if paragraph:
+        paragraphs.append(paragraph)
+    if paragraphs:
+        yield Text.from_tagged_paragraphs(paragraphs, **kwargs)
@@ -0,0 +1,149 @@
+#-*- coding: utf-8 -*-
+# instrument.py - Optional timing of the stages of text analysis.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Optional instrumentation of the analysis of texts.
+
+When enabled (see instrumented), the lazy stages of Text (sentences,
+words, tagged_sentences) and each metric calculated by
+Category.values_for_text record their number of calls, cumulative time
+and number of cache hits. When disabled, which is the default, the only
+cost is checking a global variable.
+
+    with instrumented('stats.json') as stats:
+        all_metrics.values_for_text(text)
+    print(stats)
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+import json
+
+
+class Stats(object):
+    """The statistics collected for each stage or metric: number of calls,
+    cumulative time (in seconds) and number of cache hits.
+
+    Times are inclusive: the time of a stage includes the time of the
+    stages it triggers (e.g., computing words also splits sentences, if
+    that was not done yet).
+    """
+    def __init__(self):
+        self.calls = {}
+        self.time = {}
+        self.hits = {}
+
+    def record(self, name, elapsed, hit=False):
+        """Record a call.
+
+        Required arguments:
+        name -- the name of the stage or metric.
+        elapsed -- the duration of the call, in seconds.
+
+        Keyword arguments:
+        hit -- true if the value was already cached (default False).
+        """
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.time[name] = self.time.get(name, 0.0) + elapsed
+        self.hits[name] = self.hits.get(name, 0) + (1 if hit else 0)
+
+    def call(self, name, hit, func, *args):
+        """Call a function, record its duration and return its result.
+
+        Required arguments:
+        name -- the name of the stage or metric.
+        hit -- true if the value is already cached.
+        func -- the function to be called with the remaining arguments.
+        """
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.record(name, perf_counter() - start, hit)
+
+    def as_dict(self):
+        """Return the statistics as a dictionary mapping each name to a
+            dictionary with the keys 'calls', 'time' and 'hits'.
+        """
+        return dict((name, {'calls': self.calls[name],
+                            'time': self.time[name],
+                            'hits': self.hits[name]})
+                    for name in self.calls)
+
+    def dump(self, path):
+        """Write the statistics to a file, in JSON format.
+        """
+        with open(path, 'w') as output_file:
+            json.dump(self.as_dict(), output_file, indent=2, sort_keys=True)
+
+    def __str__(self):
+        lines = ['%-50s %8s %8s %12s' % ('name', 'calls', 'hits', 'time (s)')]
+        for name in sorted(self.time, key=self.time.get, reverse=True):
+            lines.append('%-50s %8d %8d %12.6f' % (
+                name, self.calls[name], self.hits[name], self.time[name]))
+        return '\n'.join(lines)
+
+
+# The Stats being collected, or None if instrumentation is disabled.
+_active = None
+
+
+def active():
+    """Return the Stats being collected, or None if instrumentation is
+        disabled.
+    """
+    return _active
+
+
+@contextmanager
+def instrumented(path=None):
+    """Enable instrumentation inside a with block.
+
+    Keyword arguments:
+    path -- if given, the statistics are written to this file (as JSON)
+        at the end of the block. (default None)
+
+    Returns: a context manager whose value is the Stats being collected.
+    """
+    global _active
+    previous = _active
+    stats = _active = Stats()
+    try:
+        yield stats
+    finally:
+        _active = previous
+        if path is not None:
+            stats.dump(path)
+
+
+def stage(name, is_cached):
+    """Decorate a method of Text that computes a stage, so that its calls
+        are recorded when instrumentation is enabled.
+
+    Required arguments:
+    name -- the name of the stage.
+    is_cached -- a function that takes the text and returns true if the
+        stage has already been computed.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self):
+            stats = _active
+            if stats is None:
+                return method(self)
+            return stats.call(name, is_cached(self), method, self)
+        return wrapper
+    return decorator
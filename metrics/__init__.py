@@ -1 +1,6 @@
 from coh.metrics.basic_counts import *
+from coh.metrics.freq import *
+from coh.metrics.hypernyms import *
+from coh.metrics.ambiguity import *
+from coh.metrics.connectives import *
+from coh.metrics.logic_ops import *
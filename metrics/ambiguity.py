@@ -0,0 +1,117 @@
+from coh import base
+from coh.tools import pos_tagger, sense_index, index_key
+from collections import Counter
+
+
+# The classes of content words, with their part of speech in the sense
+# index.
+_CLASSES = (('noun_tags', 'n'),
+            ('verb_tags', 'v'),
+            ('adjective_tags', 'a'),
+            ('adverb_tags', 'r'))
+
+
+@base.text_feature
+def _sense_counts(t):
+    """Return two dictionaries that map "n", "v", "a" and "r" to,
+        respectively, the total number of senses of the nouns, verbs,
+        adjectives and adverbs of a text, and the number of those words.
+        Words that are not in the wordnet are ignored.
+    """
+    tagset = pos_tagger.tagset
+    classes = [(tagset.class_mask(name), pos) for name, pos in _CLASSES]
+
+    counts = Counter()
+    for (word, tag), count in base.tagged_word_histogram(t).items():
+        mask = tagset.tag_mask(tag)
+        for bit, pos in classes:
+            if mask & bit:
+                counts[index_key(word, pos)] += count
+                break
+
+    senses = sense_index.lookup(counts)
+
+    totals = dict((pos, 0.0) for _, pos in _CLASSES)
+    found = dict((pos, 0) for _, pos in _CLASSES)
+    for key, count in counts.items():
+        if senses[key] is not None:
+            pos = key[-1]
+            totals[pos] += senses[key] * count
+            found[pos] += count
+
+    return totals, found
+
+
+def _mean_senses(t, parts_of_speech):
+    totals, found = _sense_counts(t)
+    words = sum(found[pos] for pos in parts_of_speech)
+    if not words:
+        return 0.0
+    return sum(totals[pos] for pos in parts_of_speech) / words
+
+
+class ContentWordAmbiguity(base.Metric):
+    """
+    """
+    def __init__(self, name='Mean number of senses of content words',
+                 column_name='ambiguity_content_words'):
+        super(ContentWordAmbiguity, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _mean_senses(t, ('n', 'v', 'a', 'r'))
+
+
+class NounAmbiguity(base.Metric):
+    """
+    """
+    def __init__(self, name='Mean number of senses of nouns',
+                 column_name='ambiguity_nouns'):
+        super(NounAmbiguity, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _mean_senses(t, ('n',))
+
+
+class VerbAmbiguity(base.Metric):
+    """
+    """
+    def __init__(self, name='Mean number of senses of verbs',
+                 column_name='ambiguity_verbs'):
+        super(VerbAmbiguity, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _mean_senses(t, ('v',))
+
+
+class AdjectiveAmbiguity(base.Metric):
+    """
+    """
+    def __init__(self, name='Mean number of senses of adjectives',
+                 column_name='ambiguity_adjectives'):
+        super(AdjectiveAmbiguity, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _mean_senses(t, ('a',))
+
+
+class AdverbAmbiguity(base.Metric):
+    """
+    """
+    def __init__(self, name='Mean number of senses of adverbs',
+                 column_name='ambiguity_adverbs'):
+        super(AdverbAmbiguity, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _mean_senses(t, ('r',))
+
+
+class Ambiguity(base.Category):
+    """Ambiguity (polysemy) of the content words of a text: the number of
+    senses each word has in a wordnet. The counts are read from
+    models/lexicons/senses.lex, built offline by
+    coh.tools.wordnet.build_sense_index.
+    """
+    def __init__(self, name='Ambiguity', table_name='ambiguity'):
+        super(Ambiguity, self).__init__(name, table_name)
+        self._set_metrics_from_module(__name__)
+        self.metrics.sort(key=lambda m: m.name)
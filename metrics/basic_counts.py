@@ -1,17 +1,19 @@
 from coh import base
 from coh.utils import ilen
 from coh.tools import syllable_separator, pos_tagger
-from itertools import chain, filterfalse
+from itertools import chain
 
 
 class Flesch(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Flesch index', column_name='flesch'):
         super(Flesch, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        mean_words_per_sentence = WordsPerSentence().value_for_text(t)
+        mean_words_per_sentence = WordsPerSentence().cached_value_for_text(t)
 
         syllables = chain.from_iterable(
             map(syllable_separator.separate, t.all_words))
@@ -26,12 +28,16 @@ class Flesch(base.Metric):
 class Words(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Number of Words', column_name='words'):
         super(Words, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        return ilen(filterfalse(pos_tagger.tagset.is_punctuation,
-                                t.tagged_words))
+        tagset = pos_tagger.tagset
+        histogram = t.tag_histogram
+        return sum(histogram.values())\
+            - tagset.count_tags(histogram, tagset.punctuation_tags)
 
 
 class Sentences(base.Metric):
@@ -57,12 +63,15 @@ class Paragraphs(base.Metric):
 class WordsPerSentence(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Mean words per sentence',
                  column_name='words_per_sentence'):
         super(WordsPerSentence, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        return Words().value_for_text(t) / Sentences().value_for_text(t)
+        return Words().cached_value_for_text(t) /\
+            Sentences().cached_value_for_text(t)
 
 
 class SentencesPerParagraph(base.Metric):
@@ -73,12 +82,15 @@ class SentencesPerParagraph(base.Metric):
         super(SentencesPerParagraph, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        return Sentences().value_for_text(t) / Paragraphs().value_for_text(t)
+        return Sentences().cached_value_for_text(t) /\
+            Paragraphs().cached_value_for_text(t)
 
 
 class SyllablesPerContentWord(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Mean syllables per content word',
                  column_name='syllables_per_content_word'):
         super(SyllablesPerContentWord, self).__init__(name, column_name)
@@ -102,87 +114,108 @@ class SyllablesPerContentWord(base.Metric):
 class VerbIncidence(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Verb incidence',
                  column_name='verbs'):
         super(VerbIncidence, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        verbs = filter(pos_tagger.tagset.is_verb, t.tagged_words)
-        return ilen(verbs) / ilen(t.all_words)
+        tagset = pos_tagger.tagset
+        verbs = tagset.count_tags(t.tag_histogram, tagset.verb_tags)
+        return verbs / ilen(t.all_words)
 
 
 class NounIncidence(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Noun incidence',
                  column_name='nouns'):
         super(NounIncidence, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        nouns = filter(pos_tagger.tagset.is_noun, t.tagged_words)
-        return ilen(nouns) / ilen(t.all_words)
+        tagset = pos_tagger.tagset
+        nouns = tagset.count_tags(t.tag_histogram, tagset.noun_tags)
+        return nouns / ilen(t.all_words)
 
 
 class AdjectiveIncidence(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Adjective incidence',
                  column_name='adjectives'):
         super(AdjectiveIncidence, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        adjectives = filter(pos_tagger.tagset.is_adjective, t.tagged_words)
-        return ilen(adjectives) / ilen(t.all_words)
+        tagset = pos_tagger.tagset
+        adjectives = tagset.count_tags(t.tag_histogram, tagset.adjective_tags)
+        return adjectives / ilen(t.all_words)
 
 
 class AdverbIncidence(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Adverb incidence',
                  column_name='adverbs'):
         super(AdverbIncidence, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        adverbs = filter(pos_tagger.tagset.is_adverb, t.tagged_words)
-        return ilen(adverbs) / ilen(t.all_words)
+        tagset = pos_tagger.tagset
+        adverbs = tagset.count_tags(t.tag_histogram, tagset.adverb_tags)
+        return adverbs / ilen(t.all_words)
 
 
 class PronounIncidence(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Pronoun incidence',
                  column_name='pronouns'):
         super(PronounIncidence, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        pronouns = filter(pos_tagger.tagset.is_pronoun, t.tagged_words)
-        return ilen(pronouns) / ilen(t.all_words)
+        tagset = pos_tagger.tagset
+        pronouns = tagset.count_tags(t.tag_histogram, tagset.pronoun_tags)
+        return pronouns / ilen(t.all_words)
 
 
 class ContentWordIncidence(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Content word incidence',
                  column_name='content_words'):
         super(ContentWordIncidence, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        content_words = filter(pos_tagger.tagset.is_content_word,
-                               t.tagged_words)
-        return ilen(content_words) / ilen(t.all_words)
+        tagset = pos_tagger.tagset
+        content_words = tagset.count_tags(t.tag_histogram,
+                                          tagset.content_word_tags)
+        return content_words / ilen(t.all_words)
 
 
 class FunctionWordIncidence(base.Metric):
     """
     """
+    version = 2
+
     def __init__(self, name='Function word incidence',
                  column_name='function_words'):
         super(FunctionWordIncidence, self).__init__(name, column_name)
 
     def value_for_text(self, t):
-        function_words = filter(pos_tagger.tagset.is_function_word,
-                                t.tagged_words)
-        return ilen(function_words) / ilen(t.all_words)
+        tagset = pos_tagger.tagset
+        function_words = tagset.count_tags(t.tag_histogram,
+                                           tagset.function_word_tags)
+        return function_words / ilen(t.all_words)
 
 
 class BasicCounts(base.Category):
@@ -0,0 +1,187 @@
+from coh import base
+from coh.utils import ilen
+from coh.tools import pos_tagger, TaggedForms
+from coh.tools.phrases import PhraseMatcher
+from collections import Counter
+
+
+# The connectives of each category, lowercased, with their tokens
+# separated by spaces as the word tokenizer splits them. A connective may
+# be in more than one category (e.g., "então").
+ADDITIVE = [
+    'e', 'também', 'além disso', 'além de', 'ademais', 'outrossim',
+    'bem como', 'assim como', 'não só', 'não somente', 'não apenas',
+    'mas também', 'como também', 'mas ainda', 'nem', 'tampouco',
+    'inclusive', 'igualmente', 'do mesmo modo', 'da mesma forma',
+    'da mesma maneira', 'de igual modo', 'por sua vez', 'aliás',
+    'somado a isso', 'acrescido a isso',
+]
+
+ADVERSATIVE = [
+    'mas', 'porém', 'contudo', 'todavia', 'entretanto', 'no entanto',
+    'não obstante', 'embora', 'conquanto', 'apesar de', 'apesar disso',
+    'apesar de que', 'ainda que', 'mesmo que', 'mesmo assim',
+    'mesmo quando', 'se bem que', 'por mais que', 'ao passo que',
+    'por outro lado', 'pelo contrário', 'ao contrário', 'em vez de',
+    'ao invés de', 'em contrapartida', 'senão', 'só que', 'a despeito de',
+]
+
+CAUSAL = [
+    'porque', 'pois', 'porquanto', 'já que', 'uma vez que', 'visto que',
+    'dado que', 'posto que', 'visto como', 'por causa de', 'devido a',
+    'em virtude de', 'em razão de', 'graças a', 'por isso', 'portanto',
+    'logo', 'então', 'assim', 'por conseguinte', 'consequentemente',
+    'em consequência', 'por consequência', 'como consequência',
+    'de modo que', 'de forma que', 'de maneira que', 'de sorte que',
+    'tanto que', 'daí', 'por esse motivo', 'por essa razão', 'para que',
+    'a fim de', 'a fim de que', 'com o objetivo de',
+]
+
+LOGICAL = [
+    'se', 'caso', 'contanto que', 'desde que', 'a menos que',
+    'a não ser que', 'salvo se', 'exceto se', 'sem que', 'ou',
+    'ou então', 'ou seja', 'isto é', 'quer dizer', 'ou melhor',
+    'em outras palavras', 'de fato', 'na verdade', 'com efeito',
+    'por exemplo', 'em suma', 'em resumo', 'em síntese', 'enfim',
+]
+
+TEMPORAL = [
+    'quando', 'enquanto', 'antes', 'depois', 'antes de', 'depois de',
+    'antes que', 'depois que', 'logo que', 'assim que', 'sempre que',
+    'até que', 'desde que', 'à medida que', 'à proporção que',
+    'no momento em que', 'ao mesmo tempo', 'ao mesmo tempo que',
+    'em seguida', 'a seguir', 'então', 'até então', 'desde então',
+    'mais tarde', 'logo depois', 'logo após', 'por fim', 'finalmente',
+    'primeiramente', 'em primeiro lugar', 'inicialmente', 'afinal',
+    'nesse momento', 'nesse meio tempo', 'agora', 'atualmente',
+]
+
+# Single-word connectives that are also other words ("se" is also a
+# pronoun, as in "tornou-" "se"; "caso" is also a noun, as in "neste
+# caso"): they only count with a tag of the given class (see TaggedForms).
+# Multi-word connectives that contain them are not restricted.
+AMBIGUOUS = TaggedForms([
+    ('se', 'conjunction_tags', True),
+    ('caso', 'conjunction_tags', True),
+])
+
+_matcher = PhraseMatcher((phrase, category)
+                         for category, phrases in (('additive', ADDITIVE),
+                                                   ('adversative',
+                                                    ADVERSATIVE),
+                                                   ('causal', CAUSAL),
+                                                   ('logical', LOGICAL),
+                                                   ('temporal', TEMPORAL))
+                         for phrase in phrases)
+
+
+@base.text_feature
+def _connective_counts(t):
+    """Return a pair (total, counts), where total is the number of
+        connectives of a text, and counts is a Counter mapping each
+        category ("additive", "adversative", "causal", "logical" and
+        "temporal") to the number of connectives in it.
+    """
+    tagset = pos_tagger.tagset
+
+    total = 0
+    counts = Counter()
+    for sentence in t.tagged_sentences:
+        def accept(start, end, labels):
+            if end - start > 1:
+                return True
+            word, tag = sentence[start]
+            return word not in AMBIGUOUS or AMBIGUOUS.get(tagset, word, tag)
+
+        words = [word.lower() for word, _ in sentence]
+        for _, _, labels in _matcher.finditer(words, accept):
+            total += 1
+            counts.update(labels)
+    return total, counts
+
+
+class AllConnectivesIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of all connectives',
+                 column_name='conn_all'):
+        super(AllConnectivesIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        total, _ = _connective_counts(t)
+        return total / ilen(t.all_words)
+
+
+class AdditiveConnectivesIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of additive connectives',
+                 column_name='conn_additive'):
+        super(AdditiveConnectivesIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        _, counts = _connective_counts(t)
+        return counts['additive'] / ilen(t.all_words)
+
+
+class AdversativeConnectivesIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of adversative connectives',
+                 column_name='conn_adversative'):
+        super(AdversativeConnectivesIncidence, self).__init__(name,
+                                                              column_name)
+
+    def value_for_text(self, t):
+        _, counts = _connective_counts(t)
+        return counts['adversative'] / ilen(t.all_words)
+
+
+class CausalConnectivesIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of causal connectives',
+                 column_name='conn_causal'):
+        super(CausalConnectivesIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        _, counts = _connective_counts(t)
+        return counts['causal'] / ilen(t.all_words)
+
+
+class LogicalConnectivesIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of logical connectives',
+                 column_name='conn_logical'):
+        super(LogicalConnectivesIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        _, counts = _connective_counts(t)
+        return counts['logical'] / ilen(t.all_words)
+
+
+class TemporalConnectivesIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of temporal connectives',
+                 column_name='conn_temporal'):
+        super(TemporalConnectivesIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        _, counts = _connective_counts(t)
+        return counts['temporal'] / ilen(t.all_words)
+
+
+class Connectives(base.Category):
+    """Incidence of connectives, by category. The multi-word connectives
+    are matched, together with the single-word ones, in a single pass over
+    the tagged words of the text; when two occurrences overlap, the longest
+    one counts (e.g., "mas também" is additive, not adversative). Single
+    words that are connectives only with some tags (see AMBIGUOUS) are
+    checked against their tag.
+    """
+    def __init__(self, name='Connectives', table_name='connectives'):
+        super(Connectives, self).__init__(name, table_name)
+        self._set_metrics_from_module(__name__)
+        self.metrics.sort(key=lambda m: m.name)
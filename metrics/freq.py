@@ -0,0 +1,85 @@
+from coh import base
+from coh.tools import pos_tagger, frequency_lexicon
+from itertools import chain
+from math import log10
+
+
+# The frequencies in the lexicon are occurrences per million words. Words
+# rarer than this are counted by RareWordRatio.
+RARE_WORD_FREQUENCY = 1.0
+
+
+@base.text_feature
+def _content_word_frequencies(t):
+    """Return, for each sentence of a text, the list of the log frequencies
+        (log10 of 1 + occurrences per million) of its content words. Words
+        that are not in the lexicon have frequency 0.
+    """
+    is_content_word = pos_tagger.tagset.is_content_word
+    sentences = [[token[0].lower() for token in sentence
+                  if is_content_word(token)]
+                 for sentence in t.tagged_sentences]
+
+    frequencies = frequency_lexicon.lookup(chain.from_iterable(sentences),
+                                           0.0)
+    log_frequencies = dict((word, log10(1 + frequency))
+                           for word, frequency in frequencies.items())
+
+    return [[log_frequencies[word] for word in sentence]
+            for sentence in sentences]
+
+
+class ContentWordFrequency(base.Metric):
+    """
+    """
+    def __init__(self, name='Mean content word frequency',
+                 column_name='content_word_frequency'):
+        super(ContentWordFrequency, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        frequencies = list(chain.from_iterable(_content_word_frequencies(t)))
+        if not frequencies:
+            return 0.0
+        return sum(frequencies) / len(frequencies)
+
+
+class MinimumSentenceFrequency(base.Metric):
+    """
+    """
+    def __init__(self, name='Mean minimum content word frequency per '
+                 'sentence', column_name='min_content_word_frequency'):
+        super(MinimumSentenceFrequency, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        minimums = [min(sentence) for sentence in _content_word_frequencies(t)
+                    if sentence]
+        if not minimums:
+            return 0.0
+        return sum(minimums) / len(minimums)
+
+
+class RareWordRatio(base.Metric):
+    """
+    """
+    def __init__(self, name='Rare content word ratio',
+                 column_name='rare_words'):
+        super(RareWordRatio, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        threshold = log10(1 + RARE_WORD_FREQUENCY)
+        frequencies = list(chain.from_iterable(_content_word_frequencies(t)))
+        if not frequencies:
+            return 0.0
+        return sum(1 for f in frequencies if f < threshold) / len(frequencies)
+
+
+class Frequencies(base.Category):
+    """Frequency of the words of a text in a reference corpus. The
+    frequencies are read from models/lexicons/frequencies.lex (see
+    coh.tools.lexicon.Lexicon.build_from_tsv), a list of lowercased words
+    with their occurrences per million words.
+    """
+    def __init__(self, name='Frequencies', table_name='frequencies'):
+        super(Frequencies, self).__init__(name, table_name)
+        self._set_metrics_from_module(__name__)
+        self.metrics.sort(key=lambda m: m.name)
@@ -0,0 +1,72 @@
+from coh import base
+from coh.tools import pos_tagger, hypernym_index, index_key
+from collections import Counter
+
+
+@base.text_feature
+def _hypernym_depths(t):
+    """Return a dictionary that maps "n" and "v" to the mean hypernym depth
+        of the nouns and verbs of a text, respectively.
+
+    The depth of a word is the mean depth of its synsets. Words that are
+    not in the wordnet are ignored. There is no lemmatizer, so the
+    lowercased forms of the words are looked up, and inflected forms are
+    not found.
+    """
+    tagset = pos_tagger.tagset
+    noun = tagset.class_mask('noun_tags')
+    verb = tagset.class_mask('verb_tags')
+
+    counts = Counter()
+    for (word, tag), count in base.tagged_word_histogram(t).items():
+        mask = tagset.tag_mask(tag)
+        if mask & noun:
+            counts[index_key(word, 'n')] += count
+        elif mask & verb:
+            counts[index_key(word, 'v')] += count
+
+    depths = hypernym_index.lookup(counts)
+
+    totals = {'n': 0.0, 'v': 0.0}
+    found = {'n': 0, 'v': 0}
+    for key, count in counts.items():
+        if depths[key] is not None:
+            pos = key[-1]
+            totals[pos] += depths[key][1] * count
+            found[pos] += count
+
+    return dict((pos, totals[pos] / found[pos] if found[pos] else 0.0)
+                for pos in totals)
+
+
+class NounHypernyms(base.Metric):
+    """
+    """
+    def __init__(self, name='Mean hypernym depth of nouns',
+                 column_name='hypernyms_nouns'):
+        super(NounHypernyms, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _hypernym_depths(t)['n']
+
+
+class VerbHypernyms(base.Metric):
+    """
+    """
+    def __init__(self, name='Mean hypernym depth of verbs',
+                 column_name='hypernyms_verbs'):
+        super(VerbHypernyms, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _hypernym_depths(t)['v']
+
+
+class Hypernyms(base.Category):
+    """Depth of the nouns and verbs of a text in the taxonomy of a
+    wordnet. The depths are read from models/lexicons/hypernyms.lex, built
+    offline by coh.tools.wordnet.build_hypernym_index.
+    """
+    def __init__(self, name='Hypernyms', table_name='hypernyms'):
+        super(Hypernyms, self).__init__(name, table_name)
+        self._set_metrics_from_module(__name__)
+        self.metrics.sort(key=lambda m: m.name)
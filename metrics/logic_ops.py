@@ -0,0 +1,123 @@
+from coh import base
+from coh.utils import ilen
+from coh.tools import pos_tagger, TaggedForms
+from collections import Counter
+
+
+# The logic operators: each lowercased form, the class of tags its tokens
+# must have to count (see TaggedForms), and the operators it is an
+# instance of.
+OPERATORS = [
+    ('e', 'conjunction_tags', ('and',)),
+    ('ou', 'conjunction_tags', ('or',)),
+    ('se', 'conjunction_tags', ('if', 'conditional')),
+    ('caso', 'conjunction_tags', ('conditional',)),
+    ('não', None, ('negation',)),
+    ('nem', None, ('negation',)),
+    ('nunca', None, ('negation',)),
+    ('jamais', None, ('negation',)),
+    ('tampouco', None, ('negation',)),
+    ('ninguém', 'pronoun_tags', ('negation',)),
+    ('nada', 'pronoun_tags', ('negation',)),
+    ('nenhum', 'pronoun_tags', ('negation',)),
+    ('nenhuma', 'pronoun_tags', ('negation',)),
+    ('nenhuns', 'pronoun_tags', ('negation',)),
+    ('nenhumas', 'pronoun_tags', ('negation',)),
+]
+
+_operators = TaggedForms(OPERATORS)
+
+
+@base.text_feature
+def _operator_counts(t):
+    """Return a Counter that maps each operator ("and", "or", "if",
+        "conditional" and "negation") to the number of its tokens in a
+        text, and "all" to the number of tokens that are logic operators.
+        Each distinct (word, tag) pair of the text is looked up once.
+    """
+    tagset = pos_tagger.tagset
+
+    counts = Counter()
+    for (word, tag), count in base.tagged_word_histogram(t).items():
+        matches = _operators.get(tagset, word, tag)
+        if not matches:
+            continue
+        for operators in matches:
+            for operator in operators:
+                counts[operator] += count
+        counts['all'] += count
+    return counts
+
+
+class LogicOperatorsIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of logic operators',
+                 column_name='logic_operators'):
+        super(LogicOperatorsIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _operator_counts(t)['all'] / ilen(t.all_words)
+
+
+class AndIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of "e"', column_name='and_incidence'):
+        super(AndIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _operator_counts(t)['and'] / ilen(t.all_words)
+
+
+class OrIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of "ou"', column_name='or_incidence'):
+        super(OrIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _operator_counts(t)['or'] / ilen(t.all_words)
+
+
+class IfIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of "se"', column_name='if_incidence'):
+        super(IfIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _operator_counts(t)['if'] / ilen(t.all_words)
+
+
+class ConditionalIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of conditionals',
+                 column_name='conditional_incidence'):
+        super(ConditionalIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _operator_counts(t)['conditional'] / ilen(t.all_words)
+
+
+class NegationIncidence(base.Metric):
+    """
+    """
+    def __init__(self, name='Incidence of negations',
+                 column_name='negation_incidence'):
+        super(NegationIncidence, self).__init__(name, column_name)
+
+    def value_for_text(self, t):
+        return _operator_counts(t)['negation'] / ilen(t.all_words)
+
+
+class LogicOperators(base.Category):
+    """Incidence of logic operators: "e", "ou", "se", conditionals and
+    negations. The tags tell the operators apart from their homographs
+    (e.g., the conjunction "se" from the pronoun).
+    """
+    def __init__(self, name='Logic Operators', table_name='logic_operators'):
+        super(LogicOperators, self).__init__(name, table_name)
+        self._set_metrics_from_module(__name__)
+        self.metrics.sort(key=lambda m: m.name)
@@ -0,0 +1,440 @@
+#-*- coding: utf-8 -*-
+# table.py - Compact, array-based storage of a text's tokens.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Sequence
+
+
+class TokenTable(object):
+    """Stores the tokens of a text as columns of integers.
+
+    Each distinct word and each distinct tag is stored only once, in
+    self.vocabulary and self.tags; tokens are represented by their ids in
+    those lists (self.word_ids and self.tag_ids). Sentence and paragraph
+    boundaries are kept as offset arrays: the tokens of sentence i are
+    word_ids[sentence_offsets[i]:sentence_offsets[i + 1]], and the
+    sentences of paragraph j are those from paragraph_offsets[j] to
+    paragraph_offsets[j + 1] - 1.
+    """
+    __slots__ = ('vocabulary', 'word_index', 'tags', 'tag_index',
+                 'word_ids', 'tag_ids', 'sentence_offsets',
+                 'paragraph_offsets')
+
+    def __init__(self, sentences=(), paragraph_offsets=None):
+        """Form a token table.
+
+        Keyword arguments:
+        sentences -- an iterable of lists of words (default ()).
+        paragraph_offsets -- an iterable with the index of the first
+            sentence of each paragraph, followed by the number of sentences.
+            If None, the whole text is considered a single paragraph.
+            (default None)
+        """
+        self.vocabulary = []
+        self.word_index = {}
+        self.tags = []
+        self.tag_index = {}
+
+        self.word_ids = array('i')
+        self.tag_ids = array('i')
+        self.sentence_offsets = array('i', [0])
+
+        for sentence in sentences:
+            self.add_sentence(sentence)
+
+        if paragraph_offsets is None:
+            paragraph_offsets = [0, self.nsentences]
+        self.paragraph_offsets = array('i', paragraph_offsets)
+
+    @property
+    def ntokens(self):
+        return len(self.word_ids)
+
+    @property
+    def nsentences(self):
+        return len(self.sentence_offsets) - 1
+
+    @property
+    def is_tagged(self):
+        """True if every token has a tag.
+        """
+        return len(self.tag_ids) == len(self.word_ids)
+
+    def _word_id(self, word):
+        try:
+            return self.word_index[word]
+        except KeyError:
+            word_id = self.word_index[word] = len(self.vocabulary)
+            self.vocabulary.append(word)
+            return word_id
+
+    def _tag_id(self, tag):
+        try:
+            return self.tag_index[tag]
+        except KeyError:
+            tag_id = self.tag_index[tag] = len(self.tags)
+            self.tags.append(tag)
+            return tag_id
+
+    def add_sentence(self, words):
+        """Append a sentence to the table.
+
+        Required arguments:
+        words -- a list of strings.
+        """
+        self.word_ids.extend(map(self._word_id, words))
+        self.sentence_offsets.append(len(self.word_ids))
+
+    def set_tags(self, tagged_sentences):
+        """Set the tags of all tokens.
+
+        Required arguments:
+        tagged_sentences -- a list of lists of pairs (word, tag), with the
+            same tokens of the table, separated in the same sentences.
+        """
+        tag_ids = array('i')
+        for sentence in tagged_sentences:
+            tag_ids.extend(self._tag_id(tag) for _, tag in sentence)
+
+        if len(tag_ids) != len(self.word_ids):
+            raise ValueError('%d tags given for %d tokens'
+                             % (len(tag_ids), len(self.word_ids)))
+        self.tag_ids = tag_ids
+
+    def sentence_span(self, i):
+        """Return the indices (start, end) of the tokens of a sentence.
+        """
+        return self.sentence_offsets[i], self.sentence_offsets[i + 1]
+
+    def sentence_words(self, i):
+        """Return the words of a sentence, as a list of strings.
+        """
+        start, end = self.sentence_span(i)
+        return list(map(self.vocabulary.__getitem__,
+                        self.word_ids[start:end]))
+
+    def sentence_tagged_words(self, i):
+        """Return the tagged words of a sentence, as a list of pairs
+            (string, string).
+        """
+        start, end = self.sentence_span(i)
+        return list(zip(map(self.vocabulary.__getitem__,
+                            self.word_ids[start:end]),
+                        map(self.tags.__getitem__,
+                            self.tag_ids[start:end])))
+
+    def paragraph_span(self, start, stop):
+        """Return the indices (start, end) of the tokens of the paragraphs
+            from start to stop - 1.
+        """
+        return (self.sentence_offsets[self.paragraph_offsets[start]],
+                self.sentence_offsets[self.paragraph_offsets[stop]])
+
+    def replace_paragraphs(self, start, stop, paragraphs,
+                           tagged_sentences=None):
+        """Replace the paragraphs from start to stop - 1 by new ones.
+            Inserting (start == stop) and deleting (no new paragraphs) are
+            special cases.
+
+        Only the new tokens are interned; the offsets of the following
+        sentences and paragraphs are shifted.
+
+        Required arguments:
+        start, stop -- the indices of the replaced paragraphs.
+        paragraphs -- a list of paragraphs, each one a list of sentences
+            (lists of strings).
+
+        Keyword arguments:
+        tagged_sentences -- the tagged words of the new sentences (see
+            set_tags). Required if the table is tagged. (default None)
+        """
+        word_ids = array('i')
+        sentence_ends = []
+        paragraph_ends = []
+        for paragraph in paragraphs:
+            for sentence in paragraph:
+                word_ids.extend(map(self._word_id, sentence))
+                sentence_ends.append(len(word_ids))
+            paragraph_ends.append(len(sentence_ends))
+
+        tagged = self.is_tagged
+        if tagged:
+            if tagged_sentences is None:
+                raise ValueError('tags are required in a tagged table')
+            tag_ids = array('i')
+            for sentence in tagged_sentences:
+                tag_ids.extend(self._tag_id(tag) for _, tag in sentence)
+            if len(tag_ids) != len(word_ids):
+                raise ValueError('%d tags given for %d tokens'
+                                 % (len(tag_ids), len(word_ids)))
+
+        first_sentence = self.paragraph_offsets[start]
+        last_sentence = self.paragraph_offsets[stop]
+        first_token, last_token = self.paragraph_span(start, stop)
+        token_shift = len(word_ids) - (last_token - first_token)
+        sentence_shift = len(sentence_ends) - (last_sentence - first_sentence)
+
+        self.word_ids[first_token:last_token] = word_ids
+        if tagged:
+            self.tag_ids[first_token:last_token] = tag_ids
+
+        offsets = self.sentence_offsets
+        self.sentence_offsets = offsets[:first_sentence + 1]\
+            + array('i', [first_token + end for end in sentence_ends])\
+            + array('i', [offset + token_shift
+                          for offset in offsets[last_sentence + 1:]])
+
+        offsets = self.paragraph_offsets
+        self.paragraph_offsets = offsets[:start + 1]\
+            + array('i', [first_sentence + end for end in paragraph_ends])\
+            + array('i', [offset + sentence_shift
+                          for offset in offsets[stop + 1:]])
+
+    def tag_histogram(self, start=0, end=None):
+        """Return a Counter mapping each tag to its number of tokens.
+
+        Keyword arguments:
+        start, end -- the indices of the first token and after the last
+            token counted (default: all tokens).
+        """
+        tag_ids = self.tag_ids
+        if start != 0 or end is not None:
+            tag_ids = tag_ids[start:end]
+        return Counter(dict((self.tags[tag_id], count) for tag_id, count
+                            in Counter(tag_ids).items()))
+
+    def tagged_word_histogram(self, start=0, end=None):
+        """Return a Counter mapping each pair (word, tag) to its number of
+            tokens.
+
+        Keyword arguments:
+        start, end -- the indices of the first token and after the last
+            token counted (default: all tokens).
+        """
+        word_ids = self.word_ids
+        tag_ids = self.tag_ids
+        if start != 0 or end is not None:
+            word_ids = word_ids[start:end]
+            tag_ids = tag_ids[start:end]
+        vocabulary = self.vocabulary
+        tags = self.tags
+        return Counter(dict(((vocabulary[word_id], tags[tag_id]), count)
+                            for (word_id, tag_id), count
+                            in Counter(zip(word_ids, tag_ids)).items()))
+
+
+class SentenceSpans(Sequence):
+    """Stores the sentences of a text as character offsets into its
+    paragraphs, instead of as strings.
+
+    The sentence i is paragraphs[p][starts[i]:ends[i]], where p is the
+    paragraph that contains it: the sentences of paragraph p are those
+    from paragraph_offsets[p] to paragraph_offsets[p + 1] - 1. As a
+    sequence, it contains the triples (paragraph, start, end).
+    """
+    __slots__ = ('paragraphs', 'starts', 'ends', 'paragraph_offsets')
+
+    def __init__(self, paragraphs, spans=()):
+        """Form the sentence spans of a text.
+
+        Required arguments:
+        paragraphs -- the list of paragraphs (strings) of the text. It is
+            not copied.
+
+        Keyword arguments:
+        spans -- an iterable with, for each paragraph, an iterable of the
+            pairs (start, end) of its sentences (default ()).
+        """
+        self.paragraphs = paragraphs
+        self.starts = array('i')
+        self.ends = array('i')
+        self.paragraph_offsets = array('i', [0])
+
+        for paragraph_spans in spans:
+            self._extend(paragraph_spans)
+            self.paragraph_offsets.append(len(self.starts))
+
+    def _extend(self, spans):
+        for start, end in spans:
+            self.starts.append(start)
+            self.ends.append(end)
+
+    def paragraph(self, i):
+        """Return the index of the paragraph that contains a sentence.
+        """
+        return bisect_right(self.paragraph_offsets, i) - 1
+
+    def sentence(self, i):
+        """Return the content of a sentence, as a string.
+        """
+        return self.paragraphs[self.paragraph(i)][self.starts[i]:
+                                                  self.ends[i]]
+
+    def iter_sentences(self):
+        """Iterate over the contents of the sentences, paragraph by
+            paragraph.
+        """
+        starts = self.starts
+        ends = self.ends
+        offsets = self.paragraph_offsets
+        for p, paragraph in enumerate(self.paragraphs):
+            for i in range(offsets[p], offsets[p + 1]):
+                yield paragraph[starts[i]:ends[i]]
+
+    def replace_paragraphs(self, start, stop, spans):
+        """Replace the sentences of the paragraphs from start to stop - 1
+            by the ones of new paragraphs (see TokenTable.replace_paragraphs).
+            The list of paragraphs must be updated separately.
+
+        Required arguments:
+        start, stop -- the indices of the replaced paragraphs.
+        spans -- a list with, for each new paragraph, a list of the pairs
+            (start, end) of its sentences.
+        """
+        first = self.paragraph_offsets[start]
+        last = self.paragraph_offsets[stop]
+
+        new = SentenceSpans(None, spans)
+        self.starts[first:last] = new.starts
+        self.ends[first:last] = new.ends
+
+        shift = len(new) - (last - first)
+        offsets = self.paragraph_offsets
+        self.paragraph_offsets = offsets[:start + 1]\
+            + array('i', [first + offset
+                          for offset in new.paragraph_offsets[1:]])\
+            + array('i', [offset + shift for offset in offsets[stop + 1:]])
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('index out of range')
+        return self.paragraph(i), self.starts[i], self.ends[i]
+
+
+class _TableView(Sequence):
+    """Base class for the read-only, list-like views of a TokenTable (or
+    SentenceSpans) returned by the properties of Text.
+    """
+    __slots__ = ('_table',)
+
+    def __init__(self, table):
+        self._table = table
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._item(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('index out of range')
+        return self._item(i)
+
+    def __iter__(self):
+        return map(self._item, range(len(self)))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class SentenceStringsView(_TableView):
+    """The sentences of a text, as a sequence of strings sliced from its
+    paragraphs when accessed.
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self._table)
+
+    def _item(self, i):
+        return self._table.sentence(i)
+
+    def __iter__(self):
+        return self._table.iter_sentences()
+
+
+class SentencesView(_TableView):
+    """The words of a text, as a sequence of sentences (lists of strings).
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return self._table.nsentences
+
+    def _item(self, i):
+        return self._table.sentence_words(i)
+
+
+class WordsView(_TableView):
+    """The words of a text, as a flat sequence of strings.
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return self._table.ntokens
+
+    def _item(self, i):
+        return self._table.vocabulary[self._table.word_ids[i]]
+
+    def __iter__(self):
+        return map(self._table.vocabulary.__getitem__, self._table.word_ids)
+
+
+class TaggedSentencesView(_TableView):
+    """The tagged words of a text, as a sequence of sentences (lists of
+    pairs (string, string)).
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return self._table.nsentences
+
+    def _item(self, i):
+        return self._table.sentence_tagged_words(i)
+
+
+class TaggedWordsView(_TableView):
+    """The tagged words of a text, as a flat sequence of pairs
+    (string, string).
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return self._table.ntokens
+
+    def _item(self, i):
+        table = self._table
+        return (table.vocabulary[table.word_ids[i]],
+                table.tags[table.tag_ids[i]])
+
+    def __iter__(self):
+        table = self._table
+        return zip(map(table.vocabulary.__getitem__, table.word_ids),
+                   map(table.tags.__getitem__, table.tag_ids))
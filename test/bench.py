@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+# bench.py - Throughput benchmarks for each stage of Coh-Metrix-Port.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark each stage of the analysis of a text.
+
+Texts of controlled sizes are built from the sentences of a CoNLL corpus.
+For each size and stage (sentence splitting, word tokenization, tagging,
+syllable separation and each metric of BasicCounts), the stage is run
+several times on fresh copies of the text, and the latency percentiles,
+throughput (words per second) and peak memory allocated by the stage are
+reported. Results can be saved as JSON and compared with a previous run:
+
+    ./bench.py --sizes 10 100 1000 --output today.json --compare old.json
+
+With --agreement taggers, the Python MaxentTagger is compared with
+OpenNLPTagger on the same model (if Java and OpenNLP are available) and
+with the tags of the corpus, instead; with --agreement tokenizers,
+PortugueseWordTokenizer is compared with NLTK's word_tokenize on the
+sentences of the corpus, written back as running text (or on the
+sentences of a text file, given with --raw).
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from os.path import abspath, dirname
+
+# The package directory is named 'coh'; its parent must be in the path.
+sys.path.insert(0, dirname(dirname(dirname(abspath(__file__)))))
+
+import coh
+from coh.conll import read_conll_sentences
+from coh.utils import base_path
+
+
+def build_paragraphs(sentences, nsentences, sentences_per_paragraph=5):
+    """Return the paragraphs of a text with a given number of sentences,
+        taken cyclically from a list of sentences.
+    """
+    chosen = [sentences[i % len(sentences)] for i in range(nsentences)]
+    return [' '.join(chosen[i:i + sentences_per_paragraph])
+            for i in range(0, nsentences, sentences_per_paragraph)]
+
+
+def _fresh_text(paragraphs):
+    return coh.Text(paragraphs=paragraphs)
+
+
+def _split_text(paragraphs):
+    text = _fresh_text(paragraphs)
+    text.sentences
+    return text
+
+
+def _tokenized_text(paragraphs):
+    text = _split_text(paragraphs)
+    text.table
+    return text
+
+
+def _tagged_text(paragraphs):
+    text = _tokenized_text(paragraphs)
+    text.tagged_words
+    return text
+
+
+def _separate_syllables(text):
+    separator = coh.syllable_separator
+    # Measure the separator itself, and not the cache of earlier runs.
+    if hasattr(separator, 'clear'):
+        separator.clear()
+    for word in text.all_words:
+        try:
+            separator.separate(word)
+        except IndexError:
+            # Words without vowels (e.g., punctuation).
+            pass
+
+
+def _metric_stage(metric):
+    def run(text):
+        text.features.clear()
+        metric.value_for_text(text)
+    return run
+
+
+def stages(selected=None):
+    """Return the benchmarked stages, as a list of triples (name, setup,
+        run). setup builds, from a list of paragraphs, the input of the
+        stage (a text with the previous stages already done); run executes
+        the stage on it.
+
+    Keyword arguments:
+    selected -- a list of stage names. Names ending in '*' select all the
+        stages that start with the prefix (e.g., 'metric.*'). If None, all
+        stages are returned. (default None)
+    """
+    all_stages = [
+        ('sentences', _fresh_text, lambda text: text.sentences),
+        ('words', _split_text, lambda text: text.table),
+        ('tagging', _tokenized_text, lambda text: text.tagged_words),
+        ('syllables', _tagged_text, _separate_syllables),
+    ]
+    for metric in coh.BasicCounts().metrics:
+        all_stages.append(('metric.' + metric.column_name, _tagged_text,
+                           _metric_stage(metric)))
+
+    if selected is None:
+        return all_stages
+
+    def is_selected(name):
+        return any(name == s or (s.endswith('*') and name.startswith(s[:-1]))
+                   for s in selected)
+
+    return [stage for stage in all_stages if is_selected(stage[0])]
+
+
+def percentile(values, p):
+    """Return the p-th percentile (0-100) of a list of numbers, by linear
+        interpolation.
+    """
+    values = sorted(values)
+    position = (len(values) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def benchmark(name, setup, run, paragraphs, repeat):
+    """Run a stage several times and return its statistics as a dictionary.
+    """
+    latencies = []
+    for _ in range(repeat):
+        data = setup(paragraphs)
+        start = time.perf_counter()
+        run(data)
+        latencies.append(time.perf_counter() - start)
+
+    # Memory is traced in a separate run, since tracing slows down Python.
+    data = setup(paragraphs)
+    tracemalloc.start()
+    run(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    nwords = len(data.all_words)
+    mean = sum(latencies) / len(latencies)
+    return {
+        'stage': name,
+        'paragraphs': len(paragraphs),
+        'words': nwords,
+        'repeat': repeat,
+        'mean': mean,
+        'p50': percentile(latencies, 50),
+        'p90': percentile(latencies, 90),
+        'p99': percentile(latencies, 99),
+        'words_per_second': nwords / mean if mean else float('inf'),
+        'peak_memory': peak,
+    }
+
+
+def compare(results, previous):
+    """Print the speedup of each stage in relation to a previous run.
+    """
+    def key(r):
+        return r['stage'], r['words']
+
+    old = dict((key(r), r) for r in previous['results'])
+    print('\n%-40s %10s %12s %12s %8s' % ('stage', 'words', 'old p50',
+                                          'new p50', 'speedup'))
+    for r in results:
+        o = old.get(key(r))
+        if o is None:
+            continue
+        print('%-40s %10d %12.6f %12.6f %7.2fx' % (
+            r['stage'], r['words'], o['p50'], r['p50'],
+            o['p50'] / r['p50'] if r['p50'] else float('inf')))
+
+
+def token_agreement(tokens, reference):
+    """Return the agreement of two tokenizations of the same text: twice
+        the number of common tokens over the total number of tokens.
+    """
+    common = sum((Counter(tokens) & Counter(reference)).values())
+    total = len(tokens) + len(reference)
+    return 2 * common / total if total else 1.0
+
+
+# The contractions of a preposition and the following word, which the
+# CoNLL corpus keeps apart ("de" "o"), but written texts do not ("do").
+_contractions = dict(
+    [(('de', w), 'd' + w) for w in ('o', 'a', 'os', 'as', 'ele', 'ela',
+                                    'eles', 'elas', 'este', 'esta', 'estes',
+                                    'estas', 'isto', 'esse', 'essa', 'esses',
+                                    'essas', 'isso', 'aquele', 'aquela',
+                                    'aqueles', 'aquelas', 'aquilo', 'aí',
+                                    'ali', 'outro', 'outra', 'outros',
+                                    'outras')]
+    + [(('em', w), 'n' + w) for w in ('o', 'a', 'os', 'as', 'ele', 'ela',
+                                      'eles', 'elas', 'este', 'esta',
+                                      'estes', 'estas', 'isto', 'esse',
+                                      'essa', 'esses', 'essas', 'isso',
+                                      'aquele', 'aquela', 'aqueles',
+                                      'aquelas', 'aquilo', 'um', 'uma',
+                                      'uns', 'umas')]
+    + [(('por', w), 'pel' + w) for w in ('o', 'a', 'os', 'as')]
+    + [(('a', 'o'), 'ao'), (('a', 'os'), 'aos'), (('a', 'a'), 'à'),
+       (('a', 'as'), 'às'), (('a', 'aquele'), 'àquele'),
+       (('a', 'aquela'), 'àquela'), (('a', 'aquilo'), 'àquilo')])
+
+_no_space_before = frozenset(',.;:!?)]}»”%')
+_no_space_after = frozenset('([{«“$')
+
+
+def detokenize(words):
+    """Rebuild the text of a sentence of the CoNLL corpus as it would be
+        written: contractions are joined ("de" "o" is "do"), the words of
+        multi-word units are separated by spaces, clitics are attached to
+        the verb ("tornou-" "se" is "tornou-se") and no space is put
+        before closing punctuation or after opening punctuation.
+
+    Required arguments:
+    words -- a list of strings.
+
+    Returns: a pair (sentence, tokens), where tokens are the tokens of the
+        sentence by the conventions of the MacMorpho corpus.
+    """
+    tokens = []
+    i = 0
+    while i < len(words):
+        pair = (words[i].lower(), words[i + 1].lower())\
+            if i + 1 < len(words) else None
+        if pair in _contractions:
+            contraction = _contractions[pair]
+            if words[i][0].isupper():
+                contraction = contraction[0].upper() + contraction[1:]
+            tokens.append(contraction)
+            i += 2
+        else:
+            tokens.extend(words[i].split('_'))
+            i += 1
+
+    sentence = ''
+    for k, token in enumerate(tokens):
+        if k > 0 and token not in _no_space_before\
+                and tokens[k - 1] not in _no_space_after\
+                and not tokens[k - 1].endswith('-'):
+            sentence += ' '
+        sentence += token
+    return sentence, tokens
+
+
+def read_raw_sentences(path, encoding='utf-8'):
+    """Return the sentences of a text file with one sentence per line.
+    """
+    with open(path, encoding=encoding) as input_file:
+        return [line.strip() for line in input_file if line.strip()]
+
+
+def tokenizer_agreement(sentences, reference=None):
+    """Print the speed of PortugueseWordTokenizer and of NLTK's
+        word_tokenize (the previous default), the agreement of both with
+        reference tokens, if given, and with each other, and the tokens on
+        which they disagree most often.
+
+    NLTK's tokenizer is given one sentence at a time, as the word
+    tokenizer is in Text.table, so it does not split sentences again.
+
+    Required arguments:
+    sentences -- a list of strings, as they are written.
+
+    Keyword arguments:
+    reference -- a list of lists of tokens, one for each sentence
+        (default None).
+    """
+    from nltk import word_tokenize as nltk_word_tokenize
+
+    def nltk_tokenize(sentence):
+        return nltk_word_tokenize(sentence, language='portuguese',
+                                  preserve_line=True)
+
+    tokenizers = [('nltk', nltk_tokenize),
+                  ('portuguese', coh.PortugueseWordTokenizer())]
+
+    outputs = {}
+    print('%-12s %12s %12s %12s' % ('tokenizer', 'tokens/s', 'vs. ref.',
+                                    'sentences'))
+    for name, tokenize in tokenizers:
+        tokenize(sentences[0])
+        start = time.perf_counter()
+        outputs[name] = [tokenize(sentence) for sentence in sentences]
+        elapsed = time.perf_counter() - start
+        ntokens = sum(len(tokens) for tokens in outputs[name])
+        if reference is None:
+            print('%-12s %12.0f' % (name, ntokens / elapsed))
+            continue
+        print('%-12s %12.0f %12.4f %12.4f' % (
+            name, ntokens / elapsed,
+            token_agreement([t for s in outputs[name] for t in s],
+                            [t for s in reference for t in s]),
+            sum(a == b for a, b in zip(outputs[name], reference))
+            / len(reference)))
+
+    portuguese = [t for s in outputs['portuguese'] for t in s]
+    nltk = [t for s in outputs['nltk'] for t in s]
+    print('\nportuguese vs. nltk: %.4f tokens, %.4f sentences' % (
+        token_agreement(portuguese, nltk),
+        sum(a == b for a, b in zip(outputs['portuguese'], outputs['nltk']))
+        / len(sentences)))
+
+    print('\n%-30s %s' % ('only portuguese', 'only nltk'))
+    only_portuguese = (Counter(portuguese) - Counter(nltk)).most_common(15)
+    only_nltk = (Counter(nltk) - Counter(portuguese)).most_common(15)
+    for k in range(max(len(only_portuguese), len(only_nltk))):
+        left = '%s (%d)' % only_portuguese[k]\
+            if k < len(only_portuguese) else ''
+        right = '%s (%d)' % only_nltk[k] if k < len(only_nltk) else ''
+        print('%-30s %s' % (left, right))
+
+
+def opennlp_available():
+    """Return true if OpenNLPTagger can run: Java is in the PATH, and
+        OpenNLP is in vendor/.
+    """
+    return shutil.which('java') is not None and os.path.exists(
+        base_path + '/vendor/apache-opennlp-1.5.3/bin/opennlp')
+
+
+def agreement(gold):
+    """Print the agreement of MaxentTagger with OpenNLPTagger (which runs
+        Java) on the same model, and of both with the tags of the corpus,
+        with their speed. If Java or OpenNLP are not available, MaxentTagger
+        is only compared with the corpus.
+
+    Required arguments:
+    gold -- a list of tagged sentences.
+    """
+    sentences = [[word for word, _ in sentence] for sentence in gold]
+    nwords = sum(len(sentence) for sentence in sentences)
+    maxent = coh.MaxentTagger()
+    taggers = [('maxent', maxent)]
+    if opennlp_available():
+        taggers.insert(0, ('opennlp', coh.OpenNLPTagger()))
+    else:
+        print('Java or OpenNLP is not available: skipping the comparison '
+              'with OpenNLPTagger.\n')
+
+    outputs = {}
+    print('%-10s %14s %12s' % ('tagger', 'words/s', 'vs. corpus'))
+    for name, tagger in taggers:
+        tagger.tag(sentences[0])
+        start = time.perf_counter()
+        outputs[name] = tagger.batch_tag(sentences)
+        elapsed = time.perf_counter() - start
+        print('%-10s %14.0f %12.4f' % (name, nwords / elapsed,
+                                       tagger.evaluate(gold)))
+
+    if 'opennlp' in outputs:
+        same = sum(1 for maxent, opennlp in zip(outputs['maxent'],
+                                                outputs['opennlp'])
+                   if maxent == opennlp)
+        print('\nmaxent vs. opennlp: %.4f of the tags, %.4f of the '
+              'sentences' % (maxent.evaluate(outputs['opennlp']),
+                             same / len(sentences)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--corpus', default=base_path +
+                        '/corpora/macmorpho/PBrConst_test.conll',
+                        help='CoNLL file from which sentences are taken')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10, 100, 1000],
+                        help='text sizes, in number of sentences')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of runs of each stage')
+    parser.add_argument('--stages', nargs='+', default=None,
+                        help="stages to run (e.g., 'words' 'metric.*')")
+    parser.add_argument('--output', help='write the results to a JSON file')
+    parser.add_argument('--compare', help='a JSON file from a previous run')
+    parser.add_argument('--agreement', choices=['taggers', 'tokenizers'],
+                        help='compare the taggers or the word tokenizers '
+                        'instead of benchmarking the stages')
+    parser.add_argument('--raw', help='a text file, with one sentence per '
+                        'line, on which to compare the word tokenizers '
+                        '(default: the sentences of the corpus, detokenized)')
+    args = parser.parse_args(argv)
+
+    if args.agreement == 'taggers':
+        agreement(list(read_conll_sentences(args.corpus)))
+        return
+    if args.agreement == 'tokenizers':
+        if args.raw:
+            tokenizer_agreement(read_raw_sentences(args.raw))
+        else:
+            detokenized = [detokenize([word for word, _ in sentence])
+                           for sentence in read_conll_sentences(args.corpus)]
+            tokenizer_agreement([sentence for sentence, _ in detokenized],
+                                [tokens for _, tokens in detokenized])
+        return
+
+    sentences = [' '.join(word for word, _ in sentence)
+                 for sentence in read_conll_sentences(args.corpus)]
+    results = []
+
+    print('%-40s %10s %12s %12s %14s %12s' % ('stage', 'words', 'p50 (s)',
+                                              'p99 (s)', 'words/s',
+                                              'peak (KB)'))
+    for size in args.sizes:
+        paragraphs = build_paragraphs(sentences, size)
+        for name, setup, run in stages(args.stages):
+            r = benchmark(name, setup, run, paragraphs, args.repeat)
+            results.append(r)
+            print('%-40s %10d %12.6f %12.6f %14.0f %12.1f' % (
+                r['stage'], r['words'], r['p50'], r['p99'],
+                r['words_per_second'], r['peak_memory'] / 1024))
+
+    report = {
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'corpus': args.corpus,
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as previous_file:
+            compare(results, json.load(previous_file))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+# cache.py - Tests of the persistent cache of metric values.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Check that ResultCache does not serve values calculated with a model
+that has since been replaced or rebuilt.
+
+    ./cache.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+
+# The package directory is named 'coh'; its parent must be in the path.
+sys.path.insert(0, dirname(dirname(dirname(abspath(__file__)))))
+
+from coh import MetricsSet, ResultCache, Text
+from coh.metrics.freq import Frequencies
+from coh.tools import Lexicon, registry
+
+PARAGRAPHS = [[[('O', 'ART'), ('menino', 'N'), ('estuda', 'V'),
+                ('.', 'PU')]]]
+
+
+class ModelFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = join(self.directory, 'frequencies.lex')
+        Lexicon.build(self.path, [('menino', 100.0), ('estuda', 10.0)])
+        registry.register('frequency_lexicon', lambda: Lexicon(self.path),
+                          identity='test', files=[self.path])
+
+        self.cache = ResultCache()
+        self.metrics = MetricsSet([Frequencies()], cache=self.cache)
+        self.all_metrics = [m for c in self.metrics.categories
+                            for m in c.metrics]
+
+    def tearDown(self):
+        if registry.is_loaded('frequency_lexicon'):
+            registry.get('frequency_lexicon').close()
+        shutil.rmtree(self.directory)
+
+    def values(self):
+        return self.metrics.values_for_text(
+            Text.from_tagged_paragraphs(PARAGRAPHS)).flatten()
+
+    def loaded(self):
+        return self.cache.load(Text.from_tagged_paragraphs(PARAGRAPHS),
+                               self.all_metrics)
+
+    def test_same_model(self):
+        first = self.values()
+        self.assertEqual(self.loaded(), len(self.all_metrics))
+        self.assertEqual(self.values(), first)
+
+    def test_model_rebuilt_in_place(self):
+        first = self.values()
+
+        # The same keys, so the file has the same size; file systems with
+        # coarse timestamps would give it the same modification time if it
+        # were rebuilt within the same tick, so it is moved forward.
+        stat = os.stat(self.path)
+        Lexicon.build(self.path, [('menino', 1.0), ('estuda', 1000.0)])
+        os.utime(self.path, ns=(stat.st_atime_ns,
+                                stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(os.stat(self.path).st_size, stat.st_size)
+
+        self.assertEqual(self.loaded(), 0)
+        self.assertNotEqual(self.values(), first)
+
+    def test_model_replaced(self):
+        self.values()
+        registry.register('frequency_lexicon', lambda: Lexicon(self.path),
+                          identity='another test', files=[self.path])
+        self.assertEqual(self.loaded(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+# lexicon.py - Tests of the lexicon files and the frequency metrics.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Check Lexicon, and the Frequencies metrics on a lexicon built in a
+temporary directory (no lexicon is shipped with Coh-Metrix-Port).
+
+    ./lexicon.py
+"""
+
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from math import log10
+from os.path import abspath, dirname, join
+
+# The package directory is named 'coh'; its parent must be in the path.
+sys.path.insert(0, dirname(dirname(dirname(abspath(__file__)))))
+
+from coh import Text
+from coh.metrics.freq import Frequencies
+from coh.tools import Lexicon, registry
+
+# A paragraph of two sentences, with MacMorpho tags.
+PARAGRAPHS = [[[('O', 'ART'), ('menino', 'N'), ('estuda', 'V'),
+                ('muito', 'ADV'), ('.', 'PU')],
+               [('A', 'ART'), ('Casa', 'N'), ('bonita', 'ADJ'),
+                ('caiu', 'V'), ('.', 'PU')]]]
+
+
+class LexiconTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.lexicons = []
+
+    def tearDown(self):
+        for lexicon in self.lexicons:
+            lexicon.close()
+        shutil.rmtree(self.directory)
+
+    def build(self, entries, ncolumns=1):
+        path = join(self.directory, 'test%d.lex' % len(self.lexicons))
+        Lexicon.build(path, entries, ncolumns)
+        lexicon = Lexicon(path)
+        self.lexicons.append(lexicon)
+        return lexicon
+
+    def test_get(self):
+        lexicon = self.build([('casa', 10.0), ('menino', 2.5)])
+        self.assertEqual(len(lexicon), 2)
+        self.assertEqual(lexicon.get('casa'), 10.0)
+        self.assertEqual(lexicon.get('menino'), 2.5)
+        self.assertIsNone(lexicon.get('gato'))
+        self.assertEqual(lexicon.get('gato', 0.0), 0.0)
+        self.assertIn('casa', lexicon)
+        self.assertNotIn('gato', lexicon)
+
+    def test_bulk_lookup(self):
+        entries = dict(('palavra%d' % i, float(i)) for i in range(0, 2000, 2))
+        lexicon = self.build(entries.items())
+
+        # Every other key is missing, so the sorted queries fall between,
+        # on and past the keys of the table.
+        keys = ['palavra%d' % i for i in range(2000)]
+        keys += keys[:100]
+        values = lexicon.lookup(keys, -1.0)
+        self.assertEqual(len(values), 2000)
+        for key in keys:
+            self.assertEqual(values[key], entries.get(key, -1.0))
+
+        self.assertEqual(lexicon.lookup([]), {})
+        self.assertEqual(lexicon.lookup(['']), {'': None})
+
+    def test_repeated_key(self):
+        lexicon = self.build([('casa', 1.0), ('casa', 2.0)])
+        self.assertEqual(len(lexicon), 1)
+        self.assertEqual(lexicon.get('casa'), 1.0)
+
+    def test_columns(self):
+        lexicon = self.build([('casa', (1.0, 2.0)), ('lar', (3.0, 4.5))],
+                             ncolumns=2)
+        self.assertEqual(lexicon.lookup(['casa', 'lar', 'gato']),
+                         {'casa': (1.0, 2.0), 'lar': (3.0, 4.5),
+                          'gato': None})
+        with self.assertRaises(ValueError):
+            self.build([('casa', (1.0,))], ncolumns=2)
+
+    def test_build_from_tsv(self):
+        tsv_path = join(self.directory, 'frequencies.tsv')
+        with open(tsv_path, 'w', encoding='utf-8') as tsv_file:
+            tsv_file.write('Casa\t10\nmenino\t2.5\nincompleta\n')
+        path = join(self.directory, 'frequencies.lex')
+        Lexicon.build_from_tsv(tsv_path, path)
+        lexicon = Lexicon(path)
+        self.lexicons.append(lexicon)
+        self.assertEqual(lexicon.lookup(['casa', 'menino', 'incompleta']),
+                         {'casa': 10.0, 'menino': 2.5, 'incompleta': None})
+
+    def test_pickle(self):
+        lexicon = self.build([('casa', 10.0)])
+        lexicon.get('casa')
+        copy = pickle.loads(pickle.dumps(lexicon))
+        self.lexicons.append(copy)
+        self.assertEqual(copy.get('casa'), 10.0)
+
+
+class FrequenciesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        path = join(self.directory, 'frequencies.lex')
+        # log10(1 + frequency) is 2, 1, 4, 3 and log10(1.5); "bonita" is
+        # missing, so its frequency is 0.
+        Lexicon.build(path, [('menino', 99.0), ('estuda', 9.0),
+                             ('muito', 9999.0), ('casa', 999.0),
+                             ('caiu', 0.5)])
+        registry.register('frequency_lexicon', lambda: Lexicon(path),
+                          identity='test', files=[path])
+
+    def tearDown(self):
+        if registry.is_loaded('frequency_lexicon'):
+            registry.get('frequency_lexicon').close()
+        shutil.rmtree(self.directory)
+
+    def test_values(self):
+        text = Text.from_tagged_paragraphs(PARAGRAPHS)
+        values = dict(Frequencies().values_for_text(text).flatten())
+
+        self.assertAlmostEqual(values['content_word_frequency'],
+                               (2 + 1 + 4 + 3 + 0 + log10(1.5)) / 6)
+        self.assertAlmostEqual(values['min_content_word_frequency'],
+                               (1 + 0) / 2)
+        self.assertAlmostEqual(values['rare_words'], 2 / 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+# opennlp.py - Tests of the protocol of the OpenNLP worker processes.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Check how OpenNLPWorker talks to its process. Java is not needed: the
+worker runs a script that answers as OpenNLP's POSTagger does, tagging
+every whitespace-separated word as N.
+
+    ./opennlp.py
+"""
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+import unittest
+from os.path import abspath, dirname, join
+
+# The package directory is named 'coh'; its parent must be in the path.
+sys.path.insert(0, dirname(dirname(dirname(abspath(__file__)))))
+
+from coh.tools.tag.opennlp import OpenNLPWorker
+
+POSTAGGER = """#!%s
+import sys
+for line in iter(sys.stdin.readline, ''):
+    sys.stdout.write(' '.join(word + '_N' for word in line.split()) + '\\n')
+    sys.stdout.flush()
+""" % sys.executable
+
+
+class OpenNLPWorkerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        path = join(self.directory, 'opennlp')
+        with open(path, 'w') as script:
+            script.write(POSTAGGER)
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+        self.worker = OpenNLPWorker(path, 'model.bin')
+
+    def tearDown(self):
+        self.worker.close()
+        shutil.rmtree(self.directory)
+
+    def test_tag(self):
+        self.assertEqual(self.worker.tag(['O', 'menino', '.']),
+                         [('O', 'N'), ('menino', 'N'), ('.', 'N')])
+
+    def test_whitespace_tokens(self):
+        tokens = ['O', '', 'menino', ' ', 'R $', '\t', '.']
+        self.assertEqual(self.worker.tag(tokens),
+                         [(token, 'N') for token in tokens])
+
+    def test_fork(self):
+        self.worker.tag(['O', 'menino'])
+        process = self.worker._process
+
+        pid = os.fork()
+        if pid == 0:
+            # The child holds no pipe to the process, and outlives the
+            # parent's use of it.
+            released = self.worker._process is None
+            time.sleep(3)
+            os._exit(0 if released else 1)
+
+        try:
+            start = time.monotonic()
+            self.worker.close()
+            self.assertLess(time.monotonic() - start, 2)
+            self.assertIsNotNone(process.poll())
+        finally:
+            _, status = os.waitpid(pid, 0)
+        self.assertEqual(status, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+# phrases.py - Tests of the phrase matcher and the connective metrics.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Check PhraseMatcher, TaggedForms, and how the Connectives metrics
+tell the conjunctions "se" and "caso" from their homographs.
+
+    ./phrases.py
+"""
+
+import sys
+import unittest
+from os.path import abspath, dirname
+
+# The package directory is named 'coh'; its parent must be in the path.
+sys.path.insert(0, dirname(dirname(dirname(abspath(__file__)))))
+
+from coh import Text
+from coh.metrics.connectives import Connectives
+from coh.tools import PhraseMatcher, TaggedForms
+from coh.tools.tag import MacMorphoTagSet
+
+
+def matches(matcher, sentence, accept=None):
+    tokens = sentence.split()
+    return [(' '.join(tokens[start:end]), labels)
+            for start, end, labels in matcher.finditer(tokens, accept)]
+
+
+class PhraseMatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = PhraseMatcher([
+            ('mas', 'adversative'),
+            ('mas também', 'additive'),
+            ('também', 'additive'),
+            ('a fim de', 'causal'),
+            ('a fim de que', 'causal'),
+            ('fim de semana', 'noun'),
+            ('de que', 'other'),
+            ('por outro lado', 'adversative'),
+            ('outro', 'pronoun'),
+            ('logo', 'causal'),
+            ('logo', 'temporal'),
+        ])
+
+    def test_longest_at_same_start(self):
+        self.assertEqual(matches(self.matcher, 'mas também ele'),
+                         [('mas também', ('additive',))])
+        self.assertEqual(matches(self.matcher, 'saiu a fim de que voltasse'),
+                         [('a fim de que', ('causal',))])
+
+    def test_leftmost_of_overlapping(self):
+        # "a fim de" starts before "fim de semana", and "por outro lado"
+        # before "outro".
+        self.assertEqual(matches(self.matcher, 'a fim de semana'),
+                         [('a fim de', ('causal',))])
+        self.assertEqual(matches(self.matcher, 'por outro lado outro'),
+                         [('por outro lado', ('adversative',)),
+                          ('outro', ('pronoun',))])
+
+    def test_failure_links(self):
+        # After "a fim de" fails at "semana", the matcher follows its
+        # failure link to find "fim de semana" and "de que".
+        self.assertEqual(matches(self.matcher, 'o fim de semana'),
+                         [('fim de semana', ('noun',))])
+        self.assertEqual(matches(self.matcher, 'fim de que'),
+                         [('de que', ('other',))])
+
+    def test_end_of_sentence(self):
+        self.assertEqual(matches(self.matcher, 'e também'),
+                         [('também', ('additive',))])
+        self.assertEqual(matches(self.matcher, 'saiu a fim de'),
+                         [('a fim de', ('causal',))])
+        self.assertEqual(matches(self.matcher, 'saiu a fim'), [])
+        self.assertEqual(matches(self.matcher, ''), [])
+
+    def test_several_labels(self):
+        self.assertEqual(matches(self.matcher, 'logo'),
+                         [('logo', ('causal', 'temporal'))])
+
+    def test_accept(self):
+        def accept(start, end, labels):
+            return labels != ('additive',)
+        # Rejecting "mas também" leaves "mas", and rejecting "também"
+        # leaves nothing.
+        self.assertEqual(matches(self.matcher, 'mas também', accept),
+                         [('mas', ('adversative',))])
+        self.assertEqual(matches(self.matcher, 'também', accept), [])
+
+    def test_count(self):
+        total, counts = self.matcher.count([['mas', 'também'],
+                                            ['logo', 'por'],
+                                            ['outro', 'lado']])
+        self.assertEqual(total, 3)
+        self.assertEqual(counts, {'additive': 1, 'causal': 1,
+                                  'temporal': 1, 'pronoun': 1})
+
+    def test_empty_phrase(self):
+        with self.assertRaises(ValueError):
+            PhraseMatcher([('', 'none')])
+
+
+class TaggedFormsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tagset = MacMorphoTagSet()
+        self.forms = TaggedForms([('se', 'conjunction_tags', 'if'),
+                                  ('caso', 'conjunction_tags', 'if'),
+                                  ('não', None, 'negation'),
+                                  ('nada', 'pronoun_tags', 'negation'),
+                                  ('nada', 'noun_tags', 'noun')])
+
+    def test_get(self):
+        self.assertEqual(self.forms.get(self.tagset, 'Se', 'KS'), ['if'])
+        self.assertEqual(self.forms.get(self.tagset, 'se', 'PROPESS'), [])
+        self.assertEqual(self.forms.get(self.tagset, 'caso', 'KS'), ['if'])
+        self.assertEqual(self.forms.get(self.tagset, 'caso', 'N'), [])
+        self.assertEqual(self.forms.get(self.tagset, 'não', 'ADV'),
+                         ['negation'])
+        self.assertEqual(self.forms.get(self.tagset, 'nada', 'PROSUB'),
+                         ['negation'])
+        self.assertEqual(self.forms.get(self.tagset, 'nada', 'N'), ['noun'])
+        self.assertEqual(self.forms.get(self.tagset, 'gato', 'N'), [])
+
+    def test_contains(self):
+        self.assertIn('Se', self.forms)
+        self.assertNotIn('gato', self.forms)
+
+
+class ConnectivesTest(unittest.TestCase):
+
+    def values(self, *sentences):
+        text = Text.from_tagged_paragraphs([sentences])
+        return dict(Connectives().values_for_text(text).flatten())
+
+    def test_ambiguous_forms(self):
+        # The conjunctions "se" and "caso" are logical connectives; the
+        # pronoun "se" and the noun "caso" are not.
+        values = self.values([('Se', 'KS'), ('chover', 'V'), (',', 'PU'),
+                              ('caso', 'KS'), ('possa', 'V'), (',', 'PU'),
+                              ('ele', 'PROPESS'), ('tornou-', 'V'),
+                              ('se', 'PROPESS'), ('neste', 'PREP'),
+                              ('caso', 'N'), ('.', 'PU')])
+        self.assertAlmostEqual(values['conn_logical'], 2 / 12)
+        self.assertAlmostEqual(values['conn_all'], 2 / 12)
+
+    def test_phrases_with_ambiguous_forms(self):
+        # "se bem que" is not restricted by the tag of "se".
+        values = self.values([('Saiu', 'V'), (',', 'PU'), ('se', 'PROPESS'),
+                              ('bem', 'ADV'), ('que', 'KS'),
+                              ('chovesse', 'V'), ('.', 'PU')])
+        self.assertAlmostEqual(values['conn_adversative'], 1 / 7)
+        self.assertAlmostEqual(values['conn_logical'], 0)
+
+    def test_end_of_sentence(self):
+        values = self.values([('Ele', 'PROPESS'), ('saiu', 'V'),
+                              ('também', 'PDEN')],
+                             [('Voltou', 'V'), ('mais', 'ADV'),
+                              ('tarde', 'ADV')])
+        self.assertAlmostEqual(values['conn_additive'], 1 / 6)
+        self.assertAlmostEqual(values['conn_temporal'], 1 / 6)
+        self.assertAlmostEqual(values['conn_all'], 2 / 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
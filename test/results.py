@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+# results.py - Tests of the tables of metric values of several texts.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Check the export of ResultTable, including tables without any value.
+The NumPy tests are skipped if NumPy is not installed.
+
+    ./results.py
+"""
+
+import sys
+import unittest
+from os.path import abspath, dirname
+
+# The package directory is named 'coh'; its parent must be in the path.
+sys.path.insert(0, dirname(dirname(dirname(abspath(__file__)))))
+
+from coh.base import CorpusResult, ResultTable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NAMES = ['basic_counts.words', 'basic_counts.sentences']
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class ToNumpyTest(unittest.TestCase):
+
+    def test_no_texts(self):
+        array = ResultTable().to_numpy()
+        self.assertEqual(array.shape, (0, 0))
+        self.assertEqual(array.dtype, numpy.float64)
+
+    def test_no_texts_with_names(self):
+        array = ResultTable(NAMES).to_numpy()
+        self.assertEqual(array.shape, (0, len(NAMES)))
+        self.assertEqual(array.dtype, numpy.float64)
+
+    def test_all_texts_failed(self):
+        results = [CorpusResult(0, None, 'error'),
+                   CorpusResult(1, None, 'error')]
+        array = ResultTable.from_corpus_results(results).to_numpy()
+        self.assertEqual(array.shape, (2, 0))
+
+        array = ResultTable.from_corpus_results(results, NAMES).to_numpy()
+        self.assertEqual(array.shape, (2, len(NAMES)))
+        self.assertTrue(numpy.isnan(array).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
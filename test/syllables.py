@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+# syllables.py - Regression check of the Silva2011 syllable separator.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Check that Silva2011SyllableSeparator separates words, and finds their
+tonic vowels, exactly as the original implementation did.
+
+The files in syllables/ were generated with the separator as it was
+before its rules were optimized. words.txt holds the vocabulary of the
+CoNLL test corpus (forms and lemmas) followed by random Portuguese-like
+words, and syllables.txt their separations; errors.txt holds the words
+for which the separator raised an exception, which it must still reject.
+tonic.txt holds the position of the tonic vowel of every word of both
+files, separated from it by a tab.
+
+    ./syllables.py
+
+The exit status is 0 if every word matches, and 1 otherwise.
+"""
+
+import codecs
+import sys
+from os.path import abspath, dirname, join
+
+# The package directory is named 'coh'; its parent must be in the path.
+sys.path.insert(0, dirname(dirname(dirname(abspath(__file__)))))
+
+from coh.tools.syllable import Silva2011SyllableSeparator
+from coh.tools.syllable.tonic import tonic_vowel
+
+DATA_PATH = join(dirname(abspath(__file__)), 'syllables')
+
+
+def check_errors(separator, errors_file_path, encoding='utf-8'):
+    """Return the words of a file, one per line, that the separator does
+        not reject with an exception.
+    """
+    accepted = []
+    with codecs.open(errors_file_path, encoding=encoding) as errors_file:
+        for word in map(str.strip, errors_file):
+            try:
+                separator.separate(word)
+            except Exception:
+                continue
+            accepted.append(word)
+    return accepted
+
+
+def check_tonic(tonic_file_path, encoding='utf-8'):
+    """Return the lines (word, position) of a file for which tonic_vowel
+        returns a different position.
+    """
+    wrong = []
+    with codecs.open(tonic_file_path, encoding=encoding) as tonic_file:
+        for line in tonic_file:
+            word, position = line.rstrip('\n').split('\t')
+            if tonic_vowel(word) != int(position):
+                wrong.append((word, int(position)))
+    return wrong
+
+
+def main():
+    separator = Silva2011SyllableSeparator()
+
+    accuracy = separator.test(join(DATA_PATH, 'words.txt'),
+                              join(DATA_PATH, 'syllables.txt'))
+
+    accepted = check_errors(separator, join(DATA_PATH, 'errors.txt'))
+    for word in accepted:
+        print("Word '%s' did not generate an exception." % word)
+
+    wrong = check_tonic(join(DATA_PATH, 'tonic.txt'))
+    for word, position in wrong:
+        print("Tonic vowel of '%s' incorrectly found.\n"
+              "\tCorrect position: %d.\n\tReturned position: %d"
+              % (word, position, tonic_vowel(word)))
+
+    return 0 if accuracy == 100 and not accepted and not wrong else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+# tokenizers.py - Tests of the Portuguese word tokenizer.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Check how PortugueseWordTokenizer splits clitic pronouns and elisions,
+and that it keeps other hyphenated words.
+
+    ./tokenizers.py
+"""
+
+import sys
+import unittest
+from os.path import abspath, dirname
+
+# The package directory is named 'coh'; its parent must be in the path.
+sys.path.insert(0, dirname(dirname(dirname(abspath(__file__)))))
+
+from coh.tools.tokenizers import PortugueseWordTokenizer
+
+
+class PortugueseWordTokenizerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tokenizer = PortugueseWordTokenizer()
+
+    def assertTokens(self, sentence, tokens):
+        self.assertEqual(self.tokenizer.tokenize(sentence), tokens)
+        self.assertEqual([sentence[start:end] for start, end
+                          in self.tokenizer.span_tokenize(sentence)], tokens)
+
+    def test_enclitic(self):
+        self.assertTokens('Ele disse-lhe a verdade.',
+                          ['Ele', 'disse-', 'lhe', 'a', 'verdade', '.'])
+
+    def test_several_clitics(self):
+        self.assertTokens('Dá-se-lhe o copo.',
+                          ['Dá-', 'se-', 'lhe', 'o', 'copo', '.'])
+
+    def test_mesoclitic(self):
+        self.assertTokens('Dar-se-ia bem.', ['Dar-', 'se-', 'ia', 'bem', '.'])
+
+    def test_elision(self):
+        self.assertTokens("Um copo d'água.",
+                          ['Um', 'copo', "d'", 'água', '.'])
+        self.assertTokens('Um copo d’água.',
+                          ['Um', 'copo', 'd’', 'água', '.'])
+
+    def test_compounds(self):
+        self.assertTokens('O guarda-chuva caiu.',
+                          ['O', 'guarda-chuva', 'caiu', '.'])
+        self.assertTokens('O dia-a-dia dele.',
+                          ['O', 'dia-a-dia', 'dele', '.'])
+        self.assertTokens('Deu-me o guarda-chuva.',
+                          ['Deu-', 'me', 'o', 'guarda-chuva', '.'])
+
+
+if __name__ == '__main__':
+    unittest.main()
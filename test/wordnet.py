@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+# wordnet.py - Tests of the wordnet indices and their metrics.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Check the indices built by coh.tools.wordnet, and the metrics that
+read them, on a small wordnet written to a temporary directory (no index
+is shipped with Coh-Metrix-Port).
+
+    ./wordnet.py
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+
+# The package directory is named 'coh'; its parent must be in the path.
+sys.path.insert(0, dirname(dirname(dirname(abspath(__file__)))))
+
+from coh import Text
+from coh.metrics.ambiguity import Ambiguity
+from coh.metrics.hypernyms import Hypernyms
+from coh.tools import Lexicon, registry
+from coh.tools.wordnet import build_hypernym_index, build_sense_index,\
+    index_key
+
+# A paragraph of two sentences, with MacMorpho tags.
+PARAGRAPHS = [[[('O', 'ART'), ('menino', 'N'), ('estuda', 'V'),
+                ('muito', 'ADV'), ('.', 'PU')],
+               [('A', 'ART'), ('Casa', 'N'), ('bonita', 'ADJ'),
+                ('caiu', 'V'), ('.', 'PU')]]]
+
+# The words of the wordnet, in the Open Multilingual Wordnet format.
+# "caiu" is not in it.
+WORDS = """# A comment.
+00001-n\tpor:lemma\tentidade
+00002-n\tpor:lemma\tser_vivo
+00003-n\tpor:lemma\tmenino
+00004-n\tpor:lemma\tcasa
+00005-n\tpor:lemma\tcasa
+00005-n\tpor:def\tnot a word
+00006-v\tpor:lemma\testudar
+00007-v\tpor:lemma\testuda
+00008-a\tpor:lemma\tbonita
+00009-s\tpor:lemma\tbonita
+00010-r\tpor:lemma\tmuito
+00011-n\tpor:lemma\tmenino
+00012-v\tpor:lemma\tcaiu_fora
+"""
+
+# The pairs (synset, hypernym). The depths are: 00001-n, 0; 00002-n and
+# 00004-n, 1; 00003-n and 00005-n, 2; 00006-v, 0; 00007-v, 1. 00011-n is
+# its own hypernym, so it is a root. 00012-v and 00013-v are hypernyms of
+# each other; 00013-v has no words, so the search starts at 00012-v, and
+# the cycle is broken at 00013-v.
+HYPERNYMS = """00002-n 00001-n
+00003-n 00002-n
+00004-n 00001-n
+00005-n 00002-n
+00011-n 00011-n
+00007-v 00006-v
+00012-v 00013-v
+00013-v 00012-v
+"""
+
+
+def write(directory, name, content):
+    path = join(directory, name)
+    with open(path, 'w', encoding='utf-8') as output_file:
+        output_file.write(content)
+    return path
+
+
+class WordnetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.words_path = write(self.directory, 'words.tab', WORDS)
+        self.text = Text.from_tagged_paragraphs(PARAGRAPHS)
+
+    def tearDown(self):
+        for name in ('hypernym_index', 'sense_index'):
+            if registry.is_loaded(name):
+                registry.get(name).close()
+        shutil.rmtree(self.directory)
+
+    def register(self, name, path):
+        registry.register(name, lambda: Lexicon(path), identity='test',
+                          files=[path])
+
+
+class HypernymsTest(WordnetTest):
+
+    def setUp(self):
+        super(HypernymsTest, self).setUp()
+        self.path = join(self.directory, 'hypernyms.lex')
+        build_hypernym_index(self.words_path, self.path,
+                             write(self.directory, 'hypernyms.txt',
+                                   HYPERNYMS))
+        self.register('hypernym_index', self.path)
+
+    def test_index(self):
+        index = Lexicon(self.path)
+        try:
+            # The minimum and the mean depth of the synsets of each word.
+            self.assertEqual(index.lookup([index_key('casa', 'n'),
+                                           index_key('menino', 'n'),
+                                           index_key('estuda', 'v'),
+                                           index_key('caiu fora', 'v'),
+                                           index_key('estuda', 'n'),
+                                           index_key('bonita', 'a')]),
+                             {index_key('casa', 'n'): (1.0, 1.5),
+                              index_key('menino', 'n'): (0.0, 1.0),
+                              index_key('estuda', 'v'): (1.0, 1.0),
+                              index_key('caiu fora', 'v'): (1.0, 1.0),
+                              index_key('estuda', 'n'): None,
+                              index_key('bonita', 'a'): None})
+        finally:
+            index.close()
+
+    def test_values(self):
+        values = dict(Hypernyms().values_for_text(self.text).flatten())
+        # "menino" (1.0) and "Casa" (1.5); "estuda" (1.0), and "caiu",
+        # which is not in the wordnet.
+        self.assertAlmostEqual(values['hypernyms_nouns'], 1.25)
+        self.assertAlmostEqual(values['hypernyms_verbs'], 1.0)
+
+
+class AmbiguityTest(WordnetTest):
+
+    def setUp(self):
+        super(AmbiguityTest, self).setUp()
+        self.path = join(self.directory, 'senses.lex')
+        build_sense_index(self.words_path, self.path)
+        self.register('sense_index', self.path)
+
+    def test_index(self):
+        index = Lexicon(self.path)
+        try:
+            # Satellite adjectives ("s") count as adjectives.
+            self.assertEqual(index.lookup([index_key('casa', 'n'),
+                                           index_key('bonita', 'a'),
+                                           index_key('muito', 'r'),
+                                           index_key('caiu', 'v'),
+                                           index_key('bonita', 's')]),
+                             {index_key('casa', 'n'): 2.0,
+                              index_key('bonita', 'a'): 2.0,
+                              index_key('muito', 'r'): 1.0,
+                              index_key('caiu', 'v'): None,
+                              index_key('bonita', 's'): None})
+        finally:
+            index.close()
+
+    def test_values(self):
+        values = dict(Ambiguity().values_for_text(self.text).flatten())
+        # "menino" (2) and "Casa" (2); "estuda" (1), and "caiu", which is
+        # not in the wordnet; "bonita" (2); "muito" (1).
+        self.assertAlmostEqual(values['ambiguity_nouns'], 2.0)
+        self.assertAlmostEqual(values['ambiguity_verbs'], 1.0)
+        self.assertAlmostEqual(values['ambiguity_adjectives'], 2.0)
+        self.assertAlmostEqual(values['ambiguity_adverbs'], 1.0)
+        self.assertAlmostEqual(values['ambiguity_content_words'], 8 / 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,17 @@
+from coh.tools.registry import ModelRegistry, LazyModel, registry, warmup
 from coh.tools.tag import *
+from coh.utils import base_path
 
-pos_tagger = OpenNLPTagger()
+registry.register('pos_tagger', OpenNLPTagger,
+                  identity='coh.tools.tag.opennlp.OpenNLPTagger '
+                  'models/opennlp/pt-pos-maxent.bin',
+                  files=[base_path + '/models/opennlp/pt-pos-maxent.bin'])
+pos_tagger = LazyModel('pos_tagger')
 
-from coh.tools.tokenizers import senter, word_tokenize
+from coh.tools.tokenizers import PortugueseWordTokenizer, senter,\
+    word_tokenize
 from coh.tools.syllable import *
+from coh.tools.lexicon import Lexicon, frequency_lexicon
+from coh.tools.wordnet import hypernym_index, sense_index,\
+    index_key
+from coh.tools.phrases import PhraseMatcher
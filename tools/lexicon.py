@@ -0,0 +1,225 @@
+#-*- coding: utf-8 -*-
+# lexicon.py - Compact, memory-mapped tables of word properties.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+from bisect import bisect_left
+from coh.tools.registry import registry, LazyModel
+from coh.utils import base_path
+import codecs
+import hashlib
+import mmap
+import struct
+import sys
+
+_MAGIC = b'COHLEX\x00\x01'
+_HEADER = struct.Struct('<8sQQ')
+
+
+def key_hash(key):
+    """Return the 64-bit hash under which a key is stored in a Lexicon.
+        Unlike hash(), it is the same in every process.
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'),
+                                          digest_size=8).digest(), 'little')
+
+
+class Lexicon(object):
+    """A read-only table that maps strings (words, lemmas, etc.) to one or
+    more numbers (frequencies, depths, etc.), stored in a binary file.
+
+    The file holds the 64-bit hashes of the keys, sorted, followed by the
+    values of each key. It is memory-mapped, and never read into Python
+    objects: the operating system loads the pages that are used, and
+    processes that use the same file (e.g., the workers of
+    MetricsSet.values_for_corpus) share them. The file is opened on first
+    use.
+
+    Lookups are done in bulk (see lookup): the distinct keys of a text are
+    hashed and sorted, and searched in a single pass over the table.
+    """
+    def __init__(self, path):
+        """Form a lexicon.
+
+        Required arguments:
+        path -- the path to a file written by Lexicon.build.
+        """
+        self.path = path
+        self._file = None
+        self._map = None
+        self._keys = None
+        self._values = None
+        self.ncolumns = None
+
+    @staticmethod
+    def build(path, entries, ncolumns=1):
+        """Write a lexicon file.
+
+        Required arguments:
+        path -- the path to the file.
+        entries -- an iterable of pairs (key, values), where key is a string
+            and values is a number or, if ncolumns > 1, a sequence of
+            ncolumns numbers. If a key is repeated, its first values are
+            kept.
+
+        Keyword arguments:
+        ncolumns -- the number of values of each key (default 1).
+        """
+        if sys.byteorder != 'little':
+            raise NotImplementedError('lexicons are little-endian')
+
+        table = {}
+        for key, values in entries:
+            h = key_hash(key)
+            if h not in table:
+                if ncolumns == 1 and not hasattr(values, '__len__'):
+                    values = (values,)
+                if len(values) != ncolumns:
+                    raise ValueError('%s: %d values, expected %d'
+                                     % (key, len(values), ncolumns))
+                table[h] = values
+
+        hashes = array('Q', sorted(table))
+        values = array('d')
+        for h in hashes:
+            values.extend(table[h])
+
+        with open(path, 'wb') as output_file:
+            output_file.write(_HEADER.pack(_MAGIC, len(hashes), ncolumns))
+            hashes.tofile(output_file)
+            values.tofile(output_file)
+
+    @classmethod
+    def build_from_tsv(cls, tsv_path, path, ncolumns=1, encoding='utf-8',
+                       normalize=str.lower):
+        """Write a lexicon file from a text file with one key per line,
+            followed by its values, separated by tabs.
+
+        Required arguments:
+        tsv_path -- the path to the text file.
+        path -- the path to the lexicon file.
+
+        Keyword arguments:
+        ncolumns -- the number of values of each key (default 1).
+        encoding -- the encoding of the text file (default "utf-8").
+        normalize -- a function applied to each key (default str.lower).
+        """
+        def entries():
+            with codecs.open(tsv_path, encoding=encoding) as input_file:
+                for line in input_file:
+                    fields = line.rstrip('\n').split('\t')
+                    if len(fields) < ncolumns + 1:
+                        continue
+                    yield normalize(fields[0]),\
+                        [float(f) for f in fields[1:ncolumns + 1]]
+
+        cls.build(path, entries(), ncolumns)
+
+    def _open(self):
+        if self._map is not None:
+            return
+
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, nkeys, ncolumns = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC:
+            raise ValueError('%s is not a lexicon file' % self.path)
+
+        view = memoryview(self._map)
+        start = _HEADER.size
+        self._keys = view[start:start + 8 * nkeys].cast('Q')
+        start += 8 * nkeys
+        self._values = view[start:start + 8 * nkeys * ncolumns].cast('d')
+        self.ncolumns = ncolumns
+
+    def close(self):
+        """Unmap the file. It is mapped again if the lexicon is used.
+        """
+        if self._map is not None:
+            self._keys.release()
+            self._values.release()
+            self._keys = self._values = None
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+    def __len__(self):
+        self._open()
+        return len(self._keys)
+
+    def lookup(self, keys, default=None):
+        """Look up several keys at once.
+
+        Required arguments:
+        keys -- an iterable of strings. Repeated keys are looked up once.
+
+        Keyword arguments:
+        default -- the value of the keys that are not in the lexicon
+            (default None).
+
+        Returns: a dictionary that maps each key to its value (a float, or
+            a tuple of floats if the lexicon has more than one column).
+        """
+        self._open()
+        table_keys = self._keys
+        values = self._values
+        ncolumns = self.ncolumns
+        size = len(table_keys)
+
+        queries = sorted((key_hash(key), key) for key in set(keys))
+        result = {}
+        position = 0
+        for h, key in queries:
+            # The queries are sorted, so each search starts where the last
+            # one stopped.
+            position = bisect_left(table_keys, h, position, size)
+            if position < size and table_keys[position] == h:
+                if ncolumns == 1:
+                    result[key] = values[position]
+                else:
+                    start = position * ncolumns
+                    result[key] = tuple(values[start:start + ncolumns])
+            else:
+                result[key] = default
+        return result
+
+    def get(self, key, default=None):
+        """Look up a single key. See lookup.
+        """
+        return self.lookup([key], default)[key]
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __getstate__(self):
+        # The map is not pickled; each process maps the file again.
+        state = self.__dict__.copy()
+        state.update(_file=None, _map=None, _keys=None, _values=None)
+        return state
+
+
+_FREQUENCY_LEXICON_PATH = base_path + '/models/lexicons/frequencies.lex'
+
+
+def _load_frequency_lexicon():
+    return Lexicon(_FREQUENCY_LEXICON_PATH)
+
+
+registry.register('frequency_lexicon', _load_frequency_lexicon,
+                  identity='coh.tools.lexicon.Lexicon '
+                  'models/lexicons/frequencies.lex',
+                  files=[_FREQUENCY_LEXICON_PATH])
+
+frequency_lexicon = LazyModel('frequency_lexicon')
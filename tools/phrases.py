@@ -0,0 +1,153 @@
+#-*- coding: utf-8 -*-
+# phrases.py - Matching of fixed multi-word expressions.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import Counter, deque
+
+
+class PhraseMatcher(object):
+    """Finds the occurrences of a list of phrases (e.g., "por outro lado")
+    in sequences of tokens.
+
+    The phrases are compiled into an Aho-Corasick automaton whose symbols
+    are tokens, so a sequence is scanned once, token by token, no matter
+    how many phrases there are. When occurrences overlap, the leftmost one
+    is kept and, among those that start at the same token, the longest
+    (e.g., "mas também" rather than "mas").
+    """
+    def __init__(self, phrases):
+        """Form a matcher.
+
+        Required arguments:
+        phrases -- an iterable of pairs (phrase, label), where phrase is a
+            string of tokens separated by spaces, or a sequence of tokens,
+            and label is any hashable object. A phrase may be given more
+            than once, with different labels.
+        """
+        # The trie: the transitions of each state, and the labels of the
+        # phrase that ends at it.
+        self._transitions = [{}]
+        self._labels = [()]
+
+        for phrase, label in phrases:
+            if isinstance(phrase, str):
+                phrase = phrase.split()
+            if not phrase:
+                raise ValueError('empty phrase')
+
+            state = 0
+            for token in phrase:
+                next_state = self._transitions[state].get(token)
+                if next_state is None:
+                    next_state = len(self._transitions)
+                    self._transitions[state][token] = next_state
+                    self._transitions.append({})
+                    self._labels.append(())
+                state = next_state
+            if label not in self._labels[state]:
+                self._labels[state] += (label,)
+
+        self._compile()
+
+    def _compile(self):
+        """Compute, breadth-first, the failure link of each state (the
+            state of its longest proper suffix that is in the trie) and the
+            phrases that end at it, as pairs (length, labels), including
+            those that end at its suffixes.
+        """
+        depths = [0] * len(self._transitions)
+        self._failures = [0] * len(self._transitions)
+        self._outputs = [()] * len(self._transitions)
+
+        queue = deque()
+        for state in self._transitions[0].values():
+            depths[state] = 1
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            if self._labels[state]:
+                own = ((depths[state], self._labels[state]),)
+            else:
+                own = ()
+            self._outputs[state] = own + self._outputs[self._failures[state]]
+
+            for token, next_state in self._transitions[state].items():
+                failure = self._failures[state]
+                while failure and token not in self._transitions[failure]:
+                    failure = self._failures[failure]
+                self._failures[next_state] = \
+                    self._transitions[failure].get(token, 0)
+                depths[next_state] = depths[state] + 1
+                queue.append(next_state)
+
+    def finditer(self, tokens, accept=None):
+        """Iterate over the occurrences of the phrases in a sequence of
+            tokens, without overlaps.
+
+        Required arguments:
+        tokens -- an iterable of tokens.
+
+        Keyword arguments:
+        accept -- a function that takes the triple (start, end, labels) of
+            an occurrence and returns false if it must be ignored (e.g.,
+            because a token does not have the right tag). Occurrences are
+            filtered before overlaps are resolved, so an ignored occurrence
+            does not hide others. (default None)
+
+        Returns: an iterator of triples (start, end, labels), in the order
+            in which they appear; tokens[start:end] is the phrase, and
+            labels is the tuple of its labels.
+        """
+        transitions = self._transitions
+        failures = self._failures
+        outputs = self._outputs
+
+        candidates = []
+        state = 0
+        for i, token in enumerate(tokens):
+            while state and token not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(token, 0)
+            for length, labels in outputs[state]:
+                if accept is None or accept(i + 1 - length, i + 1, labels):
+                    candidates.append((i + 1 - length, -length, labels))
+
+        candidates.sort(key=lambda candidate: candidate[:2])
+        end = 0
+        for start, length, labels in candidates:
+            if start >= end:
+                end = start - length
+                yield start, end, labels
+
+    def count(self, sequences):
+        """Count the occurrences of the phrases in several sequences of
+            tokens (e.g., the sentences of a text). Phrases do not span
+            sequences.
+
+        Required arguments:
+        sequences -- an iterable of iterables of tokens.
+
+        Returns: a pair (total, counts), where total is the number of
+            occurrences, and counts is a Counter mapping each label to the
+            number of occurrences of phrases that have it.
+        """
+        total = 0
+        counts = Counter()
+        for tokens in sequences:
+            for _, _, labels in self.finditer(tokens):
+                total += 1
+                counts.update(labels)
+        return total, counts
@@ -0,0 +1,182 @@
+#-*- coding: utf-8 -*-
+# registry.py - Lazy loading of the models used by Coh-Metrix-Port.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import functools
+import hashlib
+import os
+
+
+def _factory_identity(factory):
+    if isinstance(factory, functools.partial):
+        return '%s(%s)' % (_factory_identity(factory.func),
+                           ', '.join([repr(arg) for arg in factory.args]
+                                     + ['%s=%r' % item for item in
+                                        sorted(factory.keywords.items())]))
+    return '%s.%s' % (factory.__module__,
+                      getattr(factory, '__qualname__', repr(factory)))
+
+
+class ModelRegistry(object):
+    """Keeps the models (tokenizers, taggers, etc.) used by the metrics, and
+    builds each one the first time it is needed.
+
+    Loading a model may be slow (reading a pickle, starting a JVM), so it is
+    not done at import time. Servers that want to pay this cost upfront can
+    call warmup().
+    """
+    def __init__(self):
+        self._factories = {}
+        self._identities = {}
+        self._files = {}
+        self._models = {}
+
+    def register(self, name, factory, identity=None, files=()):
+        """Register a model. If a model with the same name was already
+            loaded, it is discarded.
+
+        Required arguments:
+        name -- the name of the model (e.g., 'pos_tagger').
+        factory -- a function with no arguments that builds the model.
+
+        Keyword arguments:
+        identity -- a string that tells the model apart from the others
+            that may be registered under the same name (e.g., its class and
+            the path to its data), used by ResultCache to tell values
+            calculated with different models apart. If None, the qualified
+            name of the factory is used (and, for functools.partial
+            objects, their arguments), which is only enough when the
+            factory always builds the same model. (default None)
+        files -- the paths of the files the model is read from (e.g., a
+            tagger model or a lexicon). Their sizes and modification times
+            are part of the identity of the model, so that a file rebuilt
+            in place is seen as a different model. (default ())
+        """
+        if identity is None:
+            identity = _factory_identity(factory)
+        self._factories[name] = factory
+        self._identities[name] = identity
+        self._files[name] = tuple(files)
+        self._models.pop(name, None)
+
+    def identity(self, name):
+        """Return the identity of a model (see register), without building
+            it.
+
+        Required arguments:
+        name -- the name of the model.
+        """
+        return self._identities[name]
+
+    def fingerprint(self):
+        """Return a hexadecimal digest of the identities of all registered
+            models, and of the sizes and modification times of their files,
+            that changes whenever one of them is replaced by a different
+            one, or its files are rebuilt.
+        """
+        lines = []
+        for name in sorted(self._identities):
+            lines.append('%s=%s' % (name, self._identities[name]))
+            for path in self._files[name]:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    lines.append('%s missing' % path)
+                else:
+                    lines.append('%s %d %d' % (path, stat.st_size,
+                                               stat.st_mtime_ns))
+        return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+
+    def get(self, name):
+        """Return a model, building it if it was not used yet.
+
+        Required arguments:
+        name -- the name of the model.
+        """
+        try:
+            return self._models[name]
+        except KeyError:
+            model = self._models[name] = self._factories[name]()
+            return model
+
+    def is_loaded(self, name):
+        """Return true if the model has already been built.
+        """
+        return name in self._models
+
+    def warmup(self, names=None):
+        """Build models now, instead of waiting for their first use. Models
+            that have a warmup() method (e.g., taggers that run external
+            processes) have it called, too.
+
+        Keyword arguments:
+        names -- a list of model names. If None, all registered models are
+            built. (default None)
+        """
+        if names is None:
+            names = sorted(self._factories)
+
+        for name in names:
+            model = self.get(name)
+            if hasattr(model, 'warmup'):
+                model.warmup()
+
+    def __contains__(self, name):
+        return name in self._factories
+
+
+registry = ModelRegistry()
+
+
+class LazyModel(object):
+    """A stand-in for a model of a ModelRegistry. The model is only built
+    when one of its attributes is accessed (or when it is called), and
+    all accesses are forwarded to it.
+    """
+    def __init__(self, name, registry=registry):
+        """Form a lazy model.
+
+        Required arguments:
+        name -- the name of the model in the registry.
+
+        Keyword arguments:
+        registry -- the registry the model belongs to (default: the
+            registry of Coh-Metrix-Port's models).
+        """
+        self._name = name
+        self._registry = registry
+
+    def __getattr__(self, attr):
+        # Private attributes are never forwarded, so that a half-built
+        # object (e.g., while being copied) does not recurse.
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return getattr(self._registry.get(self._name), attr)
+
+    def __call__(self, *args, **kwargs):
+        return self._registry.get(self._name)(*args, **kwargs)
+
+    def __str__(self):
+        return '<LazyModel: %s>' % self._name
+
+
+def warmup(*names):
+    """Load Coh-Metrix-Port's models now, instead of on first use.
+
+    Optional arguments:
+    names -- the names of the models to be loaded (e.g., 'pos_tagger',
+        'senter'). If no name is given, all models are loaded.
+    """
+    registry.warmup(names or None)
@@ -1,4 +1,13 @@
+from coh.tools.registry import registry, LazyModel
+from coh.tools.syllable.api import SyllableSeparator, CachedSyllableSeparator
 from coh.tools.syllable.silva2011 import Silva2011SyllableSeparator
-from coh.tools.syllable.ceci import CECISyllableSeparator
 
-syllable_separator = CECISyllableSeparator()
+
+def _load_syllable_separator():
+    from coh.tools.syllable.ceci import CECISyllableSeparator
+    return CachedSyllableSeparator(CECISyllableSeparator())
+
+
+registry.register('syllable_separator', _load_syllable_separator)
+
+syllable_separator = LazyModel('syllable_separator')
@@ -1,3 +1,9 @@
+from collections import OrderedDict
+import codecs
+import json
+import os
+
+
 class SyllableSeparator(object):
     """This class defines the basic interface for syllable separators.
     """
@@ -60,3 +66,90 @@ class SyllableSeparator(object):
                 print('Accuracy: {0:.2f}%'.format(accuracy))
 
             return accuracy
+
+
+class CachedSyllableSeparator(SyllableSeparator):
+    """A syllable separator that memoizes the results of another one.
+
+    Word frequencies are very skewed, so most calls are answered from the
+    cache. The cache is bounded: when it is full, the least recently used
+    word is discarded. It can also be saved to a file and loaded back, so
+    it survives between runs.
+    """
+    def __init__(self, separator, maxsize=100000, path=None,
+                 encoding='utf-8'):
+        """Form a cached separator.
+
+        Required arguments:
+        separator -- the SyllableSeparator whose results will be cached.
+
+        Keyword arguments:
+        maxsize -- the maximum number of words kept in the cache. If None,
+            the cache is unbounded. (default 100000)
+        path -- a file previously written by save(). If it exists, its
+            contents are loaded into the cache. (default None)
+        encoding -- the encoding of the cache file (default "utf-8").
+        """
+        self.separator = separator
+        self.maxsize = maxsize
+        self.path = path
+        self.encoding = encoding
+
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def separate(self, word):
+        try:
+            syllables = self._cache[word]
+        except KeyError:
+            self.misses += 1
+            syllables = self.separator.separate(word)
+            self._store(word, syllables)
+        else:
+            self.hits += 1
+            self._cache.move_to_end(word)
+
+        # Return a copy, so callers cannot modify the cached value.
+        return syllables[:]
+
+    def _store(self, word, syllables):
+        self._cache[word] = syllables
+        if self.maxsize is not None and len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self):
+        """Empty the cache and reset the hit and miss counters.
+        """
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path=None):
+        """Write the contents of the cache to a file.
+
+        Keyword arguments:
+        path -- the file to be written. If None, the path given to the
+            constructor is used. (default None)
+        """
+        if path is None:
+            path = self.path
+
+        with codecs.open(path, mode='w', encoding=self.encoding) as out:
+            json.dump(list(self._cache.items()), out, ensure_ascii=False)
+
+    def load(self, path):
+        """Add the contents of a file written by save() to the cache.
+
+        Required arguments:
+        path -- the file to be read.
+        """
+        with codecs.open(path, mode='r', encoding=self.encoding) as in_:
+            for word, syllables in json.load(in_):
+                self._store(word, syllables)
+
+    def __len__(self):
+        return len(self._cache)
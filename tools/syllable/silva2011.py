@@ -53,6 +53,36 @@ CN = ['m', 'n']
 # Consonants
 C = ['lh', 'nh'] + CO + CF + CL + CN
 
+# The classes above, and the unions of classes tested by the rules, as
+# frozensets. They are built once here, instead of concatenating lists
+# and searching them linearly at every step of the separation loop.
+_V = frozenset(V)
+_G = frozenset(G)
+_C = frozenset(C)
+_CO = frozenset(CO)
+_CF = frozenset(CF)
+_CL = frozenset(CL)
+_CN = frozenset(CN)
+
+_V_G = _V | _G
+_C_V = _C | _V
+_C_G = _C | _G
+_G_CN = _G | _CN
+_CN_r = _CN | {'r'}
+_CL_CO = _CL | _CO
+_V_i = _V | {'i'}
+_V_hlr = _V | {'h', 'l', 'r'}
+_V_G_CL_h = _V | _G | _CL | {'h'}
+_V_CL_CN_cx = _V | _CL | _CN | {'c', 'x'}
+_G_CN_srlx = _G | _CN | {'s', 'r', 'l', 'x'}
+_CO_CF = _CO | _CF | {'g', 'p'}
+_CO_CF_CN = _CO | _CF | _CN | {'ç'}
+_CO_fvg = _CO | {'f', 'v', 'g'}
+_CL_CN_i = _CL | _CN | {'i'}
+_C_uq = _C | {'u', 'ü', 'q'}
+
+_vowel = re.compile('a|e|o|i|u|á|é|í|ó|ú|ã|õ|â|ê|ô|à|ü')
+
 
 class Silva2011SyllableSeparator(SyllableSeparator):
     """This class implements the syllabic separation algorithm presented in
@@ -72,8 +102,7 @@ class Silva2011SyllableSeparator(SyllableSeparator):
         Returns:
         A list of strings, containing each syllable of the word.
         """
-        vowels = 'a|e|o|i|u|á|é|í|ó|ú|ã|õ|â|ê|ô|à|ü'
-        p = [match.start() for match in re.finditer(vowels, w, re.UNICODE)]
+        p = [match.start() for match in _vowel.finditer(w)]
         p0 = 0  # syllable start position
         pVt = tonic_vowel(w)  # tonic vowel position
         k = 0
@@ -84,16 +113,21 @@ class Silva2011SyllableSeparator(SyllableSeparator):
             return [w]
 
         while p0 <= (len(w) - 1):
+            # The rules only read the word and the vowel positions; they are
+            # changed by the case functions, at the end of each step.
+            n = len(w)
+            pk = p[k]
+
             # Rule 1:
-            if p[k] + 1 < len(w)\
-                    and w[p0] in V\
-                    and not w[p[k]] in ['ã', 'õ']\
-                    and w[p[k] + 1] in V\
-                    and not w[p[k] + 1] in G:
+            if pk + 1 < n\
+                    and w[p0] in _V\
+                    and not w[pk] in ['ã', 'õ']\
+                    and w[pk + 1] in _V\
+                    and not w[pk + 1] in _G:
                 # print "RULE 1"
-                if p[k] + 3 < len(w)\
-                        and w[p[k] + 2] == 's'\
-                        and p[k] + 3 == len(w):
+                if pk + 3 < n\
+                        and w[pk + 2] == 's'\
+                        and pk + 3 == n:
                     # print "RULE 1.1"
                     return w
                 else:
@@ -101,44 +135,44 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
 
             # Rule 2:
-            elif p[k] + 3 < len(w)\
-                    and w[p0] in V\
-                    and w[p[k] + 1] in C\
-                    and w[p[k] + 2] in C\
-                    and w[p[k] + 3] in CO:
+            elif pk + 3 < n\
+                    and w[p0] in _V\
+                    and w[pk + 1] in _C\
+                    and w[pk + 2] in _C\
+                    and w[pk + 3] in _CO:
                 # print "RULE 2"
                 w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
 
             # Rule 3:
-            elif p[k] + 2 < len(w)\
-                    and w[p0] in V\
-                    and w[p[k] + 1] in G + CN + ['s', 'r', 'l', 'x']\
-                    and w[p[k] + 2] in C:
+            elif pk + 2 < n\
+                    and w[p0] in _V\
+                    and w[pk + 1] in _G_CN_srlx\
+                    and w[pk + 2] in _C:
                 # TODO Problema "arr".
                 # Exemplo: arrendar -> a-rre-dar (N) | ar-ren-dar (Y)
                 # print "RULE 3"
-                if w[p[k] + 1] == 'i'\
-                        and w[p[k] + 2] in CN:  # NOVA REGRA, p.ex: "ainda"
+                if w[pk + 1] == 'i'\
+                        and w[pk + 2] in _CN:  # NOVA REGRA, p.ex: "ainda"
                     # print "RULE 3.0"
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
-                elif not w[p[k] + 2] in ['s', 'h']\
-                        and w[p[k] + 1] != w[p[k] + 2]:
+                elif not w[pk + 2] in ['s', 'h']\
+                        and w[pk + 1] != w[pk + 2]:
                     # print "RULE 3.1"
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
-                elif p[k] + 3 < len(w)\
-                        and w[p[k] + 1] in CN\
-                        and w[p[k] + 2] == 's'\
-                        and not w[p[k] + 3] in V:
+                elif pk + 3 < n\
+                        and w[pk + 1] in _CN\
+                        and w[pk + 2] == 's'\
+                        and not w[pk + 3] in _V:
                     # print "RULE 3.2"
                     w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
-                elif w[p[k] + 1] == w[p[k] + 2]\
-                        or w[p[k] + 2] == 'h':
+                elif w[pk + 1] == w[pk + 2]\
+                        or w[pk + 2] == 'h':
                     # print "RULE 3.3"
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
-                elif p[k] + 3 < len(w)\
-                        and w[p[k] + 2] == 's'\
-                        and ((w[p[k] + 3] in C and w[p[k] + 3] != 's')
-                             or not w[p[k] + 3] in C + V):
+                elif pk + 3 < n\
+                        and w[pk + 2] == 's'\
+                        and ((w[pk + 3] in _C and w[pk + 3] != 's')
+                             or not w[pk + 3] in _C_V):
                     # print "RULE 3.4"
                     w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
                 else:
@@ -146,118 +180,118 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
 
             # Rule 4:
-            elif p[k] + 3 < len(w)\
-                    and w[p0] in V\
-                    and w[p[k] + 1] in CO + CF + ['g', 'p']\
-                    and w[p[k] + 2] in CO + CF + CN + ['ç']\
-                    and w[p[k] + 3] in V + G:
+            elif pk + 3 < n\
+                    and w[p0] in _V\
+                    and w[pk + 1] in _CO_CF\
+                    and w[pk + 2] in _CO_CF_CN\
+                    and w[pk + 3] in _V_G:
 
                 # print "RULE 4"
-                # TODO adicionando um G ao w[p[k] + 3], p.ex: ab-di-car
-                if w[p[k] + 1] == w[p[k] + 2]:
+                # TODO adicionando um G ao w[pk + 3], p.ex: ab-di-car
+                if w[pk + 1] == w[pk + 2]:
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
                 else:
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
 
             # Rule 5:
-            elif p[k] + 2 < len(w)\
-                    and w[p0] in V\
-                    and w[p[k] + 1] in C\
-                    and w[p[k] + 2] in V + G + CL + ['h']:
+            elif pk + 2 < n\
+                    and w[p0] in _V\
+                    and w[pk + 1] in _C\
+                    and w[pk + 2] in _V_G_CL_h:
                 # print "RULE 5"
                 w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
 
             # Rule 6:
-            elif p[k] + 3 < len(w)\
-                    and w[p0] in V\
-                    and w[p[k] + 1] in G\
-                    and w[p[k] + 2] == 's'\
-                    and w[p[k] + 3] in CO:
+            elif pk + 3 < n\
+                    and w[p0] in _V\
+                    and w[pk + 1] in _G\
+                    and w[pk + 2] == 's'\
+                    and w[pk + 3] in _CO:
                 # TODO Regra 6 esta dentro da regra 3
                 # print "RULE 6"
                 w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
 
             # Rule 7:
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C + ['u', 'ü', 'q']\
-                    and w[p[k] + 1] in C\
-                    and w[p[k] + 2] in V:
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C_uq\
+                    and w[pk + 1] in _C\
+                    and w[pk + 2] in _V:
                 # print "RULE 7"
                 w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
 
             # Rule 8:
-            elif p[k] + 3 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C\
-                    and w[p[k] + 1] in G\
-                    and w[p[k] + 2] == 'r'\
-                    and w[p[k] + 3] in C:
+            elif pk + 3 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C\
+                    and w[pk + 1] in _G\
+                    and w[pk + 2] == 'r'\
+                    and w[pk + 3] in _C:
                 # print "RULE 8"
-                # if p[k] == pVt:
+                # if pk == pVt:
                 #    w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
                 # else:
                 w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
 
             # Rule 9:
-            elif p[k] + 3 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C\
-                    and w[p[k] + 1] in G + CN\
-                    and w[p[k] + 2] == 's'\
-                    and w[p[k] + 3] in CO:
+            elif pk + 3 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C\
+                    and w[pk + 1] in _G_CN\
+                    and w[pk + 2] == 's'\
+                    and w[pk + 3] in _CO:
                 # print "RULE 9"
                 w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
 
             # Rule 10:
-            elif p[k] + 3 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C + G\
-                    and w[p[k] + 1] in ['i', 'u', 'e', 'o']\
-                    and p[k] + 1 != pVt\
-                    and w[p[k]] != w[p[k] + 1]\
-                    and w[p[k] + 2] in C\
-                    and w[p[k] + 3] in C + V\
-                    and w[p[k] + 2] != 's':
+            elif pk + 3 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C_G\
+                    and w[pk + 1] in ['i', 'u', 'e', 'o']\
+                    and pk + 1 != pVt\
+                    and w[pk] != w[pk + 1]\
+                    and w[pk + 2] in _C\
+                    and w[pk + 3] in _C_V\
+                    and w[pk + 2] != 's':
                 # print "RULE 10"
                 # a-juizado
-                if p[k] == pVt\
-                        and w[p[k] + 2] != 'n'\
-                        and not w[p[k] + 3] in C:
+                if pk == pVt\
+                        and w[pk + 2] != 'n'\
+                        and not w[pk + 3] in _C:
                     # print "RULE 10.1"
                     w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
-                elif not w[p[k] - 1] in ['q', 'g']\
-                        and w[p[k]] == 'u'\
-                        and w[p[k] + 1] == 'i'\
-                        and w[p[k] + 2] != 'n':
+                elif not w[pk - 1] in ['q', 'g']\
+                        and w[pk] == 'u'\
+                        and w[pk + 1] == 'i'\
+                        and w[pk + 2] != 'n':
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
-                elif p[k] != pVt\
-                        and w[p[k] + 1] == 'i'\
-                        and w[p[k] + 2] != 'n':
+                elif pk != pVt\
+                        and w[pk + 1] == 'i'\
+                        and w[pk + 2] != 'n':
                     # print "RULE 10.2"
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
-                elif (w[p[k] + 1] != 'i'
-                      and w[p[k] + 2] in CN + ['r']
-                      and not w[p[k] + 3] in ['h', w[pVt]])\
-                        or (w[p[k]] in ['a', 'e', 'o']
-                            and w[p[k] + 1] in ['a', 'e', 'o']
-                            and w[p[k] + 2] in CN
-                            and not w[p[k] + 3] in ['h', 's']
-                            and w[p[k] + 4] in V + C):
+                elif (w[pk + 1] != 'i'
+                      and w[pk + 2] in _CN_r
+                      and not w[pk + 3] in ['h', w[pVt]])\
+                        or (w[pk] in ['a', 'e', 'o']
+                            and w[pk + 1] in ['a', 'e', 'o']
+                            and w[pk + 2] in _CN
+                            and not w[pk + 3] in ['h', 's']
+                            and w[pk + 4] in _C_V):
                     # print "RULE 10.3"
-                    if w[p[k] - 1:p[k] + 1] == "gu"\
-                            and w[p[k] + 1] in V\
-                            and w[p[k] + 2] in CN:
+                    if w[pk - 1:pk + 1] == "gu"\
+                            and w[pk + 1] in _V\
+                            and w[pk + 2] in _CN:
                         w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
-                    elif w[p[k] - 1:p[k] + 1] == "gu"\
-                            and w[p[k] + 1] in V\
-                            and w[p[k] + 2] in CL:
+                    elif w[pk - 1:pk + 1] == "gu"\
+                            and w[pk + 1] in _V\
+                            and w[pk + 2] in _CL:
                         w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
                     else:
                         w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
-                elif w[p[k]] in G\
-                        and w[p[k] + 1] in ['a', 'e', 'o']\
-                        and w[p[k] + 2] in CN:
+                elif w[pk] in _G\
+                        and w[pk + 1] in ['a', 'e', 'o']\
+                        and w[pk + 2] in _CN:
                     # print "RULE 10.4"
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
                 else:
@@ -265,35 +299,35 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
 
             # Rule 11:
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C\
-                    and w[p[k] + 1] in G\
-                    and w[p[k] + 2] in V:
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C\
+                    and w[pk + 1] in _G\
+                    and w[pk + 2] in _V:
                 # print "RULE 11"
                 w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
 
             # Rule 12:
-            elif p[k] + 3 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C\
-                    and w[p[k]] in G\
-                    and w[p[k] + 1] in V + ['i']\
-                    and w[p[k]] != w[p[k] + 1]\
-                    and w[p[k] + 2] in C\
-                    and w[p[k] + 3] in V:
+            elif pk + 3 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C\
+                    and w[pk] in _G\
+                    and w[pk + 1] in _V_i\
+                    and w[pk] != w[pk + 1]\
+                    and w[pk + 2] in _C\
+                    and w[pk + 3] in _V:
                 # TODO Agregue un "i" as vogais
                 #   porque sino no entra ao exemplo.
                 # print "RULE 12"
-                if w[p[k] - 1] in ['q', 'g']\
-                   and ((w[p[k] + 2] == 'ç'
-                         and w[p[k] + 3] in ['ã', 'õ'])
-                        or (w[p[k] - 1] == 'q'
-                            and w[p[k] + 1] in V)):
+                if w[pk - 1] in ['q', 'g']\
+                   and ((w[pk + 2] == 'ç'
+                         and w[pk + 3] in ['ã', 'õ'])
+                        or (w[pk - 1] == 'q'
+                            and w[pk + 1] in _V)):
                     # print "RULE 12.1"
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
-                elif p[k] + 1 == pVt\
-                        or w[p[k] - 1] == 'r' and p[k] + 3 == pVt:
+                elif pk + 1 == pVt\
+                        or w[pk - 1] == 'r' and pk + 3 == pVt:
                     # print "RULE 12.2"
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
                 else:
@@ -301,19 +335,19 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case8(w, p, p0, pVt, k, c)
 
             # Rule 13:
-            elif p[k] + 3 < len(w)\
-                    and not w[p0] in V\
-                    and (w[p[k] - 1] in C
-                         or (w[p[k] - 1:p[k] + 1]
+            elif pk + 3 < n\
+                    and not w[p0] in _V\
+                    and (w[pk - 1] in _C
+                         or (w[pk - 1:pk + 1]
                              in ['qu', 'qü', 'gu', 'gü']))\
-                    and w[p[k] + 1] in V + CL + CN + ['c', 'x']\
-                    and w[p[k] + 2] in ['h', 'l', 'r']\
-                    and w[p[k] + 3] in V + ['h', 'l', 'r']:
+                    and w[pk + 1] in _V_CL_CN_cx\
+                    and w[pk + 2] in ['h', 'l', 'r']\
+                    and w[pk + 3] in _V_hlr:
                 # TODO Arrumando regra para "guerra" -> gue-rra
                 # print "RULE 13"
-                if w[p[k] + 1] == w[p[k] + 2]\
-                        or w[p[k] + 1] in ['c', 'l']\
-                        or w[p[k] + 1:p[k] + 3] == 'nh':
+                if w[pk + 1] == w[pk + 2]\
+                        or w[pk + 1] in ['c', 'l']\
+                        or w[pk + 1:pk + 3] == 'nh':
                     # print "RULE 13.1"
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
                 else:
@@ -321,30 +355,30 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
 
             # Rule 14:
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C\
-                    and w[p[k] + 1] in CL + CN + ['i']\
-                    and w[p[k] + 2] == 's':
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C\
+                    and w[pk + 1] in _CL_CN_i\
+                    and w[pk + 2] == 's':
                 # print "RULE 14"
-                if p[k] + 3 == len(w):
+                if pk + 3 == n:
                     p0 = case6(w, p0)
-                elif p[k] == pVt or (p[k] + 3 < len(w) and w[p[k] + 3] in V):
+                elif pk == pVt or (pk + 3 < n and w[pk + 3] in _V):
                     w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
                 else:
                     w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
 
             # Rule 15:
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] + 1] in V\
-                    and w[p[k] + 2] in V + G\
-                    and not w[p[k] - 1:p[k] + 1] in ['qu', 'gu']:
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and w[pk + 1] in _V\
+                    and w[pk + 2] in _V_G\
+                    and not w[pk - 1:pk + 1] in ['qu', 'gu']:
                 # print "RULE 15", w[p0]
-                if p[k] + 3 < len(w)\
-                        and p[k] == pVt\
-                        and w[p[k] + 1] in G\
-                        and w[p[k] + 3] in C:
+                if pk + 3 < n\
+                        and pk == pVt\
+                        and w[pk + 1] in _G\
+                        and w[pk + 3] in _C:
                     # print "RULE 15.1"
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
                 else:
@@ -352,67 +386,67 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
 
             # Rule 16:
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k]] != 'u'\
-                    and w[p[k] - 1] in C\
-                    and w[p[k] + 1] in V\
-                    and w[p[k] + 2] in CN:
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and w[pk] != 'u'\
+                    and w[pk - 1] in _C\
+                    and w[pk + 1] in _V\
+                    and w[pk + 2] in _CN:
                 # print "RULE 16"
                 w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
 
             # Rule 17:
-            elif p[k] + 1 < len(w)\
-                    and p[k] - 2 >= 0\
-                    and not w[p0] in V\
-                    and w[p[k]] == 'i'\
-                    and (w[p[k] - 2] in ['á', 'é', 'í', 'ó', 'ú']
-                         or w[p[k] - 3] in ['á', 'é', 'í', 'ó', 'ú'])\
-                    and w[p[k] - 1] in C\
-                    and w[p[k] + 1] in ['a', 'o']:
+            elif pk + 1 < n\
+                    and pk - 2 >= 0\
+                    and not w[p0] in _V\
+                    and w[pk] == 'i'\
+                    and (w[pk - 2] in ['á', 'é', 'í', 'ó', 'ú']
+                         or w[pk - 3] in ['á', 'é', 'í', 'ó', 'ú'])\
+                    and w[pk - 1] in _C\
+                    and w[pk + 1] in ['a', 'o']:
                 # TODO trocar caso 6 por caso 1.
                 # carícia -> ca-rí-cia (N) | ca-rí-ci-a (Y)
                 # print "RULE 17"
                 w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
 
             # Rule 18:
-            elif p[k] + 1 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k]] in ['ã', 'õ']\
-                    and w[p[k] - 1] in C\
-                    and w[p[k] + 1] in ['e', 'o']:
+            elif pk + 1 < n\
+                    and not w[p0] in _V\
+                    and w[pk] in ['ã', 'õ']\
+                    and w[pk - 1] in _C\
+                    and w[pk + 1] in ['e', 'o']:
                 # print "RULE 18"
                 p0 = case6(w, p0)
 
             # -------------------- Change rule 19 by 20 --------------------
             # Rule 20:
-            elif p[k] + 3 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C\
-                    and w[p[k] + 1] in V\
-                    and w[p[k] + 2] in CN\
-                    and w[p[k] + 3] in C:
+            elif pk + 3 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C\
+                    and w[pk + 1] in _V\
+                    and w[pk + 2] in _CN\
+                    and w[pk + 3] in _C:
                 # print "RULE 20"
                 w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
 
             # Rule 19:
-            elif p[k] + 1 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C\
-                    and p[k] + 1 == pVt\
-                    and not w[p[k] + 1] in ['i', 'u']\
-                    and not w[p[k] - 1:p[k] + 1] in ['gu', 'qu']:
+            elif pk + 1 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C\
+                    and pk + 1 == pVt\
+                    and not w[pk + 1] in ['i', 'u']\
+                    and not w[pk - 1:pk + 1] in ['gu', 'qu']:
                 # print "RULE 19"
-                if p[k] + 3 == len(w)\
-                        and w[p[k] - 1:p[k] + 1] in ['gu', 'qu']\
-                        and w[p[k] + 1] in V\
-                        and w[p[k] + 2] in C:
+                if pk + 3 == n\
+                        and w[pk - 1:pk + 1] in ['gu', 'qu']\
+                        and w[pk + 1] in _V\
+                        and w[pk + 2] in _C:
                     # print "RULE 19.1"
                     p0 = case6(w, p0)
-                elif p[k] + 2 < len(w)\
-                        and w[p[k] - 1:p[k] + 1] in ['gu', 'qu']\
-                        and w[p[k] + 1] in V\
-                        and w[p[k] + 2] in C + G:
+                elif pk + 2 < n\
+                        and w[pk - 1:pk + 1] in ['gu', 'qu']\
+                        and w[pk + 1] in _V\
+                        and w[pk + 2] in _C_G:
                     # print "RULE 19.2"
                     w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
                 else:
@@ -420,14 +454,14 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
 
             # Rule 21:
-            elif p[k] + 3 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] + 1] in CO + ['f', 'v', 'g']\
-                    and w[p[k] + 2] in CL + CO\
-                    and w[p[k] + 3] in V + G:
+            elif pk + 3 < n\
+                    and not w[p0] in _V\
+                    and w[pk + 1] in _CO_fvg\
+                    and w[pk + 2] in _CL_CO\
+                    and w[pk + 3] in _V_G:
                 # print "RULE 21"
-                if w[p[k] + 1] in ['f', 'p']\
-                        and w[p[k] + 2] in ['t', 'ç']:
+                if w[pk + 1] in ['f', 'p']\
+                        and w[pk + 2] in ['t', 'ç']:
                     # print "RULE 21.1"
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
                 else:
@@ -435,57 +469,57 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
 
             # Rule 22:
-            elif p[k] + 1 < len(w)\
-                    and p[k] - 2 >= 0\
-                    and not w[p0] in V\
-                    and (w[p[k] - 1] in C
-                         or w[p[k] - 1:p[k] + 1] in ['qu', 'gu'])\
-                    and w[p[k] + 1] in V\
-                    and (p[k] + 2 == len(w)
-                         or w[p[k] + 2] in C):
+            elif pk + 1 < n\
+                    and pk - 2 >= 0\
+                    and not w[p0] in _V\
+                    and (w[pk - 1] in _C
+                         or w[pk - 1:pk + 1] in ['qu', 'gu'])\
+                    and w[pk + 1] in _V\
+                    and (pk + 2 == n
+                         or w[pk + 2] in _C):
                 # print "RULE 22"
-                if (w[p[k]] in ['i', 'u', 'í', 'ú', 'é', 'ê']
-                    and p[k] == pVt
-                    and w[p[k] + 1] != 'u')\
-                        or (p[k] + 3 < len(w)
-                            and not w[p[k]] in G
-                            and w[p[k] + 2] == 's'
-                            and not w[p[k] + 3] in C + V):
+                if (w[pk] in ['i', 'u', 'í', 'ú', 'é', 'ê']
+                    and pk == pVt
+                    and w[pk + 1] != 'u')\
+                        or (pk + 3 < n
+                            and not w[pk] in _G
+                            and w[pk + 2] == 's'
+                            and not w[pk + 3] in _C_V):
                     # print "RULE 22.1"
                     w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
-                elif p[k] + 2 == len(w)\
-                        and w[p[k]] == 'i'\
-                        and p[k] == pVt\
-                        and w[p[k] + 1] == 'u':
+                elif pk + 2 == n\
+                        and w[pk] == 'i'\
+                        and pk == pVt\
+                        and w[pk + 1] == 'u':
                     # print "RULE 22.2"
                     w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
-                elif p[k] + 3 < len(w)\
-                        and ((w[p[k]] in G
-                              and p[k] + 1 != pVt
-                              and not w[p[k] + 2] in C + V)
-                             or (w[p[k] + 2] == 's'
-                                 and not w[p[k] + 3] in C + V)
-                             or (p[k] != pVt
-                             and p[k] + 1 != pVt
-                             and w[p[k] + 2] == 's'
-                             and p[k] + 3 == len(w))):
+                elif pk + 3 < n\
+                        and ((w[pk] in _G
+                              and pk + 1 != pVt
+                              and not w[pk + 2] in _C_V)
+                             or (w[pk + 2] == 's'
+                                 and not w[pk + 3] in _C_V)
+                             or (pk != pVt
+                             and pk + 1 != pVt
+                             and w[pk + 2] == 's'
+                             and pk + 3 == n)):
                     # print "RULE 22.3"
                     p0 = case6(w, p0)
-                elif p[k] + 3 < len(w)\
-                        and w[p[k] - 1:p[k] + 1] in ['qu', 'gu']\
-                        and w[p[k] + 2] in C\
-                        and w[p[k] + 3] in V + G:
+                elif pk + 3 < n\
+                        and w[pk - 1:pk + 1] in ['qu', 'gu']\
+                        and w[pk + 2] in _C\
+                        and w[pk + 3] in _V_G:
                     # print "RULE 22.4"
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
-                elif p[k] + 2 == len(w)\
-                        and w[p[k] - 1:p[k] + 1] in ['qu', 'gu']\
-                        and w[p[k] + 1] in V + G:
+                elif pk + 2 == n\
+                        and w[pk - 1:pk + 1] in ['qu', 'gu']\
+                        and w[pk + 1] in _V_G:
                     # print "RULE 22.4.5"
                     p0 = case6(w, p0)
-                elif p[k] + 3 == len(w)\
-                        and w[p[k] + 1] in ['o', 'u']\
-                        and p[k] + 1 != pVt\
-                        and w[p[k] + 2] == 's':
+                elif pk + 3 == n\
+                        and w[pk + 1] in ['o', 'u']\
+                        and pk + 1 != pVt\
+                        and w[pk + 2] == 's':
                     # print "RULE 22.5"
                     w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
                 else:
@@ -494,23 +528,23 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
 
             # Rule 23:
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and (w[p[k] - 1] in C
-                         or w[p[k] - 2:p[k] - 1] == "qu")\
-                    and w[p[k] + 1] in C\
-                    and w[p[k] + 2] in C:
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and (w[pk - 1] in _C
+                         or w[pk - 2:pk - 1] == "qu")\
+                    and w[pk + 1] in _C\
+                    and w[pk + 2] in _C:
                 # print "RULE 23"
-                if w[p[k] + 1] == w[p[k] + 2]:
+                if w[pk + 1] == w[pk + 2]:
                     # print "RULE 23.1"
                     w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
-                elif w[p[k] + 1] == 's'\
-                        and w[p[k] + 2] != 's':
+                elif w[pk + 1] == 's'\
+                        and w[pk + 2] != 's':
                     # print "RULE 23.2"
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
-                elif p[k] + 3 < len(w)\
-                        and w[p[k] + 2] == 's'\
-                        and w[p[k] + 3] in CO:
+                elif pk + 3 < n\
+                        and w[pk + 2] == 's'\
+                        and w[pk + 3] in _CO:
                     # print "RULE 23.3"
                     w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
                 else:  # Adicionando ELSE
@@ -518,10 +552,10 @@ class Silva2011SyllableSeparator(SyllableSeparator):
                     w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
 
             # Rule 24:
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] + 1] in C\
-                    and w[p[k] + 2] in G:
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and w[pk + 1] in _C\
+                    and w[pk + 2] in _G:
                 # Regra 24 igual a 23. Arrumar regra, p.ex: di-sen-"teria"
                 # print "RULE 24"
                 w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
@@ -529,49 +563,49 @@ class Silva2011SyllableSeparator(SyllableSeparator):
             # Rule 25: Already aplicated
 
             # Rule 26:
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and (w[p[k] - 1] in C
-                         or (w[p[k] - 1:p[k] + 1]
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and (w[pk - 1] in _C
+                         or (w[pk - 1:pk + 1]
                              in ['qu', 'qü', 'gu', 'gü']))\
-                    and w[p[k] + 1] in G\
-                    and w[p[k] + 2] in CN:
+                    and w[pk + 1] in _G\
+                    and w[pk + 2] in _CN:
                 # Manual: a-mi-gui-nho | Automatic: a-mi-gu-i-nho
                 # print "RULE 26"
                 w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
 
             # Rule 27:
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1] in C\
-                    and w[p[k] - 2] in C\
-                    and w[p[k] + 1] in G\
-                    and w[p[k] + 2] in C:
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1] in _C\
+                    and w[pk - 2] in _C\
+                    and w[pk + 1] in _G\
+                    and w[pk + 2] in _C:
                 # print "RULE 27"
                 w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
 
             # Rule 28
-            elif p[k] + 2 < len(w)\
-                    and not w[p0] in V\
-                    and w[p[k] - 1:p[k] + 1] in ['qu', 'qü', 'gu', 'gü']\
-                    and w[p[k] + 1] in V:
+            elif pk + 2 < n\
+                    and not w[p0] in _V\
+                    and w[pk - 1:pk + 1] in ['qu', 'qü', 'gu', 'gü']\
+                    and w[pk + 1] in _V:
                 # print "RULE 28"
-                if p[k] + 3 < len(w)\
-                        and w[p[k] + 2] in C\
-                        and w[p[k] + 3] in C:
+                if pk + 3 < n\
+                        and w[pk + 2] in _C\
+                        and w[pk + 3] in _C:
                     # print "RULE 28.1"
                     w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
-                elif p[k] + 3 < len(w)\
-                        and w[p[k] + 2] in C\
-                        and w[p[k] + 3] in V + G:
+                elif pk + 3 < n\
+                        and w[pk + 2] in _C\
+                        and w[pk + 3] in _V_G:
                     # print "RULE 28.2"
                     w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
-                elif p[k] + 2 < len(w)\
-                        and w[p[k] + 2] in V:
+                elif pk + 2 < n\
+                        and w[pk + 2] in _V:
                     # print "RULE 28.3"
                     w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
-                elif p[k] + 2 < len(w)\
-                        and w[p[k] + 2] in G:
+                elif pk + 2 < n\
+                        and w[pk + 2] in _G:
                     # print "RULE 28.4"
                     w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
 
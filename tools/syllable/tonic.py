@@ -24,6 +24,75 @@ import codecs
 from sys import argv
 
 
+# Rule 1: accented vowels (see tonic_vowel).
+_accented_vowel = re.compile('á|é|í|ó|ú|â|ê|ô|à|ã|õ')
+
+# Rules 2 to 16 only look at the end of the word. Each one is a pair
+# (pattern, position), where pattern is matched against the *reversed* word,
+# and the tonic vowel is at len(word) - position. In the comments, ^(i) is
+# the i-th letter from the end of the word.
+_consonants = 'bdfghjklmnñpqrstvxyz'
+_suffix_rules = [
+    # Rule 2: if ^(0) = {r,l,z,x,n} then T = 1
+    ('[rlzxn]', 2),
+    # Rule 3: if ^(0) = {m} & ^(1) = {i,o,u} then T = 1
+    ('m[iou]', 2),
+    # Rule 4: if ^(0) = {s} & ^(1) = {n} & ^(2) = {i,o,u} then T = 1
+    ('sn[iou]', 3),
+    # Rule 5: if ^(0) = {i} & ^(1) = {u,ü} & ^(2) = {q,g} then T = 0
+    ('i[uü][qg]', 1),
+    # Rule 6: if ^(0) = {s} & ^(1) = {i} & ^(2) = {u,ü} & ^(3) = {q,g}
+    # then T = 1
+    ('si[uü][qg]', 2),
+    # Rule 7: if ^(0) = {i,u} & ^(1) = {a,e,i,o,u} then T = 1
+    ('[iu][aeiou]', 2),
+    # if ^(0) = {i,u} & ^(1) != {a,e,i,o,u} then T = 0
+    ('[iu][^aeiou]', 1),
+    # Rule 8: if ^(0) = {s} & ^(1) = {i,u} & ^(2) = {a,e,i,o,u} then T = 2
+    ('s[iu][aeiou]', 3),
+    # Rule 9: if ^(0) = {s} & ^(1) = {i,u} & ^(2) != {a,e,i,o,u} then T = 2
+    ('s[iu][^aeiou]', 2),
+    # Rule 10: the word "porque", T = 0
+    ('euqrop$', 1),
+    # Rule 11: if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) = {a,e,i,o,u}
+    # then T = 3
+    ('eu[qg][aeiou]', 4),
+    # if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) != {a,e,i,o,u}
+    # then T = 4
+    ('eu[qg][^aeiou]', 5),
+    # Rule 12: if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)={aeiou}
+    # then T = 4
+    ('seu[qg][aeiou]', 5),
+    # if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)!={aeiou}
+    # then T = 5
+    ('seu[qg][^aeiou]', 6),
+    # Rule 13: if ^(0) = {a,e,i,o,u} & ^(2) = {i,u} & ^(3) = {a,e,i,o,u}
+    # then T = 2
+    ('[aeiou][iu][aeiou]', 3),
+    # Rule 14: if ^(0) & ^(3) = {a,e,i,o,u} & ^(2) = {i,u} &
+    # ^(1) != {a,e,i,o,u} & ^(4) != {q,g} then T = 3
+    ('[aeiou][^aeiou][iu][aeiou][^qg]', 4),
+    # Rule 15: if ^(0) = {s} & ^(1) & ^(4) = {a,e,i,o,u} & ^(3) = {i,u} &
+    # ^(2) != {a,e,i,o,u} & ^(5) != {q,g} then T = 4
+    ('s[aeiou][^aeiou][iu][aeiou][^qg]', 5),
+    # Rule 16: if ^(0) = {a,e,o} & ^(1) = cons & ^(2) = {n} & ^(3) = {i,u} &
+    # ^(4) = {a,e,i,o,u} then T = 3
+    ('[aeo][' + _consonants + ']n[iu][aeiou]', 4),
+]
+
+# All the suffix rules compiled in a single regular expression, with one
+# named group per rule. Since the alternatives are tried in order at the
+# beginning of the reversed word, the first rule that applies is the one
+# that matches, as if the rules were tested one by one.
+_suffix_engine = re.compile('|'.join('(?P<r%d>%s)' % (i, pattern)
+                                     for i, (pattern, _)
+                                     in enumerate(_suffix_rules)))
+_suffix_positions = dict(('r%d' % i, position)
+                         for i, (_, position) in enumerate(_suffix_rules))
+
+_vowels = frozenset('aeiou')
+
+
 def tonic_vowel(word):
     """Implements the tonic vowel finding algorithm presented in
     the third chapther of the PhD thesis:
@@ -33,105 +102,23 @@ def tonic_vowel(word):
         em HMM. PhD dissertation, COPPE, UFRJ.
     """
     # Regra 1: Se existe acento, a vogal marcada é tônica
-    match = re.search('á|é|í|ó|ú|â|ê|ô|à|ã|õ', word, re.UNICODE)
+    match = _accented_vowel.search(word)
     if match:
         return match.start()
 
     # TODO PALAVRA MARIOR A 2
 
-    # Rule 2: if ^(0) = {r,l,z,x,n} then T = 1
-    if re.search('[rlzxn]$', word, re.UNICODE):
-        return len(word) - 2
-
-    # Rule 3:
-    # if ^(0) = {m} & ^(1) = {i,o,u} then T = 1
-    if re.search('[iou]m$', word, re.UNICODE):
-        return len(word) - 2
-
-    # Rule 4:
-    # if ^(0) = {s} & ^(1) = {n} & ^(2) = {i,o,u} then T = 1
-    if re.search('[iou]ns$', word, re.UNICODE):
-        return len(word) - 3
-
-    # Rule 5:
-    # if ^(0) = {i} & ^(1) = {u,ü} & ^(2) = {q,g} then T = 0
-    if re.search('[qg][uü]i$', word, re.UNICODE):
-        return len(word) - 1
-
-    # Rule 6:
-    # if ^(0) = {s} & ^(1) = {i} & ^(2) = {u,ü} & ^(3) = {q,g} then T = 1
-    if re.search('[qg][uü]is$', word, re.UNICODE):
-        return len(word) - 2
-
-    # Rule 7:
-    # if ^(0) = {i,u} & ^(1) = {a,e,i,o,u} then T = 1
-    if re.search('[aeiou][iu]$', word, re.UNICODE):
-        return len(word) - 2
-    # if ^(0) = {i,u} & ^(1) != {a,e,i,o,u} then T = 0
-    if re.search('[^aeiou][iu]$', word, re.UNICODE):
-        return len(word) - 1
-
-    # Rule 8:
-    # if ^(0) = {s} & ^(1) = {i,u} & ^(2) = {a,e,i,o,u} then T = 2
-    if re.search('[aeiou][iu]s$', word, re.UNICODE):
-        return len(word) - 3
-
-    # Rule 9:
-    # if ^(0) = {s} & ^(1) = {i,u} & ^(2) != {a,e,i,o,u} then T = 2
-    if re.search('[^aeiou][iu]s$', word, re.UNICODE):
-        return len(word) - 2
-
-    # Rule 10:
-    # if ^(0) = {e} & ^(1) = {u} & ^(2) = {q} & ^(3) = {r} & ^(4) = {o} &
-    # ^(4) = {p} then T = 0
-    if word == "porque":
-        return len(word) - 1
-
-    # Rule 11
-    # if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) = {a,e,i,o,u} then T = 3
-    if re.search('[aeiou][qg]ue$', word, re.UNICODE):
-        return len(word) - 4
-    # if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) != {a,e,i,o,u} then T = 4
-    if re.search('[^aeiou][qg]ue$', word, re.UNICODE):
-        return len(word) - 5
-
-    # Rule 12
-    # if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)={aeiou} then T = 4
-    if re.search('[aeiou][qg]ues$', word, re.UNICODE):
-        return len(word) - 5
-    # if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)!={aeiou} then T = 5
-    if re.search('[^aeiou][qg]ues$', word, re.UNICODE):
-        return len(word) - 6
-
-    # Rule 13:
-    # if ^(0) = {a,e,i,o,u} & ^(2) = {i,u} & ^(3) = {a,e,i,o,u} then T = 2
-    if re.search('[aeiou][iu][aeiou]$', word, re.UNICODE):
-        return len(word) - 3
-
-    # Rule 14:
-    # if ^(0) & ^(3) = {a,e,i,o,u} & ^(2) = {i,u} & ^(1) != {a,e,i,o,u} &
-    # ^(4) != {q,g} then T = 3
-    if re.search('[^qg][aeiou][iu][^aeiou][aeiou]$', word, re.UNICODE):
-        return len(word) - 4
-
-    # Rule 15:
-    # if ^(0) = {s} & ^(1) & ^(4) = {a,e,i,o,u} & ^(3) = {i,u} &
-    # ^(2) != {a,e,i,o,u} & ^(5) != {q,g} then T = 4
-    if re.search('[^qg][aeiou][iu][^aeiou][aeiou]s$', word, re.UNICODE):
-        return len(word) - 5
+    # Rules 2 to 16, in a single right-to-left match.
+    match = _suffix_engine.match(word[::-1])
+    if match:
+        return len(word) - _suffix_positions[match.lastgroup]
 
-    # Rule 16:
-    # if ^(0) = {a,e,o} & ^(1) = cons & ^(2) = {n} & ^(3) = {i,u} &
-    # ^(4) = {a,e,i,o,u} then T = 3
-    consts = 'bdfghjklmnñpqrstvxyz'
-    if re.search('[aeiou][iu]n[' + consts + '][aeo]$', word, re.UNICODE):
-        return len(word) - 4
+    matches = [i for i, char in enumerate(word) if char in _vowels]
 
     # Rule 17:
-    matches = [m.start() for m in re.finditer('a|e|i|o|u', word, re.UNICODE)]
     if len(matches) >= 2:
         k = matches[-2]
-        v = ['a', 'e', 'i', 'o', 'u']
+        v = _vowels
         if word[k] in ['i', 'u'] and word[k - 1] in v and not word[k + 1] in v:
             if k - 2 < 0:
                 return 0
@@ -145,7 +132,6 @@ def tonic_vowel(word):
 
     # Rule 19:
     # Penultimate vowel of the word
-    matches = [m.start() for m in re.finditer('a|e|i|o|u', word, re.UNICODE)]
     if len(matches) >= 2:
         return matches[-2]
 
@@ -1,3 +1,4 @@
-from coh.tools.tag.api import Tagger, TagSet
+from coh.tools.tag.api import Tagger, TagSet, TaggedForms
 from coh.tools.tag.opennlp import OpenNLPTagger
+from coh.tools.tag.maxent import MaxentTagger
 from coh.tools.tag.macmorpho import MacMorphoTagSet
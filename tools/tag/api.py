@@ -57,6 +57,27 @@ class Tagger(object):
         """
         return [self.tag(sent) for sent in sentences]
 
+    def evaluate(self, reference):
+        """Measure the agreement of this tagger with reference tags (e.g.,
+            a gold-standard corpus, or the output of another tagger).
+
+        Required parameters:
+        reference -- A list of lists of pairs (string, string), one list of
+            each sentence.
+
+        Returns:
+        The fraction of tokens whose tag is the same as the reference's.
+        """
+        tagged = self.batch_tag([[word for word, _ in sentence]
+                                 for sentence in reference])
+        total = agreed = 0
+        for sentence, reference_sentence in zip(tagged, reference):
+            total += len(reference_sentence)
+            agreed += sum(1 for (_, tag), (_, reference_tag)
+                          in zip(sentence, reference_sentence)
+                          if tag == reference_tag)
+        return agreed / total if total else 1.0
+
 
 class TagSet(object):
     """Represents a set of tags used by a tagger. This class is entended to
@@ -86,6 +107,118 @@ class TagSet(object):
 
     punctuation_tags = []
 
+    def __init__(self):
+        self._compile()
+
+    def _compile(self):
+        """Compile the *_tags lists into a mapping from tags to integer ids
+            and, for each tag, a bitmask of the classes it belongs to.
+
+        Each non-empty *_tags list is a class, and gets its own bit; empty
+        lists get the mask 0. The masks of all tags are kept both in a list
+        indexed by tag id (self._masks_by_id) and in a dictionary indexed
+        by tag (self._masks), so that checking whether a tag belongs to a
+        class takes a single lookup and a bitwise and.
+        """
+        names = sorted(name for name in dir(self)
+                       if name.endswith('_tags')
+                       and isinstance(getattr(self, name), list))
+
+        self._class_bits = {}
+        self._tag_ids = {}
+        self._masks_by_id = []
+        for name in names:
+            tags = getattr(self, name)
+            bit = 1 << len(self._class_bits) if tags else 0
+            self._class_bits[name] = bit
+
+            for tag in tags:
+                if tag not in self._tag_ids:
+                    self._tag_ids[tag] = len(self._masks_by_id)
+                    self._masks_by_id.append(0)
+                self._masks_by_id[self._tag_ids[tag]] |= bit
+
+        self._masks = dict((tag, self._masks_by_id[tag_id])
+                           for tag, tag_id in self._tag_ids.items())
+
+    @property
+    def tag_ids(self):
+        """A dictionary mapping each tag in the *_tags lists to an integer
+            id.
+        """
+        if not hasattr(self, '_tag_ids'):
+            self._compile()
+        return self._tag_ids
+
+    def class_mask(self, name):
+        """Return the bit that represents a class of tags.
+
+        Required parameters:
+        name -- the name of a *_tags list (e.g., 'verb_tags').
+
+        Returns: an integer with a single bit set, or 0 if the list is empty.
+        """
+        if not hasattr(self, '_class_bits'):
+            self._compile()
+        return self._class_bits[name]
+
+    def tag_mask(self, tag):
+        """Return the bitmask of the classes a tag belongs to (0 for tags
+            that are in no list).
+
+        Required parameters:
+        tag -- a PoS tag.
+        """
+        if not hasattr(self, '_masks'):
+            self._compile()
+        return self._masks.get(tag, 0)
+
+    def mask_for_id(self, tag_id):
+        """Return the bitmask of the classes the tag with a given id (see
+            tag_ids) belongs to.
+
+        Required parameters:
+        tag_id -- an integer id.
+        """
+        if not hasattr(self, '_masks_by_id'):
+            self._compile()
+        return self._masks_by_id[tag_id]
+
+    def class_counts(self, histogram):
+        """Count the tokens of each class, given a histogram of tags.
+
+        Required parameters:
+        histogram -- a mapping from tags to token counts (see
+            Text.tag_histogram).
+
+        Returns: a dictionary mapping the name of each *_tags list to the
+            number of tokens whose tag is in it.
+        """
+        if not hasattr(self, '_class_bits'):
+            self._compile()
+
+        masks = [(self._masks.get(tag, 0), count)
+                 for tag, count in histogram.items()]
+        return dict((name, sum(count for mask, count in masks if mask & bit))
+                    for name, bit in self._class_bits.items())
+
+    def _in_class(self, token, name):
+        """Return true if the token's tag is in the class (a *_tags list),
+            and false otherwise.
+        """
+        try:
+            bit = self._class_bits[name]
+        except AttributeError:
+            self._compile()
+            return self._in_class(token, name)
+        except KeyError:
+            # Not a list defined by this tagset.
+            return self._is_in(token, getattr(self, name))
+
+        if not bit:
+            warnings.warn('Empty list')
+        return self._masks.get(token[1], 0) & bit != 0
+
     def _is_in(self, token, _list):
         """Return true if the token's tag is in the list, and false otherwise.
         """
@@ -93,13 +226,28 @@ class TagSet(object):
             warnings.warn('Empty list')
         return token[1] in _list
 
+    def count_tags(self, histogram, tags):
+        """Count the tokens whose tag is in a list, given a histogram of
+            tags.
+
+        Required parameters:
+        histogram -- a mapping from tags to token counts (see
+            Text.tag_histogram).
+        tags -- a list of tags (e.g., self.verb_tags).
+
+        Returns: the sum of the counts of the tags in the list.
+        """
+        if not tags:
+            warnings.warn('Empty list')
+        return sum(histogram.get(tag, 0) for tag in set(tags))
+
     def is_article(self, token):
         """Check if a token represents an article.
 
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.article_tags)
+        return self._in_class(token, 'article_tags')
 
     def is_verb(self, token):
         """Check if a token represents a verb.
@@ -107,7 +255,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.verb_tags)
+        return self._in_class(token, 'verb_tags')
 
     def is_auxiliary_verb(self, token):
         """Check if a token represents an auxiliary verb.
@@ -115,7 +263,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.auxiliary_verb_tags)
+        return self._in_class(token, 'auxiliary_verb_tags')
 
     def is_participle(self, token):
         """Check if a token represents a verb in the participle.
@@ -123,7 +271,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.participle_tags)
+        return self._in_class(token, 'participle_tags')
 
     def is_noun(self, token):
         """Check if a token represents a noun.
@@ -131,7 +279,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.noun_tags)
+        return self._in_class(token, 'noun_tags')
 
     def is_adjective(self, token):
         """Check if a token represents an adjective.
@@ -139,7 +287,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.adjective_tags)
+        return self._in_class(token, 'adjective_tags')
 
     def is_adverb(self, token):
         """Check if a token represents an adverb.
@@ -147,7 +295,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.adverb_tags)
+        return self._in_class(token, 'adverb_tags')
 
     def is_pronoun(self, token):
         """Check if a token represents a pronoun.
@@ -155,7 +303,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.pronoun_tags)
+        return self._in_class(token, 'pronoun_tags')
 
     def is_numeral(self, token):
         """Check if a token represents a numeral.
@@ -163,7 +311,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.numeral_tags)
+        return self._in_class(token, 'numeral_tags')
 
     def is_conjunction(self, token):
         """Check if a token represents a conjunction.
@@ -171,7 +319,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.conjunction_tags)
+        return self._in_class(token, 'conjunction_tags')
 
     def is_preposition(self, token):
         """Check if a token represents a preposition.
@@ -179,7 +327,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.preposition_tags)
+        return self._in_class(token, 'preposition_tags')
 
     def is_interjection(self, token):
         """Check if a token represents an interjection.
@@ -187,7 +335,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.interjection_tags)
+        return self._in_class(token, 'interjection_tags')
 
     def is_currency(self, token):
         """Check if a token represents a currency value.
@@ -195,7 +343,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.currency_tags)
+        return self._in_class(token, 'currency_tags')
 
     def is_content_word(self, token):
         """Check if a token represents a content word.
@@ -203,7 +351,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.content_word_tags)
+        return self._in_class(token, 'content_word_tags')
 
     def is_function_word(self, token):
         """Check if a token represents a function word.
@@ -211,7 +359,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.function_word_tags)
+        return self._in_class(token, 'function_word_tags')
 
     def functions_as_noun(self, token):
         """Check if a token represents a word that functions as a noun.
@@ -219,7 +367,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.functions_as_noun_tags)
+        return self._in_class(token, 'functions_as_noun_tags')
 
     def functions_as_adjective(self, token):
         """Check if a token represents a word that functions as an adjective.
@@ -227,7 +375,7 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.functions_as_adjective_tags)
+        return self._in_class(token, 'functions_as_adjective_tags')
 
     def is_punctuation(self, token):
         """Check if a token represents a punctuation mark.
@@ -235,4 +383,67 @@ class TagSet(object):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.punctuation_tags)
+        return self._in_class(token, 'punctuation_tags')
+
+
+class TaggedForms(object):
+    """A table of word forms that only count with tags of a given class
+    (e.g., "se" as a conjunction, and not as a pronoun).
+
+    For each tagset, the classes are compiled once into bitmasks (see
+    TagSet.class_mask), so checking a pair (word, tag) takes a dictionary
+    lookup and a bitwise and per entry of the word.
+    """
+    def __init__(self, entries):
+        """Form a table.
+
+        Required arguments:
+        entries -- an iterable of triples (form, tags, value), where form
+            is a lowercased word, tags is the name of a *_tags list of the
+            tagsets (or None, for any tag), and value is returned by get
+            for the pairs that match. A form may have several entries.
+            Classes that a tagset does not define, or that are empty, match
+            any tag.
+        """
+        self.entries = list(entries)
+        self._forms = frozenset(form for form, _, _ in self.entries)
+        self._compiled = {}
+
+    def _compile(self, tagset):
+        try:
+            return self._compiled[type(tagset)]
+        except KeyError:
+            pass
+
+        table = {}
+        for form, tags, value in self.entries:
+            mask = None
+            if tags is not None:
+                try:
+                    mask = tagset.class_mask(tags) or None
+                except KeyError:
+                    pass
+            table.setdefault(form, []).append((mask, value))
+        self._compiled[type(tagset)] = table
+        return table
+
+    def get(self, tagset, word, tag):
+        """Return the values of the entries that match a tagged word.
+
+        Required arguments:
+        tagset -- the TagSet of the tag.
+        word -- a word, in any case.
+        tag -- its tag.
+
+        Returns: a list of values, empty if the word is not in the table or
+            its tag is not in the class of any of its entries.
+        """
+        entries = self._compile(tagset).get(word.lower())
+        if entries is None:
+            return []
+        mask = tagset.tag_mask(tag)
+        return [value for entry_mask, value in entries
+                if entry_mask is None or mask & entry_mask]
+
+    def __contains__(self, word):
+        return word.lower() in self._forms
@@ -66,4 +66,4 @@ class MacMorphoTagSet(TagSet):
         Required parameters:
         token -- a tokenized word (a pair (string, string)).
         """
-        return self._is_in(token, self.denotative_word_tags)
+        return self._in_class(token, 'denotative_word_tags')
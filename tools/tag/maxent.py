@@ -0,0 +1,284 @@
+#-*- coding: utf-8 -*-
+# maxent.py - A PoS tagger that applies OpenNLP maxent models in Python.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from coh.tools.tag.api import Tagger
+from coh.tools.tag.macmorpho import MacMorphoTagSet
+from coh.utils import base_path
+from math import exp, log
+import re
+import struct
+import zipfile
+
+
+class GISModel(object):
+    """A maximum entropy model trained by OpenNLP with the GIS algorithm,
+    read from its binary format (opennlp.maxent.io.BinaryGISModelReader).
+
+    Each context predicate (feature) has a weight for some of the
+    outcomes; the probability of an outcome given a list of predicates is
+    proportional to the exponential of the sum of their weights.
+    """
+    def __init__(self, data):
+        """Form a model.
+
+        Required arguments:
+        data -- the content of a binary GIS model file (bytes).
+        """
+        self._data = data
+        self._offset = 0
+
+        model_type = self._read_utf()
+        if model_type != 'GIS':
+            raise ValueError('not a GIS model: %s' % model_type)
+
+        self.correction_constant = self._read_int()
+        self.correction_param = self._read_double()
+        self.outcomes = [self._read_utf() for _ in range(self._read_int())]
+        patterns = [[int(n) for n in self._read_utf().split()]
+                    for _ in range(self._read_int())]
+        predicates = [self._read_utf() for _ in range(self._read_int())]
+
+        # Each pattern is the number of predicates that have it, followed by
+        # the outcomes those predicates have weights for. The predicates are
+        # stored grouped by pattern, in order.
+        self.params = {}
+        predicate_iter = iter(predicates)
+        for pattern in patterns:
+            outcome_ids = tuple(pattern[1:])
+            for _ in range(pattern[0]):
+                self.params[next(predicate_iter)] = \
+                    (outcome_ids, self._read_doubles(len(outcome_ids)))
+
+        del self._data
+
+    @classmethod
+    def from_opennlp_model(cls, path, member='pos.model'):
+        """Read the GIS model stored in an OpenNLP model package (a zip
+            file, such as pt-pos-maxent.bin).
+        """
+        with zipfile.ZipFile(path) as package:
+            return cls(package.read(member))
+
+    def _read_int(self):
+        value, = struct.unpack_from('>i', self._data, self._offset)
+        self._offset += 4
+        return value
+
+    def _read_double(self):
+        value, = struct.unpack_from('>d', self._data, self._offset)
+        self._offset += 8
+        return value
+
+    def _read_doubles(self, n):
+        values = struct.unpack_from('>%dd' % n, self._data, self._offset)
+        self._offset += 8 * n
+        return values
+
+    def _read_utf(self):
+        # Java's DataOutput.writeUTF: a 2-byte length followed by modified
+        # UTF-8, which encodes NUL as two bytes and the characters outside
+        # the BMP as surrogate pairs.
+        length, = struct.unpack_from('>H', self._data, self._offset)
+        start = self._offset + 2
+        self._offset = start + length
+        raw = self._data[start:self._offset].replace(b'\xc0\x80', b'\x00')
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            return raw.decode('utf-8', 'surrogatepass')\
+                .encode('utf-16', 'surrogatepass').decode('utf-16')
+
+    def sums(self, context, sums=None, counts=None):
+        """Add the weights of the predicates in a context to the sum of
+            each outcome. Repeated predicates are counted once for each
+            occurrence; unknown predicates are ignored.
+
+        Required arguments:
+        context -- a list of predicates (strings).
+
+        Keyword arguments:
+        sums -- a list with a partial sum for each outcome. If None, the
+            sums start from zero. (default None)
+        counts -- a list with the number of active predicates of each
+            outcome, updated in the same way. If None, a new one is made.
+            (default None)
+
+        Returns: a pair of lists (sums, counts).
+        """
+        if sums is None:
+            sums = [0.0] * len(self.outcomes)
+            counts = [0] * len(self.outcomes)
+
+        params = self.params
+        for predicate in context:
+            try:
+                outcome_ids, weights = params[predicate]
+            except KeyError:
+                continue
+            for outcome_id, weight in zip(outcome_ids, weights):
+                sums[outcome_id] += weight
+                counts[outcome_id] += 1
+
+        return sums, counts
+
+    def probabilities(self, sums, counts):
+        """Turn the sums of weights of each outcome into probabilities, as
+            opennlp.maxent.GISModel.eval does.
+        """
+        inverse = 1.0 / self.correction_constant
+        if self.correction_param:
+            scores = [s * inverse + (1.0 - c * inverse) * self.correction_param
+                      for s, c in zip(sums, counts)]
+        else:
+            scores = [s * inverse for s in sums]
+
+        # Subtracting the maximum does not change the normalized values, and
+        # avoids overflows.
+        highest = max(scores)
+        scores = [exp(s - highest) for s in scores]
+        total = sum(scores)
+        return [s / total for s in scores]
+
+    def eval(self, context):
+        """Return the probability of each outcome (in the order of
+            self.outcomes) given a list of predicates.
+        """
+        return self.probabilities(*self.sums(context))
+
+
+_has_cap = re.compile('[A-Z]')
+_has_num = re.compile('[0-9]')
+
+
+def _word_context(tokens, i):
+    """Return the predicates of the i-th token that do not depend on the
+        tags of the previous tokens, as generated by
+        opennlp.tools.postag.DefaultPOSContextGenerator (with no tag
+        dictionary).
+    """
+    lex = tokens[i]
+    context = ['default', 'w=' + lex]
+    context.extend('suf=' + lex[max(len(lex) - n, 0):] for n in range(1, 5))
+    context.extend('pre=' + lex[:n] for n in range(1, 5))
+    if '-' in lex:
+        context.append('h')
+    if _has_cap.search(lex):
+        context.append('c')
+    if _has_num.search(lex):
+        context.append('d')
+
+    if i >= 1:
+        context.append('p=' + tokens[i - 1])
+        context.append('pp=' + (tokens[i - 2] if i >= 2 else '*SB*'))
+    else:
+        context.append('p=*SB*')
+
+    if i + 1 < len(tokens):
+        context.append('n=' + tokens[i + 1])
+        context.append('nn=' + (tokens[i + 2] if i + 2 < len(tokens)
+                                else '*SE*'))
+    else:
+        context.append('n=*SE*')
+
+    return context
+
+
+def _tag_context(tags):
+    """Return the predicates of a token that depend on the tags of the
+        previous tokens.
+    """
+    if not tags:
+        return []
+    if len(tags) == 1:
+        return ['t=' + tags[-1]]
+    return ['t=' + tags[-1], 't2=' + tags[-2] + ',' + tags[-1]]
+
+
+class MaxentTagger(Tagger):
+    """A tagger that applies an OpenNLP maxent PoS model (by default,
+    models/opennlp/pt-pos-maxent.bin, trained on the MacMorpho corpus)
+    without running Java.
+
+    Features are generated as by OpenNLP's DefaultPOSContextGenerator, and
+    the best sequence of tags is found by a beam search, as in
+    POSTaggerME. The predicates that do not depend on previous tags are
+    scored once per token, and not once per hypothesis in the beam.
+
+    It is not a drop-in replacement for OpenNLPTagger: its agreement with
+    OpenNLP on the same model has not been measured (test/bench.py
+    --agreement taggers measures it where Java and OpenNLP are available),
+    and its tags may differ in cases of ties or rounding. It can be used
+    in the metrics with:
+
+        registry.register('pos_tagger', MaxentTagger,
+                          files=[base_path +
+                                 '/models/opennlp/pt-pos-maxent.bin'])
+
+    or, with another model:
+
+        registry.register('pos_tagger', functools.partial(MaxentTagger,
+                                                          'other-model.bin'),
+                          files=['other-model.bin'])
+    """
+    def __init__(self, model=None, beam_size=3):
+        """Form a tagger. The model is read when the tagger is formed.
+
+        Keyword arguments:
+        model -- the path to the OpenNLP PoS model. If None, the MacMorpho
+            model is used. (default None)
+        beam_size -- the number of hypotheses kept at each token
+            (default 3, as in OpenNLP).
+        """
+        if model is None:
+            model = base_path + '/models/opennlp/pt-pos-maxent.bin'
+
+        self.model = GISModel.from_opennlp_model(model)
+        self.beam_size = beam_size
+        self.tagset = MacMorphoTagSet()
+
+    def tag(self, tokens):
+        if not tokens:
+            return []
+
+        # As in OpenNLPWorker, whitespace inside a token is replaced by an
+        # underscore.
+        words = ['_'.join(token.split()) for token in tokens]
+        model = self.model
+        outcomes = model.outcomes
+        beam_size = self.beam_size
+        threshold_index = max(len(outcomes) - beam_size, 0)
+
+        # Each hypothesis is a pair (log probability, tags).
+        beam = [(0.0, ())]
+        for i in range(len(words)):
+            word_sums, word_counts = model.sums(_word_context(words, i))
+
+            candidates = []
+            for score, tags in beam:
+                sums, counts = model.sums(_tag_context(tags),
+                                          list(word_sums), list(word_counts))
+                probabilities = model.probabilities(sums, counts)
+                threshold = sorted(probabilities)[threshold_index]
+                for outcome_id, p in enumerate(probabilities):
+                    if p >= threshold and p > 0.0:
+                        candidates.append((score + log(p),
+                                           tags + (outcomes[outcome_id],)))
+
+            # sort is stable, so on ties the earlier candidates are kept.
+            candidates.sort(key=lambda candidate: -candidate[0])
+            beam = candidates[:beam_size]
+
+        return list(zip(tokens, beam[0][1]))
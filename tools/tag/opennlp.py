@@ -18,22 +18,208 @@
 from coh.tools.tag.api import Tagger
 from coh.tools.tag.macmorpho import MacMorphoTagSet
 from coh.utils import base_path
-from nltk.tag import OpenNLPPoSTagger
+import os
+import queue
+import subprocess
+import weakref
+
+# The workers whose OpenNLP process is running, so that forked processes
+# can close the pipes they inherit (see _close_inherited_pipes).
+_running_workers = weakref.WeakSet()
+
+
+def _close_inherited_pipes():
+    """Close, in a forked process (e.g., a worker of
+        MetricsSet.values_for_corpus), the pipes to the OpenNLP processes of
+        its parent, so that these processes see the end of their input when
+        the parent closes them or exits, and not when its last child does.
+    """
+    for worker in list(_running_workers):
+        worker._release()
+    _running_workers.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_close_inherited_pipes)
+
+
+class OpenNLPWorker(object):
+    """Represents a long-lived OpenNLP POSTagger process.
+
+    The model is loaded once, when the process starts, and sentences are
+    then tagged through a line protocol: one whitespace-separated sentence
+    is written to the process' stdin, and one line of word_TAG pairs is
+    read back from its stdout. If the process dies, it is restarted on the
+    next request.
+    """
+    def __init__(self, path, model, encoding='utf-8'):
+        """Form a worker. The process is only started when needed.
+
+        Required arguments:
+        path -- the path to OpenNLP's launcher script.
+        model -- the path to the PoS tagging model.
+
+        Keyword arguments:
+        encoding -- the encoding used to talk to the process
+            (default "utf-8").
+        """
+        self.path = path
+        self.model = model
+        self.encoding = encoding
+        self._process = None
+        self._owner = None
+
+    def start(self):
+        """Start the OpenNLP process, if it is not running already.
+        """
+        if self.is_alive():
+            return
+
+        if self._owner != os.getpid():
+            # A process inherited from the parent of a forked process (e.g.,
+            # a worker of MetricsSet.values_for_corpus) is still used by the
+            # parent, so it is left alone.
+            self._release()
+
+        env = dict(os.environ)
+        env['JAVA_TOOL_OPTIONS'] = (env.get('JAVA_TOOL_OPTIONS', '') +
+                                    ' -Dfile.encoding=' + self.encoding)
+        self._process = subprocess.Popen([self.path, 'POSTagger', self.model],
+                                         stdin=subprocess.PIPE,
+                                         stdout=subprocess.PIPE,
+                                         stderr=subprocess.DEVNULL,
+                                         env=env)
+        self._owner = os.getpid()
+        _running_workers.add(self)
+
+    def close(self):
+        """Stop the OpenNLP process.
+        """
+        if self._process is None or self._owner != os.getpid():
+            self._release()
+            return
+
+        _running_workers.discard(self)
+        try:
+            self._process.stdin.close()
+            self._process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+            self._process.wait()
+        finally:
+            self._process.stdout.close()
+            self._process = None
+
+    def _release(self):
+        """Forget the OpenNLP process of another process (the parent of a
+            forked one), closing the pipes to it without stopping it.
+        """
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        # The raw files are closed, and not the buffered ones, so that
+        # nothing left in their buffers by the parent is written again.
+        for pipe in (process.stdin, process.stdout):
+            try:
+                pipe.raw.close()
+            except OSError:
+                pass
+
+    def is_alive(self):
+        """Return true if the OpenNLP process is running.
+        """
+        return self._process is not None\
+            and self._owner == os.getpid()\
+            and self._process.poll() is None
+
+    def tag(self, tokens):
+        """Assign a part-of-speech tag to a tokenized sentence, restarting
+            the process once if it has died.
+
+        Required parameters:
+        tokens -- a list of strings, containing the tokens to be analyzed.
+
+        Returns:
+        A list of pairs (string, string), where the first string is the token
+            and the second one is the corresponding PoS tag.
+        """
+        if not tokens:
+            return []
+
+        try:
+            return self._tag(tokens)
+        except (OSError, EOFError):
+            self.close()
+            return self._tag(tokens)
+
+    def _tag(self, tokens):
+        self.start()
+
+        # OpenNLP splits its input on whitespace, so whitespace inside a
+        # token would shift the tags of every token after it, and an empty
+        # (or all whitespace) token would be lost; it is sent as '_'.
+        line = ' '.join('_'.join(token.split()) or '_'
+                        for token in tokens) + '\n'
+        self._process.stdin.write(line.encode(self.encoding))
+        self._process.stdin.flush()
+
+        output = self._process.stdout.readline()
+        if not output:
+            raise EOFError('OpenNLP process exited unexpectedly')
+
+        tags = [pair.rsplit('_', 1)[1]
+                for pair in output.decode(self.encoding).split()]
+        if len(tags) != len(tokens):
+            raise RuntimeError('OpenNLP returned %d tags for %d tokens'
+                               % (len(tags), len(tokens)))
+
+        return list(zip(tokens, tags))
 
 
 class OpenNLPTagger(Tagger):
     """Represents an OpenNLP tagger trained on the MacMorpho corpus.
+
+    Tagging is done by a pool of long-lived OpenNLPWorker processes, so the
+    JVM is started and the model is loaded only once per worker, and not
+    once per text.
     """
-    def __init__(self):
-        self._pos_tagger = OpenNLPPoSTagger(
-            path=base_path + '/vendor/apache-opennlp-1.5.3/bin/opennlp',
-            model=base_path + '/models/opennlp/pt-pos-maxent.bin',
-            encoding='utf-8')
+    def __init__(self, workers=1):
+        """Form a tagger.
+
+        Keyword arguments:
+        workers -- the maximum number of OpenNLP processes used to tag
+            texts concurrently (e.g., from multiple threads). The processes
+            are only started when needed. (default 1)
+        """
+        self._workers = queue.Queue()
+        for _ in range(workers):
+            self._workers.put(OpenNLPWorker(
+                path=base_path + '/vendor/apache-opennlp-1.5.3/bin/opennlp',
+                model=base_path + '/models/opennlp/pt-pos-maxent.bin',
+                encoding='utf-8'))
 
         self.tagset = MacMorphoTagSet()
 
     def tag(self, tokens):
-        return self._pos_tagger.tag(tokens)
+        return self.batch_tag([tokens])[0]
 
     def batch_tag(self, sentences):
-        return self._pos_tagger.batch_tag(sentences)
+        worker = self._workers.get()
+        try:
+            return [worker.tag(sentence) for sentence in sentences]
+        finally:
+            self._workers.put(worker)
+
+    def warmup(self):
+        """Start all the OpenNLP processes now, instead of on first use.
+        """
+        for worker in list(self._workers.queue):
+            worker.start()
+
+    def close(self):
+        """Stop all the OpenNLP processes. They are started again if the
+            tagger is used afterwards.
+        """
+        for worker in list(self._workers.queue):
+            worker.close()
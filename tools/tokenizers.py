@@ -1,9 +1,154 @@
-import nltk
-from nltk.data import load
-from nltk.tag import OpenNLPPoSTagger
+from coh.tools.registry import registry, LazyModel
 from coh.utils import base_path
+import re
 
-#senter = load(base_path + '/models/punkt/punkt-senter.pickle')
-senter = load('tokenizers/punkt/portuguese.pickle')
 
-word_tokenize = nltk.word_tokenize
+class PortugueseWordTokenizer(object):
+    """A word tokenizer for Brazilian Portuguese sentences, that follows
+    the conventions of the MacMorpho corpus (on which the tagger was
+    trained):
+
+        * Contractions of prepositions ("do", "na", "àquele") are kept;
+          elided ones are split after the apostrophe ("d'" "água").
+        * Enclitic and mesoclitic pronouns are split, keeping the hyphen in
+          the previous token ("tornou-" "se", "dar-" "se-" "ia"). Other
+          hyphenated words are kept ("guarda-chuva", "dia-a-dia").
+        * Abbreviations keep their period, except at the end of the
+          sentence ("Sr." "Silva", "... etc" ".").
+        * Numbers ("1.000", "3,5"), currency symbols ("R$"), URLs and
+          e-mail addresses are single tokens; other punctuation marks
+          (including "«", "»", "“", "”" and "—") are tokens of their own,
+          except for "..." and "--".
+
+    All patterns are compiled once. Besides tokenize, the positions of
+    the tokens can be generated with span_tokenize and, for many sentences,
+    span_tokenize_sents.
+    """
+    _token = re.compile(r"""
+        (?P<url>(?:https?://|www\.)[^\s"<>«»“”]*[^\s"<>«»“”.,;:!?)\]])
+      | (?P<email>[\w.+-]+@\w+(?:[.-]\w+)+)
+      | (?P<currency>[A-Z]{0,3}\$)
+      | (?P<number>\d+(?:[.,]\d+)+)
+      | (?P<word>\w+(?:[-'’.]\w+)*
+          # A period is kept unless it ends the sentence (possibly followed
+          # by closing quotes and brackets).
+          (?:\.(?![.\w])(?![\])}>"'»”’]*\s*$)
+          # So is a hyphen before a space (e.g., "ex-" "ministro").
+          | -(?=\s|$))?)
+      | (?P<punctuation>\.\.\.|--|[^\w\s])
+    """, re.VERBOSE)
+
+    _clitics = frozenset(['me', 'te', 'se', 'nos', 'vos', 'lhe', 'lhes',
+                          'o', 'a', 'os', 'as', 'lo', 'la', 'los', 'las',
+                          'no', 'na', 'nas'])
+
+    # Clitics that are also words inside compounds ("dia-a-dia"): they are
+    # only split at the end of a word.
+    _final_clitics = frozenset(['o', 'a', 'os', 'as'])
+
+    _elisions = frozenset(['d', 'sant', 'l'])
+
+    def span_tokenize(self, sentence):
+        """Iterate over the positions of the tokens of a sentence.
+
+        Required arguments:
+        sentence -- a string.
+
+        Returns: an iterator of pairs (start, end), such that
+            sentence[start:end] is a token.
+        """
+        for match in self._token.finditer(sentence):
+            start, end = match.span()
+            if match.lastgroup != 'word':
+                yield start, end
+                continue
+
+            word = match.group()
+            if '-' in word:
+                yield from self._split_clitics(word, start)
+            elif "'" in word or '’' in word:
+                yield from self._split_elision(word, start)
+            else:
+                yield start, end
+
+    def _split_clitics(self, word, start):
+        parts = word.split('-')
+        last = len(parts) - 1
+        begin = position = start
+        split_previous = False
+        for k, part in enumerate(parts[:last]):
+            position += len(part) + 1
+            following = parts[k + 1].lower()
+            if not part or not following:
+                split_previous = False
+                continue
+
+            is_clitic = following in self._clitics and\
+                (k + 1 == last or following not in self._final_clitics)
+            # In a mesoclisis ("dar-se-ia"), the verb ending after the
+            # clitic is split, too.
+            if is_clitic or split_previous:
+                yield begin, position
+                begin = position
+            split_previous = is_clitic
+
+        yield begin, start + len(word)
+
+    def _split_elision(self, word, start):
+        apostrophe = min(i for i in (word.find("'"), word.find('’'))
+                         if i >= 0)
+        if word[:apostrophe].lower() in self._elisions:
+            yield start, start + apostrophe + 1
+            start += apostrophe + 1
+            word = word[apostrophe + 1:]
+        yield start, start + len(word)
+
+    def tokenize(self, sentence):
+        """Split a sentence in tokens.
+
+        Required arguments:
+        sentence -- a string.
+
+        Returns: a list of strings.
+        """
+        return [sentence[start:end]
+                for start, end in self.span_tokenize(sentence)]
+
+    def span_tokenize_sents(self, sentences):
+        """Iterate over the positions of the tokens of many sentences.
+
+        Required arguments:
+        sentences -- an iterable of strings.
+
+        Returns: an iterator of lists of pairs (start, end), one list for
+            each sentence.
+        """
+        for sentence in sentences:
+            yield list(self.span_tokenize(sentence))
+
+    def tokenize_sents(self, sentences):
+        """Iterate over the tokens of many sentences.
+
+        Required arguments:
+        sentences -- an iterable of strings.
+
+        Returns: an iterator of lists of strings, one list for each
+            sentence.
+        """
+        for sentence in sentences:
+            yield self.tokenize(sentence)
+
+    __call__ = tokenize
+
+
+def _load_senter():
+    from nltk.data import load
+    #return load(base_path + '/models/punkt/punkt-senter.pickle')
+    return load('tokenizers/punkt/portuguese.pickle')
+
+
+registry.register('senter', _load_senter)
+registry.register('word_tokenizer', PortugueseWordTokenizer)
+
+senter = LazyModel('senter')
+word_tokenize = LazyModel('word_tokenizer')
@@ -0,0 +1,217 @@
+#-*- coding: utf-8 -*-
+# wordnet.py - Indices of word properties derived from a wordnet.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Build, offline, the indices used by the metrics that depend on a
+wordnet, so that the taxonomy is never walked while analyzing texts.
+
+The Portuguese words are read from a file in the format of the Open
+Multilingual Wordnet (e.g., wn-data-por.tab, from OpenWordnet-PT): one
+tab-separated line per word, with the synset (e.g., "02084071-n"), the
+relation (e.g., "por:lemma") and the word. The hypernyms of the synsets
+are read from a tab-separated file with one line per pair (synset,
+hypernym), or, if it is not given, from NLTK's copy of the Princeton
+WordNet 3.0, whose synsets the Open Multilingual Wordnet shares.
+
+Indices are stored as Lexicon files, keyed by the lowercased word and its
+part of speech ("n", "v", "a" or "r"), separated by a tab.
+"""
+
+from collections import defaultdict
+from coh.tools.lexicon import Lexicon
+from coh.tools.registry import registry, LazyModel
+from coh.utils import base_path
+import codecs
+
+
+def index_key(word, pos):
+    """Return the key of a word with a part of speech ("n", "v", "a" or
+        "r") in the indices of this module.
+    """
+    return word.lower() + '\t' + pos
+
+
+def read_omw(path, encoding='utf-8'):
+    """Iterate over the words of a file in the format of the Open
+        Multilingual Wordnet.
+
+    Returns: an iterator of pairs (synset, word).
+    """
+    with codecs.open(path, encoding=encoding) as input_file:
+        for line in input_file:
+            if line.startswith('#'):
+                continue
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) >= 3 and fields[1].endswith(':lemma'):
+                yield fields[0], fields[2].replace('_', ' ')
+
+
+def read_hypernyms(path, encoding='utf-8'):
+    """Iterate over the pairs (synset, hypernym) of a tab-separated file.
+    """
+    with codecs.open(path, encoding=encoding) as input_file:
+        for line in input_file:
+            fields = line.split()
+            if len(fields) == 2:
+                yield fields[0], fields[1]
+
+
+def nltk_hypernyms():
+    """Iterate over the pairs (synset, hypernym) of the nouns and verbs of
+        NLTK's Princeton WordNet, with synsets named as in the Open
+        Multilingual Wordnet. NLTK and its wordnet corpus must be
+        installed.
+    """
+    from nltk.corpus import wordnet
+
+    def name(synset):
+        return '%08d-%s' % (synset.offset(), synset.pos())
+
+    for pos in ('n', 'v'):
+        for synset in wordnet.all_synsets(pos):
+            for hypernym in synset.hypernyms() + synset.instance_hypernyms():
+                yield name(synset), name(hypernym)
+
+
+def synset_depths(synsets, hypernyms):
+    """Return the depth of each synset in the taxonomy: the length of the
+        shortest path to a synset without hypernyms.
+
+    Required arguments:
+    synsets -- an iterable of synset names.
+    hypernyms -- an iterable of pairs (synset, hypernym).
+
+    Returns: a dictionary that maps each synset to its depth.
+    """
+    parents = defaultdict(list)
+    for synset, hypernym in hypernyms:
+        parents[synset].append(hypernym)
+
+    depths = {}
+    for synset in synsets:
+        # An iterative depth-first search, so deep taxonomies do not reach
+        # the recursion limit. Synsets in a cycle count as roots.
+        stack = [synset]
+        visiting = set()
+        while stack:
+            current = stack[-1]
+            if current in depths:
+                stack.pop()
+                continue
+            pending = [p for p in parents.get(current, ())
+                       if p not in depths and p not in visiting]
+            if pending:
+                visiting.add(current)
+                stack.extend(pending)
+                continue
+            known = [depths[p] for p in parents.get(current, ())
+                     if p in depths]
+            depths[current] = 1 + min(known) if known else 0
+            visiting.discard(current)
+            stack.pop()
+    return depths
+
+
+def build_hypernym_index(omw_path, path, hypernyms_path=None,
+                         encoding='utf-8'):
+    """Build the index of the hypernym depths of the nouns and verbs of a
+        wordnet. The values of each word are the minimum and the mean
+        depth of its synsets.
+
+    Required arguments:
+    omw_path -- the path to the words, in the Open Multilingual Wordnet
+        format.
+    path -- the path to the index (a Lexicon file).
+
+    Keyword arguments:
+    hypernyms_path -- the path to the pairs (synset, hypernym). If None,
+        NLTK's Princeton WordNet is used. (default None)
+    encoding -- the encoding of the input files (default "utf-8").
+    """
+    words = defaultdict(list)
+    for synset, word in read_omw(omw_path, encoding):
+        pos = synset[-1]
+        if pos in ('n', 'v'):
+            words[index_key(word, pos)].append(synset)
+
+    if hypernyms_path is None:
+        hypernyms = nltk_hypernyms()
+    else:
+        hypernyms = read_hypernyms(hypernyms_path, encoding)
+
+    synsets = set(s for word_synsets in words.values() for s in word_synsets)
+    depths = synset_depths(synsets, hypernyms)
+
+    def entries():
+        for key, word_synsets in words.items():
+            values = [depths[s] for s in word_synsets]
+            yield key, (min(values), sum(values) / len(values))
+
+    Lexicon.build(path, entries(), ncolumns=2)
+
+
+def build_sense_index(omw_path, path, encoding='utf-8'):
+    """Build the index of the number of senses (synsets) of the nouns,
+        verbs, adjectives and adverbs of a wordnet. Satellite adjectives
+        ("s") count as adjectives.
+
+    Required arguments:
+    omw_path -- the path to the words, in the Open Multilingual Wordnet
+        format.
+    path -- the path to the index (a Lexicon file).
+
+    Keyword arguments:
+    encoding -- the encoding of the input file (default "utf-8").
+    """
+    senses = defaultdict(set)
+    for synset, word in read_omw(omw_path, encoding):
+        pos = synset[-1]
+        if pos == 's':
+            pos = 'a'
+        if pos in ('n', 'v', 'a', 'r'):
+            senses[index_key(word, pos)].add(synset)
+
+    Lexicon.build(path, ((key, len(synsets))
+                         for key, synsets in senses.items()))
+
+
+_HYPERNYM_INDEX_PATH = base_path + '/models/lexicons/hypernyms.lex'
+
+
+def _load_hypernym_index():
+    return Lexicon(_HYPERNYM_INDEX_PATH)
+
+
+registry.register('hypernym_index', _load_hypernym_index,
+                  identity='coh.tools.lexicon.Lexicon '
+                  'models/lexicons/hypernyms.lex',
+                  files=[_HYPERNYM_INDEX_PATH])
+
+hypernym_index = LazyModel('hypernym_index')
+
+
+_SENSE_INDEX_PATH = base_path + '/models/lexicons/senses.lex'
+
+
+def _load_sense_index():
+    return Lexicon(_SENSE_INDEX_PATH)
+
+
+registry.register('sense_index', _load_sense_index,
+                  identity='coh.tools.lexicon.Lexicon '
+                  'models/lexicons/senses.lex',
+                  files=[_SENSE_INDEX_PATH])
+
+sense_index = LazyModel('sense_index')
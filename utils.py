@@ -1,3 +1,4 @@
+from collections.abc import Sized
 from os.path import dirname, abspath
 from sys import modules
 
@@ -8,7 +9,7 @@ base_path = abspath(dirname(modules[__name__].__file__))
 def ilen(it):
     """Calculate the number of elements in an iterable.
     """
-    if isinstance(it, list) or isinstance(it, tuple):
+    if isinstance(it, Sized):
         return len(it)
 
     count = 0